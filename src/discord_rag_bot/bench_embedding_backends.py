@@ -0,0 +1,55 @@
+"""
+Benchmark embedding backends: torch vs ONNX vs int8-quantized ONNX
+"""
+
+import time
+from discord_rag_bot.embeddings.backends import BACKENDS, load_model, check_parity
+from discord_rag_bot.utils.config import Config
+
+NUM_CHUNKS = 2000
+BATCH_SIZE = 64
+
+print("\n" + "="*70)
+print("⏱️ BENCHMARKING EMBEDDING BACKENDS")
+print("="*70 + "\n")
+
+# Synthetic chunks of roughly CHUNK_SIZE characters
+base = (
+    "Retrieval-augmented generation retrieves relevant passages from a knowledge base "
+    "and passes them to a language model as context for the answer. "
+)
+chunks = [f"Chunk {i}: " + (base * 4)[:Config.CHUNK_SIZE] for i in range(NUM_CHUNKS)]
+
+print(f"📊 Model: {Config.EMBEDDING_MODEL}")
+print(f"📦 Chunks: {NUM_CHUNKS} x ~{Config.CHUNK_SIZE} chars, batch size {BATCH_SIZE}\n")
+
+reference = load_model(Config.EMBEDDING_MODEL, 'torch')
+results = {}
+
+for backend in BACKENDS:
+    print(f"▶️ {backend}")
+    try:
+        model = reference if backend == 'torch' else load_model(Config.EMBEDDING_MODEL, backend)
+    except Exception as e:
+        print(f"   ❌ Could not load backend: {e}\n")
+        continue
+
+    # Warm-up run so one-off graph/session setup is not timed
+    model.encode(chunks[:BATCH_SIZE], batch_size=BATCH_SIZE, show_progress_bar=False)
+
+    start = time.perf_counter()
+    model.encode(chunks, batch_size=BATCH_SIZE, show_progress_bar=False)
+    elapsed = time.perf_counter() - start
+
+    min_cosine = check_parity(model, reference)
+    results[backend] = NUM_CHUNKS / elapsed
+    status = "✅" if min_cosine >= Config.EMBEDDING_PARITY_MIN_COSINE else "❌"
+
+    print(f"   ⚡ {results[backend]:.1f} chunks/sec ({elapsed:.2f}s)")
+    print(f"   {status} Min cosine vs torch: {min_cosine:.4f}\n")
+
+print("="*70)
+if 'torch' in results:
+    for backend, throughput in results.items():
+        print(f"   {backend:<10} {throughput:>8.1f} chunks/sec  ({throughput / results['torch']:.2f}x torch)")
+print("="*70)
@@ -0,0 +1,97 @@
+"""
+Sweep Chroma HNSW parameters and print recall@k against query latency
+
+Usage: python -m discord_rag_bot.bench_hnsw_sweep [kb_id]
+With a KB ID, its stored vectors are indexed; otherwise synthetic clustered vectors are used.
+Queries are stored vectors with a little noise; ground truth is exact search.
+"""
+
+import sys
+import time
+import chromadb
+import numpy as np
+from discord_rag_bot.storage.chroma_client import collection_cache
+from discord_rag_bot.storage.backends.chroma_backend import hnsw_configuration
+
+M_VALUES = (8, 16, 32, 48)
+EF_CONSTRUCTION_VALUES = (100, 200, 400)
+EF_SEARCH_VALUES = (16, 32, 64, 128, 256)
+NUM_QUERIES = 200
+TOP_K = 10
+SYNTHETIC_CHUNKS = 50_000
+DIMENSION = 384
+
+
+def load_vectors(kb_id: str = None) -> np.ndarray:
+    """Stored vectors of a KB, or a synthetic clustered set"""
+    if kb_id:
+        result = collection_cache.get(kb_id).get(include=['embeddings'])
+        return np.asarray(result['embeddings'], dtype=np.float32)
+
+    rng = np.random.default_rng(0)
+    centres = rng.standard_normal((500, DIMENSION), dtype=np.float32)
+    vectors = centres[rng.integers(0, 500, SYNTHETIC_CHUNKS)]
+    vectors += 0.5 * rng.standard_normal(vectors.shape, dtype=np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def main():
+    kb_id = sys.argv[1] if len(sys.argv) > 1 else None
+    vectors = load_vectors(kb_id)
+
+    print("\n" + "="*70)
+    print(f"🕸️ HNSW SWEEP ({kb_id or 'synthetic'}: {len(vectors):,} × {vectors.shape[1]}-d, recall@{TOP_K})")
+    print("="*70 + "\n")
+
+    rng = np.random.default_rng(1)
+    queries = vectors[rng.choice(len(vectors), min(NUM_QUERIES, len(vectors)), replace=False)]
+    queries = queries + rng.normal(0, queries.std() * 0.1, queries.shape).astype(np.float32)
+
+    # Exact squared-L2 neighbours
+    norms = np.einsum('ij,ij->i', vectors, vectors)
+    truth = [set(np.argpartition(norms - 2 * (vectors @ q), TOP_K - 1)[:TOP_K].tolist()) for q in queries]
+
+    auto = hnsw_configuration(len(vectors))["hnsw"]
+    print(f"   Auto-sized: M={auto['max_neighbors']} ef_construction={auto['ef_construction']} ef_search={auto['ef_search']}\n")
+
+    client = chromadb.EphemeralClient()
+    ids = [str(i) for i in range(len(vectors))]
+    batch = 5000  # Stay under Chroma's max batch size
+
+    print(f"   {'M':>3} {'ef_c':>5} {'ef_s':>5} {'build':>8} {'recall':>7} {'p50':>9} {'p95':>9}")
+    for m in M_VALUES:
+        for ef_construction in EF_CONSTRUCTION_VALUES:
+            name = f"hnsw_sweep_{m}_{ef_construction}"
+            collection = client.create_collection(name=name, configuration={
+                "hnsw": {"space": "l2", "max_neighbors": m, "ef_construction": ef_construction}
+            })
+
+            start = time.perf_counter()
+            for offset in range(0, len(vectors), batch):
+                collection.add(ids=ids[offset:offset + batch], embeddings=vectors[offset:offset + batch])
+            build = time.perf_counter() - start
+
+            for ef_search in EF_SEARCH_VALUES:
+                collection.modify(configuration={"hnsw": {"ef_search": ef_search}})
+
+                latencies, recall = [], 0.0
+                for query, expected in zip(queries, truth):
+                    start = time.perf_counter()
+                    result = collection.query(query_embeddings=query.reshape(1, -1), n_results=TOP_K, include=[])
+                    latencies.append((time.perf_counter() - start) * 1000)
+                    recall += len(expected & {int(i) for i in result['ids'][0]}) / TOP_K
+
+                p50, p95 = np.percentile(latencies, [50, 95])
+                print(
+                    f"   {m:>3} {ef_construction:>5} {ef_search:>5} {build:>7.1f}s "
+                    f"{recall / len(queries):>7.3f} {p50:>7.2f}ms {p95:>7.2f}ms"
+                )
+
+            client.delete_collection(name)
+        print()
+
+    print("="*70)
+
+
+if __name__ == "__main__":
+    main()
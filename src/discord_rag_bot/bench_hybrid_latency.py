@@ -0,0 +1,83 @@
+"""
+Benchmark Retriever latency: vector-only vs hybrid BM25 + vector on a 50k-chunk KB
+
+Uses the numpy backend in a scratch directory with synthetic chunks and vectors,
+so only retrieval cost is measured (no model load).
+"""
+
+from pathlib import Path
+import random
+import shutil
+import tempfile
+import time
+import numpy as np
+from discord_rag_bot.retrieval import Retriever
+from discord_rag_bot.storage import VectorStore
+from discord_rag_bot.storage.backends.numpy_backend import NumpyBackend
+from discord_rag_bot.utils.config import Config
+
+NUM_CHUNKS = 50_000
+DIMENSION = 384
+QUERIES = 300
+TOP_K = 3
+COLLECTION = "bench_hybrid_latency"
+
+WORDS = (
+    "gradient descent embedding vector index retrieval transformer attention token "
+    "batch epoch loss optimizer dataset pipeline model inference latency memory"
+).split()
+IDENTIFIERS = ["embed_batch", "np.argpartition", "ValueError", "HTTP-404", "E1101", "RAG", "BM25", "HNSW"]
+
+
+def synthetic_chunk(rng: random.Random, i: int) -> str:
+    words = [rng.choice(WORDS) for _ in range(60)]
+    words.insert(rng.randrange(60), rng.choice(IDENTIFIERS))
+    return f"Section {i}: " + " ".join(words)
+
+
+def main():
+    print("\n" + "="*70)
+    print(f"🔀 HYBRID RETRIEVAL LATENCY ({NUM_CHUNKS:,} chunks, top-{TOP_K}, {QUERIES} queries)")
+    print("="*70 + "\n")
+
+    rng = random.Random(0)
+    chunks = [
+        {'content': synthetic_chunk(rng, i), 'metadata': {'chunk_index': i, 'chunk_offset': 0}}
+        for i in range(NUM_CHUNKS)
+    ]
+    vectors = np.random.default_rng(0).standard_normal((NUM_CHUNKS, DIMENSION), dtype=np.float32)
+    queries = np.random.default_rng(1).standard_normal((QUERIES, DIMENSION), dtype=np.float32)
+    texts = [f"why does {rng.choice(IDENTIFIERS)} appear in {rng.choice(WORDS)}" for _ in range(QUERIES)]
+
+    directory = tempfile.mkdtemp()
+    store = VectorStore(backend=NumpyBackend(Path(directory)))
+    try:
+        store.create_collection(COLLECTION)
+        store.add_chunks(COLLECTION, chunks, embeddings=vectors)
+        store.finish_ingestion(COLLECTION)
+
+        results = {}
+        for mode, hybrid in (('vector', False), ('hybrid', True)):
+            Config.HYBRID_SEARCH = hybrid
+            retriever = Retriever(None, COLLECTION, backend=store.backend)
+            retriever.retrieve(texts[0], TOP_K, query_embedding=queries[0])  # Warm up
+
+            latencies = []
+            for text, query in zip(texts, queries):
+                start = time.perf_counter()
+                retriever.retrieve(text, TOP_K, query_embedding=query)
+                latencies.append((time.perf_counter() - start) * 1000)
+            results[mode] = np.percentile(latencies, [50, 95])
+
+        for mode, (p50, p95) in results.items():
+            print(f"   {mode:<7} p50 {p50:7.3f} ms   p95 {p95:7.3f} ms")
+        print(f"\n   Hybrid overhead (p50): {results['hybrid'][0] - results['vector'][0]:.3f} ms")
+    finally:
+        store.delete_collection(COLLECTION)
+        shutil.rmtree(directory, ignore_errors=True)
+
+    print("\n" + "="*70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+Benchmark peak RSS of a 10k-chunk ingestion: Python lists vs float32 ndarrays
+
+Each mode runs in a fresh subprocess so peak RSS is measured independently.
+"""
+
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+NUM_CHUNKS = 10_000
+MODES = ('lists', 'numpy')
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (Linux reports KB)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def run_ingestion(mode: str):
+    """Embed and store NUM_CHUNKS synthetic chunks, then report peak RSS"""
+    import chromadb
+    from discord_rag_bot.embeddings import EmbeddingService
+
+    chunks = [
+        f"Chunk {i}: lecture notes on retrieval, embeddings and vector search, section {i % 97}."
+        for i in range(NUM_CHUNKS)
+    ]
+
+    service = EmbeddingService()
+    baseline = peak_rss_mb()
+
+    start = time.perf_counter()
+    embeddings = service.embed_batch(chunks, show_progress=False, use_cache=False)
+    if mode == 'lists':
+        # Previous behaviour: box every float before handing off to Chroma
+        embeddings = embeddings.tolist()
+
+    db_dir = tempfile.mkdtemp()
+    try:
+        client = chromadb.PersistentClient(path=db_dir)
+        collection = client.create_collection("bench_ingest_memory")
+        batch = 5000  # Stay under Chroma's max batch size
+        for offset in range(0, NUM_CHUNKS, batch):
+            collection.add(
+                embeddings=embeddings[offset:offset + batch],
+                documents=chunks[offset:offset + batch],
+                ids=[f"chunk_{i}" for i in range(offset, min(offset + batch, NUM_CHUNKS))]
+            )
+        elapsed = time.perf_counter() - start
+    finally:
+        shutil.rmtree(db_dir, ignore_errors=True)
+
+    print(f"{mode} {baseline:.1f} {peak_rss_mb():.1f} {elapsed:.2f}")
+
+
+def main():
+    print("\n" + "="*70)
+    print(f"🧠 INGESTION MEMORY BENCHMARK ({NUM_CHUNKS:,} chunks)")
+    print("="*70 + "\n")
+
+    results = {}
+    for mode in MODES:
+        print(f"▶️ Running {mode} mode...")
+        output = subprocess.run(
+            [sys.executable, "-m", "discord_rag_bot.bench_ingest_memory", mode],
+            capture_output=True,
+            text=True,
+            check=True
+        ).stdout
+        _, baseline, peak, elapsed = output.strip().splitlines()[-1].split()
+        results[mode] = (float(baseline), float(peak), float(elapsed))
+        print(f"   📈 Peak RSS: {float(peak):.1f} MB (after model load: {float(baseline):.1f} MB, {float(elapsed):.2f}s)\n")
+
+    print("="*70)
+    lists_growth = results['lists'][1] - results['lists'][0]
+    numpy_growth = results['numpy'][1] - results['numpy'][0]
+    print(f"   Ingestion peak growth (lists): {lists_growth:.1f} MB")
+    print(f"   Ingestion peak growth (numpy): {numpy_growth:.1f} MB")
+    print(f"   Saved: {lists_growth - numpy_growth:.1f} MB")
+    print("="*70)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        run_ingestion(sys.argv[1])
+    else:
+        main()
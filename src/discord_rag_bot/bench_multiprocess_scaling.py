@@ -0,0 +1,50 @@
+"""
+Benchmark embedding throughput against the number of worker processes
+"""
+
+import asyncio
+import os
+import time
+from discord_rag_bot.embeddings import EmbeddingWorkerPool
+from discord_rag_bot.utils.config import Config
+
+NUM_CHUNKS = 20_000
+
+
+async def main():
+    print("\n" + "="*70)
+    print("📈 MULTI-PROCESS EMBEDDING SCALING BENCHMARK")
+    print("="*70 + "\n")
+
+    chunks = [
+        f"Chunk {i}: " + ("Lecture notes on embeddings, vector search and retrieval. " * 8)[:Config.CHUNK_SIZE]
+        for i in range(NUM_CHUNKS)
+    ]
+
+    cpu_count = os.cpu_count() or 1
+    worker_counts = [n for n in (1, 2, 4, 8, 16, 32, 64) if n <= cpu_count]
+    print(f"📦 {NUM_CHUNKS:,} chunks, {cpu_count} CPUs\n")
+
+    baseline = None
+    for workers in worker_counts:
+        # No cache, so every run encodes every chunk
+        pool = EmbeddingWorkerPool(num_workers=workers)
+
+        # Start every worker and load its model outside the timed region
+        await pool.embed_batch(chunks[:pool.batch_size * workers])
+
+        start = time.perf_counter()
+        await pool.embed_batch(chunks)
+        elapsed = time.perf_counter() - start
+        pool.shutdown()
+
+        throughput = NUM_CHUNKS / elapsed
+        baseline = baseline or throughput
+        print(f"   {workers:>3} worker(s): {throughput:>8.1f} chunks/sec  ({throughput / baseline:.2f}x)")
+
+    print("\n" + "="*70)
+
+
+if __name__ == "__main__":
+    # Worker processes re-import this module, so keep work behind the main guard
+    asyncio.run(main())
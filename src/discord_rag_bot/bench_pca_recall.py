@@ -0,0 +1,98 @@
+"""
+Compare recall@k of PCA-reduced vectors against the full-dimension index
+
+Usage: python -m discord_rag_bot.bench_pca_recall [file ...]
+Without files, a synthetic corpus of course-style sentences is used.
+"""
+
+import sys
+import random
+from pathlib import Path
+import numpy as np
+from discord_rag_bot.embeddings import EmbeddingService
+from discord_rag_bot.processing import DocumentConverter, TextChunker
+from discord_rag_bot.storage import PCAProjection
+
+DIMENSIONS = (32, 64, 128, 192, 256)
+TOP_K = (1, 3, 10)
+NUM_QUERIES = 200
+
+
+def load_corpus(paths):
+    """Chunk the given files, or build a synthetic corpus"""
+    if paths:
+        chunker = TextChunker()
+        chunks = []
+        for path in paths:
+            chunks.extend(chunker.chunk_text(DocumentConverter.convert(Path(path))))
+        return chunks
+
+    rng = random.Random(0)
+    topics = ["gradient descent", "attention heads", "vector databases", "tokenization",
+              "overfitting", "cross-validation", "embeddings", "prompt engineering",
+              "batch normalization", "learning rate schedules", "RAG pipelines", "BM25"]
+    verbs = ["explains", "compares", "introduces", "debugs", "evaluates", "visualizes"]
+    contexts = ["in week 3", "for the final project", "with PyTorch", "using NumPy",
+                "on the MNIST dataset", "in the lab session", "for large corpora"]
+    return [
+        f"Lecture {i}: the instructor {rng.choice(verbs)} {rng.choice(topics)} "
+        f"and {rng.choice(topics)} {rng.choice(contexts)}."
+        for i in range(5000)
+    ]
+
+
+def exact_top_k(corpus: np.ndarray, queries: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k nearest corpus vectors (L2) for each query"""
+    distances = (
+        np.sum(queries ** 2, axis=1, keepdims=True)
+        - 2 * queries @ corpus.T
+        + np.sum(corpus ** 2, axis=1)
+    )
+    return np.argsort(distances, axis=1)[:, :k]
+
+
+def main():
+    print("\n" + "="*70)
+    print("📉 PCA RECALL BENCHMARK")
+    print("="*70 + "\n")
+
+    chunks = load_corpus(sys.argv[1:])
+    service = EmbeddingService()
+    corpus = service.embed_batch(chunks, show_progress=True)
+
+    rng = np.random.default_rng(0)
+    query_idx = rng.choice(len(chunks), size=min(NUM_QUERIES, len(chunks)), replace=False)
+    # Use the first half of each sampled chunk as a paraphrase-like query
+    queries = service.embed_batch(
+        [chunks[i][:max(20, len(chunks[i]) // 2)] for i in query_idx],
+        show_progress=False,
+        use_cache=False
+    )
+
+    max_k = max(TOP_K)
+    truth = exact_top_k(corpus, queries, max_k)
+    full_bytes = corpus.nbytes
+
+    print(f"📦 {len(chunks)} chunks, {len(query_idx)} queries, full dimension {corpus.shape[1]}\n")
+    header = "   dims  " + "  ".join(f"recall@{k:<3}" for k in TOP_K) + "   size"
+    print(header)
+
+    for dims in DIMENSIONS:
+        if dims >= corpus.shape[1] or dims > len(chunks):
+            continue
+        projection = PCAProjection.fit(corpus, dims)
+        reduced = exact_top_k(projection.transform(corpus), projection.transform(queries), max_k)
+
+        recalls = []
+        for k in TOP_K:
+            hits = [len(set(truth[q, :k]) & set(reduced[q, :k])) for q in range(len(query_idx))]
+            recalls.append(np.mean(hits) / k)
+
+        size = dims / corpus.shape[1]
+        print(f"   {dims:>4}  " + "  ".join(f"{r:>10.3f}" for r in recalls) + f"   {size:>5.0%} of {full_bytes / 1024 / 1024:.1f} MB")
+
+    print("\n" + "="*70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark quantized search on the numpy backend: recall@k, latency and memory
+"""
+
+from pathlib import Path
+import shutil
+import tempfile
+import time
+import numpy as np
+from discord_rag_bot.storage.backends.numpy_backend import NumpyBackend
+from discord_rag_bot.utils.config import Config
+
+NUM_CHUNKS = 100_000
+DIMENSION = 384
+CLUSTERS = 500
+QUERIES = 100
+TOP_K = 10
+MODES = ('none', 'int8', 'pq')
+COLLECTION = "bench_quantization"
+
+
+def clustered_vectors(count: int, seed: int) -> np.ndarray:
+    """Unit vectors drawn around topic centres, closer to real embeddings than pure noise"""
+    rng = np.random.default_rng(seed)
+    centres = np.random.default_rng(42).standard_normal((CLUSTERS, DIMENSION), dtype=np.float32)
+    vectors = centres[rng.integers(0, CLUSTERS, count)]
+    vectors += 0.5 * rng.standard_normal((count, DIMENSION), dtype=np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def main():
+    print("\n" + "="*70)
+    print(f"🗜️ QUANTIZATION BENCHMARK ({NUM_CHUNKS:,} × {DIMENSION}-d, recall@{TOP_K})")
+    print("="*70 + "\n")
+
+    vectors = clustered_vectors(NUM_CHUNKS, seed=0)
+    queries = clustered_vectors(QUERIES, seed=1)
+
+    results = {}
+    for mode in MODES:
+        print(f"▶️ Building {mode} index...")
+        Config.VECTOR_QUANTIZATION = mode
+        directory = tempfile.mkdtemp()
+        try:
+            backend = NumpyBackend(Path(directory))
+            backend.create_collection(COLLECTION, {"description": "benchmark"})
+
+            start = time.perf_counter()
+            backend.upsert(
+                COLLECTION,
+                ids=[f"chunk_{i}" for i in range(NUM_CHUNKS)],
+                embeddings=vectors,
+                documents=[""] * NUM_CHUNKS,
+                metadatas=[{}] * NUM_CHUNKS
+            )
+            build = time.perf_counter() - start
+
+            # Exact neighbours from the unquantized run are the ground truth
+            latencies, found = [], []
+            for query in queries:
+                start = time.perf_counter()
+                hits = backend.query(COLLECTION, query, TOP_K)
+                latencies.append((time.perf_counter() - start) * 1000)
+                found.append({hit['id'] for hit in hits})
+            if mode == 'none':
+                truth = found
+
+            recall = np.mean([len(f & t) / TOP_K for f, t in zip(found, truth)])
+            results[mode] = (build, np.percentile(latencies, 50), recall, backend.memory_stats(COLLECTION))
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    print("\n" + "="*70)
+    print(f"   {'mode':<6} {'build':>8} {'p50':>9} {'recall':>7} {'searched':>10} {'full':>10} {'ratio':>6}")
+    for mode, (build, p50, recall, memory) in results.items():
+        print(
+            f"   {mode:<6} {build:>7.1f}s {p50:>7.2f}ms {recall:>7.3f} "
+            f"{memory['search_mb']:>7.1f} MB {memory['full_mb']:>7.1f} MB {memory['compression']:>5.1f}x"
+        )
+    print("="*70)
+
+
+if __name__ == "__main__":
+    main()
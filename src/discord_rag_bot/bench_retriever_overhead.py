@@ -0,0 +1,59 @@
+"""
+Microbenchmark: per-query Retriever setup with and without the shared client cache
+"""
+
+import time
+import chromadb
+from discord_rag_bot.embeddings import EmbeddingService
+from discord_rag_bot.retrieval import Retriever
+from discord_rag_bot.storage import VectorStore
+from discord_rag_bot.utils.config import Config
+
+ITERATIONS = 200
+COLLECTION = "bench_retriever_overhead"
+
+
+def main():
+    print("\n" + "="*70)
+    print("⏱️ RETRIEVER SETUP OVERHEAD")
+    print("="*70 + "\n")
+
+    service = EmbeddingService()
+    store = VectorStore()
+    store.create_collection(COLLECTION)
+    store.add_chunks(COLLECTION, [
+        {'content': f"Bench chunk {i} about retrieval overhead.", 'metadata': {'i': i}}
+        for i in range(100)
+    ], service)
+
+    query = service.embed_text("retrieval overhead")
+
+    try:
+        # Previous behaviour: a new client and get_or_create_collection per question
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            client = chromadb.PersistentClient(path=str(Config.CHROMADB_DIR))
+            collection = client.get_or_create_collection(
+                name=COLLECTION,
+                metadata={"description": f"Knowledge base: {COLLECTION}"}
+            )
+            collection.query(query_embeddings=query.reshape(1, -1), n_results=3)
+        uncached = (time.perf_counter() - start) / ITERATIONS * 1000
+
+        # Shared client with cached collection handles
+        start = time.perf_counter()
+        for _ in range(ITERATIONS):
+            Retriever(service, COLLECTION).retrieve("", top_k=3, query_embedding=query)
+        cached = (time.perf_counter() - start) / ITERATIONS * 1000
+
+        print(f"   New client per query:   {uncached:7.3f} ms/query")
+        print(f"   Shared client + cache:  {cached:7.3f} ms/query")
+        print(f"   Overhead removed:       {uncached - cached:7.3f} ms/query")
+    finally:
+        store.delete_collection(COLLECTION)
+
+    print("\n" + "="*70)
+
+
+if __name__ == "__main__":
+    main()
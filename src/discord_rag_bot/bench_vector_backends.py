@@ -0,0 +1,126 @@
+"""
+Benchmark Chroma vs the memory-mapped NumPy backend across KB sizes
+
+For each backend and size, one subprocess builds the index and a second,
+fresh subprocess measures cold-open time, query latency and peak RSS.
+"""
+
+from pathlib import Path
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+SIZES = (1_000, 5_000, 20_000, 50_000)
+BACKENDS = ('chroma', 'numpy')
+DIMENSION = 384
+QUERIES = 200
+TOP_K = 5
+COLLECTION = "bench_vector_backends"
+
+
+def peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB (Linux reports KB)"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def open_backend(backend_name: str, directory: str):
+    """Create a backend rooted at a scratch directory"""
+    from discord_rag_bot.utils.config import Config
+
+    if backend_name == 'chroma':
+        Config.CHROMADB_DIR = Path(directory)
+        from discord_rag_bot.storage.backends.chroma_backend import ChromaBackend
+        return ChromaBackend()
+
+    from discord_rag_bot.storage.backends.numpy_backend import NumpyBackend
+    return NumpyBackend(Path(directory))
+
+
+def random_unit_vectors(count: int, seed: int):
+    """Reproducible random unit vectors, like normalized sentence embeddings"""
+    import numpy as np
+    vectors = np.random.default_rng(seed).standard_normal((count, DIMENSION), dtype=np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def build(backend_name: str, size: int, directory: str):
+    """Write a synthetic KB of unit vectors"""
+    backend = open_backend(backend_name, directory)
+    backend.create_collection(COLLECTION, {"description": "benchmark"})
+
+    vectors = random_unit_vectors(size, seed=0)
+    batch = 5000  # Stay under Chroma's max batch size
+    for offset in range(0, size, batch):
+        end = min(offset + batch, size)
+        backend.upsert(
+            COLLECTION,
+            ids=[f"chunk_{i}" for i in range(offset, end)],
+            embeddings=vectors[offset:end],
+            documents=[f"Synthetic chunk {i}" for i in range(offset, end)],
+            metadatas=[{'chunk_index': i} for i in range(offset, end)]
+        )
+
+
+def measure(backend_name: str, size: int, directory: str):
+    """Open the KB cold, run queries and report timings"""
+    import numpy as np
+
+    queries = random_unit_vectors(QUERIES, seed=1)
+    baseline = peak_rss_mb()
+
+    # Cold open: everything up to the first answered query
+    start = time.perf_counter()
+    backend = open_backend(backend_name, directory)
+    backend.query(COLLECTION, queries[0], TOP_K)
+    cold_open = (time.perf_counter() - start) * 1000
+
+    latencies = []
+    for query in queries:
+        start = time.perf_counter()
+        backend.query(COLLECTION, query, TOP_K)
+        latencies.append((time.perf_counter() - start) * 1000)
+
+    p50, p95 = np.percentile(latencies, [50, 95])
+    print(f"{cold_open:.2f} {p50:.3f} {p95:.3f} {peak_rss_mb() - baseline:.1f}")
+
+
+def main():
+    print("\n" + "="*70)
+    print(f"🗄️ VECTOR BACKEND BENCHMARK ({DIMENSION}-d, top-{TOP_K}, {QUERIES} queries)")
+    print("="*70 + "\n")
+
+    print(f"   {'chunks':>7} {'backend':<8} {'cold open':>10} {'p50':>9} {'p95':>9} {'RSS growth':>11}")
+    for size in SIZES:
+        for backend_name in BACKENDS:
+            directory = tempfile.mkdtemp()
+            try:
+                subprocess.run(
+                    [sys.executable, "-m", "discord_rag_bot.bench_vector_backends", "build", backend_name, str(size), directory],
+                    capture_output=True,
+                    check=True
+                )
+                output = subprocess.run(
+                    [sys.executable, "-m", "discord_rag_bot.bench_vector_backends", "measure", backend_name, str(size), directory],
+                    capture_output=True,
+                    text=True,
+                    check=True
+                ).stdout
+            finally:
+                shutil.rmtree(directory, ignore_errors=True)
+
+            cold_open, p50, p95, rss = (float(value) for value in output.strip().splitlines()[-1].split())
+            print(f"   {size:>7,} {backend_name:<8} {cold_open:>8.1f}ms {p50:>7.3f}ms {p95:>7.3f}ms {rss:>8.1f} MB")
+        print()
+
+    print("="*70)
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        action, backend_name, size, directory = sys.argv[1:5]
+        (build if action == 'build' else measure)(backend_name, int(size), directory)
+    else:
+        main()
@@ -4,7 +4,7 @@ from discord.ext import commands
 import asyncio
 from pathlib import Path
 
-from discord_rag_bot.core import RAGEngine
+from discord_rag_bot.core import EngineLoader
 from discord_rag_bot.commands import UploadCommand, AskCommand, ListKBCommand, DeleteKBCommand
 from discord_rag_bot.utils.config import Config
 
@@ -23,25 +23,40 @@ class RAGBot(commands.Bot):
             help_command=None
         )
         
-        # Initialize RAG engine
-        print("🚀 Initializing RAG Engine...")
-        self.rag_engine = RAGEngine()
+        # RAG engine is built in the background once the bot starts
+        self.engine_loader = EngineLoader()
+        self._startup_report_task = None
         
         # Initialize commands
-        self.upload_cmd = UploadCommand(self.rag_engine)
-        self.ask_cmd = AskCommand(self.rag_engine)
-        self.list_cmd = ListKBCommand(self.rag_engine)
-        self.delete_cmd = DeleteKBCommand(self.rag_engine)
+        self.upload_cmd = UploadCommand(self.engine_loader)
+        self.ask_cmd = AskCommand(self.engine_loader)
+        self.list_cmd = ListKBCommand(self.engine_loader)
+        self.delete_cmd = DeleteKBCommand(self.engine_loader)
     
     async def setup_hook(self):
         """Setup hook - called when bot starts"""
+        # Start loading models while we connect; commands wait on it
+        self.engine_loader.start()
+        
         # Register slash commands
         await self.register_commands()
         
         # Sync commands with Discord
         print("🔄 Syncing commands with Discord...")
-        await self.tree.sync()
+        with self.engine_loader.timer.phase("command sync"):
+            await self.tree.sync()
         print("✅ Commands synced!")
+        
+        # Keep a reference so the task isn't garbage-collected mid-flight
+        self._startup_report_task = asyncio.create_task(self._report_startup())
+    
+    async def _report_startup(self):
+        """Print the startup timing breakdown once warm-up finishes"""
+        try:
+            await self.engine_loader.get()
+        except RuntimeError:
+            pass
+        print(self.engine_loader.timer.report())
     
     async def register_commands(self):
         """Register all slash commands"""
@@ -79,15 +94,17 @@ class RAGBot(commands.Bot):
             description="Ask a question to your knowledge base"
         )
         @app_commands.describe(
+            question="Your question",
             kb_name="Name of the knowledge base to query",
-            question="Your question"
+            all_kbs="Search all of your knowledge bases instead"
         )
         async def ask(
             interaction: discord.Interaction,
-            kb_name: str,
-            question: str
+            question: str,
+            kb_name: str = None,
+            all_kbs: bool = False
         ):
-            await self.ask_cmd.execute(interaction, kb_name, question)
+            await self.ask_cmd.execute(interaction, kb_name, question, all_kbs)
         
         # /list-kb command
         @self.tree.command(
@@ -131,7 +148,7 @@ class RAGBot(commands.Bot):
             
             embed.add_field(
                 name="💬 /ask",
-                value="Ask questions to your knowledge base\n`/ask kb_name:<name> question:<question>`",
+                value="Ask questions to your knowledge base\n`/ask question:<question> kb_name:<name>`\nSet `all_kbs:True` to search all of them",
                 inline=False
             )
             
@@ -176,6 +193,12 @@ class RAGBot(commands.Bot):
             )
         )
     
+    async def close(self):
+        """Stop background workers, then disconnect"""
+        if self.engine_loader.engine is not None:
+            self.engine_loader.engine.shutdown()
+        await super().close()
+    
     async def on_command_error(self, ctx, error):
         """Handle command errors"""
         print(f"❌ Error: {error}")
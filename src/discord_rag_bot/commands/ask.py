@@ -1,32 +1,50 @@
 import discord
-from discord_rag_bot.core import RAGEngine
+from discord_rag_bot.core import EngineLoader, ProcessingStatus
 
 
 class AskCommand:
     """Handle questions to knowledge bases"""
     
-    def __init__(self, engine: RAGEngine):
-        self.engine = engine
+    def __init__(self, loader: EngineLoader):
+        self.loader = loader
     
     async def execute(
         self,
         interaction: discord.Interaction,
         kb_name: str,
-        question: str
+        question: str,
+        all_kbs: bool = False
     ):
         """
         Ask a question to a knowledge base
         
         Args:
             interaction: Discord interaction
-            kb_name: Knowledge base name
+            kb_name: Knowledge base name (ignored when all_kbs is set)
             question: User's question
+            all_kbs: Search every ready knowledge base the user owns
         """
         await interaction.response.defer()
         
         try:
+            # Wait for the engine to finish warming up
+            engine = await self.loader.get()
+            
+            if all_kbs:
+                await self._ask_all(interaction, engine, question)
+                return
+            
+            if not kb_name:
+                embed = discord.Embed(
+                    title="❌ No Knowledge Base Selected",
+                    description="Give a `kb_name`, or set `all_kbs` to search all your knowledge bases",
+                    color=discord.Color.red()
+                )
+                await interaction.followup.send(embed=embed)
+                return
+            
             # Find knowledge base
-            kb = self.engine.kb_manager.find_kb_by_name(
+            kb = engine.kb_manager.find_kb_by_name(
                 str(interaction.user.id),
                 kb_name
             )
@@ -56,7 +74,7 @@ class AskCommand:
                 return
             
             # Query the knowledge base
-            result = self.engine.query_knowledge_base(kb.kb_id, question)
+            result = await engine.query_knowledge_base(kb.kb_id, question)
             
             # Create response embed
             embed = discord.Embed(
@@ -99,4 +117,62 @@ class AskCommand:
                 description=f"Failed to answer question: {str(e)}",
                 color=discord.Color.red()
             )
-            await interaction.followup.send(embed=embed)
\ No newline at end of file
+            await interaction.followup.send(embed=embed)
+    
+    async def _ask_all(self, interaction: discord.Interaction, engine, question: str):
+        """Answer from all of the user's ready knowledge bases at once"""
+        kbs = [
+            kb for kb in engine.get_user_knowledge_bases(str(interaction.user.id))
+            if kb.status == ProcessingStatus.SUCCESS
+        ]
+        
+        if not kbs:
+            embed = discord.Embed(
+                title="❌ No Knowledge Bases Ready",
+                description="You don't have any knowledge bases ready to query",
+                color=discord.Color.red()
+            )
+            embed.add_field(
+                name="💡 Tip",
+                value="Use `/upload` to create one",
+                inline=False
+            )
+            await interaction.followup.send(embed=embed)
+            return
+        
+        result = await engine.query_knowledge_bases([kb.kb_id for kb in kbs], question)
+        
+        embed = discord.Embed(
+            title="💬 Answer",
+            description=result['answer'],
+            color=discord.Color.blue()
+        )
+        
+        embed.add_field(
+            name="📚 Knowledge Bases",
+            value=f"{len(kbs)} searched",
+            inline=True
+        )
+        
+        # Which KBs the retrieved chunks came from
+        used = sorted({chunk['kb_name'] for chunk in result['chunks']})
+        embed.add_field(
+            name="📊 Sources",
+            value=f"{result['num_chunks_retrieved']} chunks from {', '.join(used) or 'none'}",
+            inline=True
+        )
+        
+        embed.set_footer(text=f"Question: {question}")
+        
+        if result['chunks']:
+            top_chunk = result['chunks'][0]
+            source_preview = top_chunk['content'][:150] + "..."
+            source_name = top_chunk['metadata'].get('filename', 'Unknown')
+            
+            embed.add_field(
+                name=f"📄 Top Source: {source_name} ({top_chunk['kb_name']})",
+                value=f"```{source_preview}```",
+                inline=False
+            )
+        
+        await interaction.followup.send(embed=embed)
\ No newline at end of file
@@ -1,12 +1,12 @@
 import discord
-from discord_rag_bot.core import RAGEngine
+from discord_rag_bot.core import EngineLoader
 
 
 class DeleteKBCommand:
     """Delete knowledge bases"""
     
-    def __init__(self, engine: RAGEngine):
-        self.engine = engine
+    def __init__(self, loader: EngineLoader):
+        self.loader = loader
     
     async def execute(
         self,
@@ -23,8 +23,11 @@ class DeleteKBCommand:
         await interaction.response.defer()
         
         try:
+            # Wait for the engine to finish warming up
+            engine = await self.loader.get()
+            
             # Find knowledge base
-            kb = self.engine.kb_manager.find_kb_by_name(
+            kb = engine.kb_manager.find_kb_by_name(
                 str(interaction.user.id),
                 kb_name
             )
@@ -39,7 +42,7 @@ class DeleteKBCommand:
                 return
             
             # Delete knowledge base
-            success = self.engine.delete_knowledge_base(kb.kb_id)
+            success = engine.delete_knowledge_base(kb.kb_id)
             
             if success:
                 embed = discord.Embed(
@@ -1,12 +1,12 @@
 import discord
-from discord_rag_bot.core import RAGEngine
+from discord_rag_bot.core import EngineLoader
 
 
 class ListKBCommand:
     """List user's knowledge bases"""
     
-    def __init__(self, engine: RAGEngine):
-        self.engine = engine
+    def __init__(self, loader: EngineLoader):
+        self.loader = loader
     
     async def execute(self, interaction: discord.Interaction):
         """
@@ -18,8 +18,11 @@ class ListKBCommand:
         await interaction.response.defer()
         
         try:
+            # Wait for the engine to finish warming up
+            engine = await self.loader.get()
+            
             # Get user's knowledge bases
-            kbs = self.engine.get_user_knowledge_bases(str(interaction.user.id))
+            kbs = engine.get_user_knowledge_bases(str(interaction.user.id))
             
             if not kbs:
                 embed = discord.Embed(
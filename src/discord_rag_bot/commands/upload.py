@@ -3,15 +3,15 @@ from discord import app_commands
 from typing import List
 from pathlib import Path
 import aiofiles
-from discord_rag_bot.core import RAGEngine, ProcessingStatus
+from discord_rag_bot.core import EngineLoader, ProcessingStatus
 from discord_rag_bot.utils.config import Config
 
 
 class UploadCommand:
     """Handle file uploads and KB creation"""
     
-    def __init__(self, engine: RAGEngine):
-        self.engine = engine
+    def __init__(self, loader: EngineLoader):
+        self.loader = loader
     
     async def execute(
         self,
@@ -33,6 +33,9 @@ class UploadCommand:
         await interaction.response.defer(ephemeral=False)
         
         try:
+            # Wait for the engine to finish warming up
+            engine = await self.loader.get()
+            
             # Validate files
             validation_errors = await self._validate_files(files)
             if validation_errors:
@@ -83,7 +86,7 @@ class UploadCommand:
                 await status_message.edit(embed=embed)
             
             # Create knowledge base
-            kb = await self.engine.create_knowledge_base(
+            kb = await engine.create_knowledge_base(
                 name=name,
                 owner_id=str(interaction.user.id),
                 owner_name=str(interaction.user),
@@ -1,6 +1,17 @@
 """Core RAG modules"""
 
-from .rag_engine import RAGEngine
 from .knowledge_base import KnowledgeBase, KnowledgeBaseManager, ProcessingStatus
+from .engine_loader import EngineLoader
 
-__all__ = ['RAGEngine', 'KnowledgeBase', 'KnowledgeBaseManager', 'ProcessingStatus']
\ No newline at end of file
+__all__ = ['RAGEngine', 'EngineLoader', 'IngestionPipeline', 'KnowledgeBase', 'KnowledgeBaseManager', 'ProcessingStatus']
+
+
+def __getattr__(name):
+    # RAGEngine pulls in chromadb and the embedding stack, so import it on first use
+    if name == 'RAGEngine':
+        from .rag_engine import RAGEngine
+        return RAGEngine
+    if name == 'IngestionPipeline':
+        from .ingestion import IngestionPipeline
+        return IngestionPipeline
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -0,0 +1,76 @@
+"""
+Background construction of the RAG engine
+"""
+
+from typing import Optional, TYPE_CHECKING
+import asyncio
+from discord_rag_bot.utils.timing import StartupTimer
+
+if TYPE_CHECKING:
+    from discord_rag_bot.core.rag_engine import RAGEngine
+
+
+class EngineLoader:
+    """Build the RAG engine off the event loop and gate commands until it is ready"""
+    
+    def __init__(self, timer: StartupTimer = None):
+        """
+        Initialize loader
+        
+        Args:
+            timer: Startup timer to record phases into
+        """
+        self.timer = timer or StartupTimer()
+        self.engine: Optional['RAGEngine'] = None
+        self.error: Optional[Exception] = None
+        self._ready: Optional[asyncio.Event] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    def start(self):
+        """Start warming up the engine in the background"""
+        if self._task is None:
+            self._ready = asyncio.Event()
+            self._task = asyncio.create_task(self._warm_up())
+    
+    async def _warm_up(self):
+        """Build the engine in a worker thread"""
+        try:
+            self.engine = await asyncio.to_thread(self._build)
+        except Exception as e:
+            self.error = e
+            print(f"❌ RAG Engine failed to start: {e}")
+        finally:
+            self._ready.set()
+    
+    def _build(self) -> 'RAGEngine':
+        """Import heavy dependencies and construct the engine"""
+        with self.timer.phase("imports"):
+            import sentence_transformers  # noqa: F401 (pulls in torch)
+            from discord_rag_bot.core.rag_engine import RAGEngine
+        
+        return RAGEngine(timer=self.timer)
+    
+    @property
+    def is_ready(self) -> bool:
+        """Whether the engine finished loading successfully"""
+        return self.engine is not None
+    
+    async def get(self) -> 'RAGEngine':
+        """
+        Wait for warm-up to finish
+        
+        Returns:
+            The ready RAG engine
+            
+        Raises:
+            RuntimeError: If warm-up was never started or failed
+        """
+        if self._ready is None:
+            raise RuntimeError("RAG Engine warm-up has not been started")
+        
+        await self._ready.wait()
+        
+        if self.error is not None:
+            raise RuntimeError(f"RAG Engine failed to start: {self.error}")
+        
+        return self.engine
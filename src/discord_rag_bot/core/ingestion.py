@@ -0,0 +1,226 @@
+"""
+Pipelined ingestion: conversion, embedding and storage run concurrently
+"""
+
+from typing import List, Dict, Any, Callable, Awaitable, Optional
+from pathlib import Path
+import asyncio
+import time
+import numpy as np
+from discord_rag_bot.processing.file_processor import FileProcessor
+from discord_rag_bot.storage import VectorStore
+from discord_rag_bot.core.knowledge_base import KnowledgeBase
+from discord_rag_bot.utils.config import Config
+
+
+class StageStats:
+    """Throughput counters for one pipeline stage"""
+
+    def __init__(self, name: str, unit: str):
+        self.name = name
+        self.unit = unit
+        self.items = 0
+        self.busy_seconds = 0.0
+        self.wall_seconds = 0.0
+
+    def record(self, items: int, seconds: float):
+        """Record one unit of work"""
+        self.items += items
+        self.busy_seconds += seconds
+
+    @property
+    def throughput(self) -> float:
+        """Items per second while the stage was working"""
+        return self.items / self.busy_seconds if self.busy_seconds else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the pipeline's run time this stage spent working"""
+        return self.busy_seconds / self.wall_seconds if self.wall_seconds else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            'stage': self.name,
+            'items': self.items,
+            'unit': self.unit,
+            'busy_seconds': round(self.busy_seconds, 2),
+            'throughput': round(self.throughput, 1),
+            'utilization': round(self.utilization, 2)
+        }
+
+
+class IngestionPipeline:
+    """Overlap file conversion, embedding and vector writes with bounded queues"""
+
+    def __init__(
+        self,
+        file_processor: FileProcessor,
+        embed: Callable[[List[str]], Awaitable[np.ndarray]],
+        vector_store: VectorStore,
+        embed_batch_size: int = None,
+        write_batch_size: int = None,
+        queue_size: int = None
+    ):
+        """
+        Initialize pipeline
+
+        Args:
+            file_processor: Converts and chunks files
+            embed: Coroutine embedding a list of texts
+            vector_store: Destination store
+            embed_batch_size: Chunks per embedding call (default from config)
+            write_batch_size: Chunks per vector store write (default from config)
+            queue_size: Batches buffered between stages (default from config)
+        """
+        self.file_processor = file_processor
+        self.embed = embed
+        self.vector_store = vector_store
+        self.embed_batch_size = embed_batch_size or Config.EMBEDDING_STREAM_WINDOW
+        self.write_batch_size = write_batch_size or Config.CHROMA_WRITE_BATCH_SIZE
+        self.queue_size = queue_size or Config.INGESTION_QUEUE_SIZE
+
+        self.stats = {
+            'convert': StageStats('convert', 'files'),
+            'embed': StageStats('embed', 'chunks'),
+            'store': StageStats('store', 'chunks')
+        }
+
+    async def run(
+        self,
+        collection_name: str,
+        file_paths: List[Path],
+        kb: KnowledgeBase,
+        metadata: Dict[str, Any] = None,
+        progress_callback: Optional[Callable[[str, int, int], Awaitable[None]]] = None
+    ) -> int:
+        """
+        Ingest files into a collection
+
+        Args:
+            collection_name: Destination collection
+            file_paths: Files to ingest
+            kb: Knowledge base to record per-file results on
+            metadata: Base metadata for all chunks
+            progress_callback: Callback(current_file, current, total)
+
+        Returns:
+            Number of chunks stored
+        """
+        to_embed: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        to_store: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+
+        tasks = [
+            asyncio.create_task(self._convert(file_paths, kb, metadata or {}, progress_callback, to_embed)),
+            asyncio.create_task(self._embed(collection_name, to_embed, to_store)),
+            asyncio.create_task(self._store(collection_name, to_store))
+        ]
+
+        start = time.perf_counter()
+        try:
+            await asyncio.gather(*tasks)
+            await asyncio.to_thread(self.vector_store.finish_ingestion, collection_name)
+        except Exception:
+            # A failed stage would leave its neighbours blocked on a queue
+            for task in tasks:
+                task.cancel()
+            raise
+        finally:
+            wall = time.perf_counter() - start
+            for stats in self.stats.values():
+                stats.wall_seconds = wall
+
+        return self.stats['store'].items
+
+    async def _convert(
+        self,
+        file_paths: List[Path],
+        kb: KnowledgeBase,
+        metadata: Dict[str, Any],
+        progress_callback,
+        to_embed: asyncio.Queue
+    ):
+        """Stage 1: convert and chunk files, emitting embedding-sized batches"""
+        pending: List[Dict[str, Any]] = []
+
+        for i, file_path in enumerate(file_paths, 1):
+            if progress_callback:
+                await progress_callback(file_path.name, i, len(file_paths))
+
+            start = time.perf_counter()
+            result, chunks = await self.file_processor.process_file(file_path, dict(metadata))
+            self.stats['convert'].record(1, time.perf_counter() - start)
+
+            if result.success:
+                kb.add_file(result.to_dict())
+            else:
+                kb.add_error(result.filename, result.error)
+
+            pending.extend(chunks)
+            while len(pending) >= self.embed_batch_size:
+                await to_embed.put(pending[:self.embed_batch_size])
+                pending = pending[self.embed_batch_size:]
+
+        if pending:
+            await to_embed.put(pending)
+        await to_embed.put(None)
+
+    async def _embed(self, collection_name: str, to_embed: asyncio.Queue, to_store: asyncio.Queue):
+        """Stage 2: embed chunk batches that are not already stored"""
+        while (chunks := await to_embed.get()) is not None:
+            chunks = await asyncio.to_thread(self.vector_store.filter_new_chunks, collection_name, chunks)
+            if not chunks:
+                continue
+
+            start = time.perf_counter()
+            embeddings = await self.embed([chunk['content'] for chunk in chunks])
+            self.stats['embed'].record(len(chunks), time.perf_counter() - start)
+
+            await to_store.put((chunks, embeddings))
+
+        await to_store.put(None)
+
+    async def _store(self, collection_name: str, to_store: asyncio.Queue):
+        """Stage 3: write embedded chunks in write-sized batches"""
+        pending_chunks: List[Dict[str, Any]] = []
+        pending_embeddings: List[np.ndarray] = []
+        pending_count = 0
+
+        while True:
+            item = await to_store.get()
+            if item is not None:
+                chunks, embeddings = item
+                pending_chunks.extend(chunks)
+                pending_embeddings.append(embeddings)
+                pending_count += len(chunks)
+
+            # Write full batches, and whatever is left once input is exhausted
+            while pending_count >= self.write_batch_size or (item is None and pending_count):
+                size = min(self.write_batch_size, pending_count)
+                matrix = np.concatenate(pending_embeddings)
+
+                start = time.perf_counter()
+                written = await asyncio.to_thread(
+                    self.vector_store.add_chunks,
+                    collection_name,
+                    pending_chunks[:size],
+                    embeddings=matrix[:size]
+                )
+                self.stats['store'].record(written, time.perf_counter() - start)
+
+                pending_chunks = pending_chunks[size:]
+                pending_embeddings = [matrix[size:]]
+                pending_count -= size
+
+            if item is None:
+                return
+
+    def report(self) -> str:
+        """Format per-stage throughput; the busiest stage is the bottleneck"""
+        lines = ["📈 Ingestion pipeline:"]
+        for stats in self.stats.values():
+            lines.append(
+                f"   • {stats.name:<8} {stats.items:>6} {stats.unit:<6} "
+                f"{stats.throughput:>8.1f} {stats.unit}/s  busy {stats.utilization:>4.0%}"
+            )
+        return "\n".join(lines)
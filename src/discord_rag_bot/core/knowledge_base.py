@@ -2,6 +2,7 @@ from typing import List, Dict, Any, Optional
 from datetime import datetime
 from pathlib import Path
 from enum import Enum
+import hashlib
 import json
 
 
@@ -84,6 +85,15 @@ class KnowledgeBase:
         else:
             self.status = ProcessingStatus.SUCCESS
     
+    @property
+    def content_version(self) -> str:
+        """Fingerprint of the KB's contents; changes whenever files are added"""
+        digest = hashlib.sha256()
+        digest.update(f"{self.kb_id}:{self.total_chunks}:{self.updated_at.isoformat()}".encode('utf-8'))
+        for file_info in self.files:
+            digest.update(str(file_info.get('file_hash') or file_info.get('filename')).encode('utf-8'))
+        return digest.hexdigest()[:16]
+    
     def get_progress_percentage(self) -> int:
         """Get processing progress as percentage"""
         if self.total_files == 0:
@@ -1,32 +1,68 @@
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
-from discord_rag_bot.embeddings import EmbeddingService
-from discord_rag_bot.storage import VectorStore
-from discord_rag_bot.retrieval import Retriever
-from discord_rag_bot.generation import AnswerGenerator
+import asyncio
+import numpy as np
+from discord_rag_bot.embeddings import EmbeddingService, QueryEmbeddingBatcher, EmbeddingWorkerPool
+from discord_rag_bot.storage import VectorStore, residency_manager
+from discord_rag_bot.retrieval import Retriever, Reranker
+from discord_rag_bot.retrieval.fusion import merge_ranked_lists
+from discord_rag_bot.generation import AnswerGenerator, ResponseCache, normalize_question
 from discord_rag_bot.processing import TextChunker
 from discord_rag_bot.processing.file_processor import FileProcessor
 from discord_rag_bot.core.knowledge_base import KnowledgeBaseManager, KnowledgeBase, ProcessingStatus
+from discord_rag_bot.core.ingestion import IngestionPipeline
+from discord_rag_bot.core.semantic_cache import SemanticAnswerCache
 from discord_rag_bot.utils.config import Config
+from discord_rag_bot.utils.timing import StartupTimer
 
 
 class RAGEngine:
     """Main RAG system orchestrator"""
     
-    def __init__(self):
-        """Initialize RAG engine"""
+    def __init__(self, timer: StartupTimer = None):
+        """
+        Initialize RAG engine
+        
+        Args:
+            timer: Optional startup timer to record phases into
+        """
         print("🚀 Initializing RAG Engine...")
+        timer = timer or StartupTimer()
         
         # Core components
-        self.embedding_service = EmbeddingService()
-        self.vector_store = VectorStore()
-        self.answer_generator = AnswerGenerator()
+        with timer.phase("model load"):
+            self.embedding_service = EmbeddingService()
+        self.query_batcher = QueryEmbeddingBatcher(self.embedding_service)
+        self.embedding_workers = None
+        if Config.EMBEDDING_WORKERS > 0:
+            self.embedding_workers = EmbeddingWorkerPool(
+                model_name=self.embedding_service.model_name,
+                backend=self.embedding_service.backend,
+                cache=self.embedding_service.cache
+            )
+        with timer.phase("chroma open"):
+            self.vector_store = VectorStore()
+        self.reranker = None
+        if Config.RERANK_ENABLED:
+            with timer.phase("reranker load"):
+                self.reranker = Reranker()
+        self.response_cache = ResponseCache(
+            cache_dir=Config.RESPONSE_CACHE_DIR if Config.RESPONSE_CACHE_DISK else None
+        ) if Config.RESPONSE_CACHE_ENABLED else None
+        self.answer_generator = AnswerGenerator(response_cache=self.response_cache)
         self.chunker = TextChunker()
         self.file_processor = FileProcessor(self.chunker)
         
+        self.semantic_cache = SemanticAnswerCache() if Config.SEMANTIC_CACHE_ENABLED else None
+        
+        # Single-flight: identical questions in flight share one computation
+        self._inflight: Dict[Tuple[str, str, Optional[int]], asyncio.Future] = {}
+        self.coalesced_queries = 0
+        
         # Knowledge base manager
-        kb_storage = Config.DATA_DIR / "knowledge_bases"
-        self.kb_manager = KnowledgeBaseManager(kb_storage)
+        with timer.phase("kb json load"):
+            kb_storage = Config.DATA_DIR / "knowledge_bases"
+            self.kb_manager = KnowledgeBaseManager(kb_storage)
         
         print("✅ RAG Engine ready!\n")
     
@@ -70,19 +106,22 @@ class RAGEngine:
                 'owner_id': owner_id,
                 'description': description
             }
-            self.vector_store.create_collection(kb.kb_id, collection_metadata)
+            self.vector_store.create_collection(
+                kb.kb_id,
+                collection_metadata,
+                expected_chunks=self.file_processor.estimate_chunks(file_paths)
+            )
             
-            # Process files
-            chunks = await self.file_processor.process_files(
+            # Convert, embed and store concurrently
+            pipeline = IngestionPipeline(self.file_processor, self.embed_chunks, self.vector_store)
+            await pipeline.run(
+                collection_name=kb.kb_id,
                 file_paths=file_paths,
                 kb=kb,
                 metadata={'kb_id': kb.kb_id, 'kb_name': name},
                 progress_callback=progress_callback
             )
-            
-            # Add chunks to vector store
-            if chunks:
-                self.vector_store.add_chunks(kb.kb_id, chunks, self.embedding_service)
+            print(pipeline.report())
             
             # Update KB status
             self.kb_manager.update_kb(kb)
@@ -95,7 +134,22 @@ class RAGEngine:
             self.kb_manager.update_kb(kb)
             raise
     
-    def query_knowledge_base(
+    async def embed_chunks(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed chunk texts without blocking the event loop
+        
+        Args:
+            texts: Chunk texts
+            
+        Returns:
+            Float32 matrix of shape (len(texts), dimension)
+        """
+        if self.embedding_workers is not None:
+            return await self.embedding_workers.embed_batch(texts)
+        
+        return await asyncio.to_thread(self.embedding_service.embed_batch, texts)
+    
+    async def query_knowledge_base(
         self,
         kb_id: str,
         query: str,
@@ -104,6 +158,9 @@ class RAGEngine:
         """
         Query a knowledge base
         
+        Concurrent calls asking the same question of the same KB (ignoring case
+        and whitespace) share one retrieval and generation.
+        
         Args:
             kb_id: Knowledge base ID
             query: User question
@@ -112,30 +169,148 @@ class RAGEngine:
         Returns:
             Dictionary with answer and metadata
         """
+        key = (kb_id, normalize_question(query), top_k)
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._query_knowledge_base(kb_id, query, top_k))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        else:
+            self.coalesced_queries += 1
+        
+        # Shielded so one interaction timing out doesn't cancel the others' answer
+        result = await asyncio.shield(task)
+        return {**result, 'query': query}
+    
+    async def _query_knowledge_base(
+        self,
+        kb_id: str,
+        query: str,
+        top_k: int = None
+    ) -> Dict[str, Any]:
+        """Retrieve and answer one question (see query_knowledge_base)"""
         # Get KB
-        kb = self.kb_manager.get_kb(kb_id)
-        if not kb:
-            raise ValueError(f"Knowledge base '{kb_id}' not found")
+        kb = self._get_queryable_kb(kb_id)
         
-        if kb.status != ProcessingStatus.SUCCESS:
-            raise ValueError(f"Knowledge base is {kb.status.value}, cannot query")
+        # Embed the question together with any concurrent questions
+        query_embedding = await self.query_batcher.embed(query)
+        
+        # Reuse the answer to an equivalent earlier question
+        if self.semantic_cache is not None:
+            cached = self.semantic_cache.lookup(kb_id, kb.content_version, query, query_embedding)
+            if cached is not None:
+                return {**cached, 'query': query, 'cached': True}
         
         # Retrieve
-        retriever = Retriever(self.embedding_service, kb_id)
-        chunks = retriever.retrieve(query, top_k)
+        chunks = await asyncio.to_thread(self._retrieve, kb_id, query, top_k, query_embedding)
         
         # Generate answer
-        answer = self.answer_generator.generate(query, chunks)
+        answer = await asyncio.to_thread(
+            self.answer_generator.generate, query, chunks, cache_scope=(kb_id, kb.content_version)
+        )
         
-        return {
+        result = {
             'kb_id': kb_id,
             'kb_name': kb.name,
             'query': query,
             'answer': answer,
             'chunks': chunks,
+            'num_chunks_retrieved': len(chunks),
+            'cached': False
+        }
+        
+        if self.semantic_cache is not None and not answer.startswith("❌"):
+            self.semantic_cache.store(kb_id, kb.content_version, query, query_embedding, result)
+        
+        return result
+    
+    async def query_knowledge_bases(
+        self,
+        kb_ids: List[str],
+        query: str,
+        top_k: int = None
+    ) -> Dict[str, Any]:
+        """
+        Query several knowledge bases with one embedding and one LLM call
+        
+        Args:
+            kb_ids: Knowledge base IDs
+            query: User question
+            top_k: Number of chunks to retrieve across all KBs
+            
+        Returns:
+            Dictionary with answer and metadata; each chunk carries its 'kb_id' and 'kb_name'
+        """
+        top_k = top_k or Config.TOP_K_RETRIEVAL
+        kbs = [self._get_queryable_kb(kb_id) for kb_id in kb_ids]
+        
+        # Embed once, then search every collection concurrently
+        query_embedding = await self.query_batcher.embed(query)
+        per_kb = await asyncio.gather(*[
+            asyncio.to_thread(self._retrieve, kb.kb_id, query, top_k, query_embedding)
+            for kb in kbs
+        ])
+        
+        for kb, chunks in zip(kbs, per_kb):
+            for chunk in chunks:
+                chunk['kb_id'] = kb.kb_id
+                chunk['kb_name'] = kb.name
+        
+        # Global top-k by cross-encoder score when reranking, which is comparable
+        # across KBs. Raw distances aren't (per-KB PCA, and hybrid fusion and MMR
+        # don't rank by distance), so otherwise merge each KB's final order by
+        # reciprocal rank. Adaptive retrieval already cut each KB's list, so only
+        # its upper bound applies.
+        limit = Config.ADAPTIVE_TOP_K_MAX if Config.ADAPTIVE_TOP_K else top_k
+        if self.reranker is not None:
+            chunks = sorted(
+                (chunk for chunks in per_kb for chunk in chunks),
+                key=lambda chunk: chunk['rerank_score'],
+                reverse=True
+            )[:limit]
+        else:
+            chunks = merge_ranked_lists(per_kb, limit)
+        
+        # Generate answer
+        scope = [part for kb in kbs for part in (kb.kb_id, kb.content_version)]
+        answer = await asyncio.to_thread(self.answer_generator.generate, query, chunks, cache_scope=scope)
+        
+        return {
+            'kb_ids': [kb.kb_id for kb in kbs],
+            'kb_names': [kb.name for kb in kbs],
+            'query': query,
+            'answer': answer,
+            'chunks': chunks,
             'num_chunks_retrieved': len(chunks)
         }
     
+    def _retrieve(
+        self,
+        kb_id: str,
+        query: str,
+        top_k: Optional[int],
+        query_embedding: np.ndarray
+    ) -> List[Dict[str, Any]]:
+        """Build a Retriever and search one KB (blocking; run in a worker thread)"""
+        retriever = Retriever(self.embedding_service, kb_id, reranker=self.reranker)
+        return retriever.retrieve(query, top_k, query_embedding=query_embedding)
+    
+    def _get_queryable_kb(self, kb_id: str) -> KnowledgeBase:
+        """
+        Look up a KB that is ready to answer questions
+        
+        Raises:
+            ValueError: If the KB doesn't exist or hasn't finished processing
+        """
+        kb = self.kb_manager.get_kb(kb_id)
+        if not kb:
+            raise ValueError(f"Knowledge base '{kb_id}' not found")
+        
+        if kb.status != ProcessingStatus.SUCCESS:
+            raise ValueError(f"Knowledge base is {kb.status.value}, cannot query")
+        
+        return kb
+    
     def get_user_knowledge_bases(self, owner_id: str) -> List[KnowledgeBase]:
         """Get all KBs for a user"""
         return self.kb_manager.get_user_kbs(owner_id)
@@ -148,5 +323,33 @@ class RAGEngine:
         except:
             pass
         
+        if self.semantic_cache is not None:
+            self.semantic_cache.invalidate(kb_id)
+        
         # Delete from manager
-        return self.kb_manager.delete_kb(kb_id)
\ No newline at end of file
+        return self.kb_manager.delete_kb(kb_id)
+    
+    def get_metrics(self) -> Dict[str, Any]:
+        """Runtime metrics for batching, caching, workers and KB residency"""
+        metrics = {
+            'query_batcher': self.query_batcher.get_stats(),
+            'residency': residency_manager.get_stats(),
+            'single_flight': {
+                'in_flight': len(self._inflight),
+                'coalesced': self.coalesced_queries
+            }
+        }
+        if self.embedding_workers is not None:
+            metrics['embedding_workers'] = self.embedding_workers.get_stats()
+        if self.reranker is not None:
+            metrics['reranker'] = self.reranker.get_stats()
+        if self.response_cache is not None:
+            metrics['response_cache'] = self.response_cache.get_stats()
+        if self.semantic_cache is not None:
+            metrics['semantic_cache'] = self.semantic_cache.get_stats()
+        return metrics
+    
+    def shutdown(self):
+        """Release background resources"""
+        if self.embedding_workers is not None:
+            self.embedding_workers.shutdown()
\ No newline at end of file
@@ -0,0 +1,168 @@
+"""
+Per-KB semantic answer cache keyed by question embedding similarity
+"""
+
+from typing import Dict, Any, Optional, List, FrozenSet
+import re
+import threading
+import time
+import numpy as np
+from discord_rag_bot.utils.config import Config
+
+
+# Numbers and tokens containing digits ("assignment 2", "week3", "E1101")
+KEY_TERM_PATTERN = re.compile(r"\w*\d\w*")
+
+
+def key_terms(question: str) -> FrozenSet[str]:
+    """Terms two questions must share for one's answer to be reused for the other"""
+    return frozenset(KEY_TERM_PATTERN.findall(question.casefold()))
+
+
+class _KBEntries:
+    """Cached questions and answers for one KB version"""
+    
+    def __init__(self, content_version: str, dimension: int):
+        self.content_version = content_version
+        self.embeddings = np.empty((0, dimension), dtype=np.float32)
+        self.created = np.empty(0, dtype=np.float64)
+        self.last_used = np.empty(0, dtype=np.float64)
+        self.key_terms: List[FrozenSet[str]] = []
+        self.results: List[Dict[str, Any]] = []
+    
+    def drop(self, keep: np.ndarray):
+        """Keep only rows where keep is True"""
+        self.embeddings = self.embeddings[keep]
+        self.created = self.created[keep]
+        self.last_used = self.last_used[keep]
+        self.key_terms = [terms for terms, kept in zip(self.key_terms, keep) if kept]
+        self.results = [result for result, kept in zip(self.results, keep) if kept]
+
+
+class SemanticAnswerCache:
+    """
+    Reuse answers to questions that mean the same thing as an earlier one
+    
+    Embeddings barely separate questions that differ in one number
+    ("assignment 1 deadline" vs "assignment 2 deadline"), so a hit also
+    requires both questions to contain the same numbers and digit-bearing terms.
+    """
+    
+    def __init__(self, threshold: float = None, max_entries: int = None, ttl_seconds: int = None):
+        """
+        Initialize cache
+        
+        Args:
+            threshold: Minimum cosine similarity to reuse an answer (default from config)
+            max_entries: Maximum cached answers per KB (default from config)
+            ttl_seconds: Answer lifetime (default from config)
+        """
+        self.threshold = threshold or Config.SEMANTIC_CACHE_THRESHOLD
+        self.max_entries = max_entries or Config.SEMANTIC_CACHE_MAX_ENTRIES
+        self.ttl_seconds = ttl_seconds or Config.SEMANTIC_CACHE_TTL_SECONDS
+        self._kbs: Dict[str, _KBEntries] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def _normalize(embedding: np.ndarray) -> np.ndarray:
+        embedding = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        return embedding / max(float(np.linalg.norm(embedding)), 1e-12)
+    
+    def _entries(self, kb_id: str, content_version: str, dimension: int) -> _KBEntries:
+        """A KB's entries, discarded if its contents changed since they were cached"""
+        entries = self._kbs.get(kb_id)
+        if entries is None or entries.content_version != content_version:
+            entries = self._kbs[kb_id] = _KBEntries(content_version, dimension)
+        return entries
+    
+    def lookup(
+        self,
+        kb_id: str,
+        content_version: str,
+        question: str,
+        embedding: np.ndarray
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find a cached answer for a similar question
+        
+        Args:
+            kb_id: Knowledge base ID
+            content_version: Current KB content version
+            question: Question text
+            embedding: Question embedding
+        
+        Returns:
+            Cached result with 'cache_similarity', or None
+        """
+        query = self._normalize(embedding)
+        now = time.time()
+        
+        with self._lock:
+            entries = self._entries(kb_id, content_version, len(query))
+            entries.drop(now - entries.created < self.ttl_seconds)
+            
+            if len(entries.results):
+                terms = key_terms(question)
+                similarities = entries.embeddings @ query
+                similarities[[cached != terms for cached in entries.key_terms]] = -np.inf
+                best = int(np.argmax(similarities))
+                if similarities[best] >= self.threshold:
+                    entries.last_used[best] = now
+                    self.hits += 1
+                    return {**entries.results[best], 'cache_similarity': float(similarities[best])}
+            
+            self.misses += 1
+            return None
+    
+    def store(
+        self,
+        kb_id: str,
+        content_version: str,
+        question: str,
+        embedding: np.ndarray,
+        result: Dict[str, Any]
+    ):
+        """
+        Cache an answer, evicting the least recently used one if the KB is full
+        
+        Args:
+            kb_id: Knowledge base ID
+            content_version: KB content version the answer was generated from
+            question: Question text
+            embedding: Question embedding
+            result: Query result to return for similar questions
+        """
+        query = self._normalize(embedding)
+        now = time.time()
+        
+        with self._lock:
+            entries = self._entries(kb_id, content_version, len(query))
+            if len(entries.results) >= self.max_entries:
+                keep = np.ones(len(entries.results), dtype=bool)
+                keep[np.argmin(entries.last_used)] = False
+                entries.drop(keep)
+            
+            entries.embeddings = np.vstack([entries.embeddings, query])
+            entries.created = np.append(entries.created, now)
+            entries.last_used = np.append(entries.last_used, now)
+            entries.key_terms.append(key_terms(question))
+            entries.results.append(result)
+    
+    def invalidate(self, kb_id: str):
+        """Forget all answers for a KB"""
+        with self._lock:
+            self._kbs.pop(kb_id, None)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'kbs': len(self._kbs),
+                'entries': sum(len(entries.results) for entries in self._kbs.values()),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / total if total else 0.0
+            }
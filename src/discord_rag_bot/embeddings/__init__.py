@@ -1,5 +1,8 @@
 """Embedding generation modules"""
 
 from .embedding_service import EmbeddingService
+from .embedding_cache import EmbeddingCache
+from .query_batcher import QueryEmbeddingBatcher
+from .worker_pool import EmbeddingWorkerPool
 
-__all__ = ['EmbeddingService']
\ No newline at end of file
+__all__ = ['EmbeddingService', 'EmbeddingCache', 'QueryEmbeddingBatcher', 'EmbeddingWorkerPool']
\ No newline at end of file
@@ -0,0 +1,136 @@
+"""
+Selectable inference backends for sentence-transformer models
+"""
+
+from typing import List
+from pathlib import Path
+import json
+import numpy as np
+from discord_rag_bot.utils.config import Config
+
+
+BACKENDS = ('torch', 'onnx', 'onnx-int8')
+
+# Sentences used to compare a backend against the torch reference
+PARITY_SENTENCES = [
+    "What is retrieval-augmented generation?",
+    "The assignment deadline is Friday at 5pm.",
+    "Chunks overlap by fifty characters to preserve context.",
+    "ValueError: Collection not found",
+    "Use /upload to create a knowledge base from PDF, DOCX, TXT or MD files.",
+    "Gradient descent updates the weights in the direction that reduces the loss.",
+]
+
+
+def load_model(model_name: str, backend: str = 'torch'):
+    """
+    Load a sentence transformer with the requested backend
+
+    Args:
+        model_name: Name of sentence transformer model
+        backend: 'torch', 'onnx' or 'onnx-int8'
+
+    Returns:
+        SentenceTransformer instance
+
+    Raises:
+        ValueError: If backend is unknown
+    """
+    from sentence_transformers import SentenceTransformer
+
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown embedding backend '{backend}' (expected one of {', '.join(BACKENDS)})")
+
+    if backend == 'torch':
+        return SentenceTransformer(model_name)
+
+    if backend == 'onnx':
+        return SentenceTransformer(model_name, backend='onnx')
+
+    # Dynamically int8-quantized ONNX model, exported once and reused
+    export_dir = _export_dir(model_name)
+    quantized_file = export_dir / "onnx" / "model_qint8.onnx"
+    if not quantized_file.exists():
+        from sentence_transformers import export_dynamic_quantized_onnx_model
+
+        print(f"📦 Exporting int8-quantized ONNX model to: {export_dir}")
+        onnx_model = SentenceTransformer(model_name, backend='onnx')
+        onnx_model.save(str(export_dir))
+        export_dynamic_quantized_onnx_model(
+            onnx_model,
+            quantization_config=Config.EMBEDDING_ONNX_QUANTIZATION,
+            model_name_or_path=str(export_dir),
+            file_suffix="qint8"
+        )
+
+    return SentenceTransformer(
+        str(export_dir),
+        backend='onnx',
+        model_kwargs={"file_name": "onnx/model_qint8.onnx"}
+    )
+
+
+def cache_namespace(model_name: str, backend: str) -> str:
+    """Embedding cache namespace, so vectors from different backends never mix"""
+    return f"{model_name}:{backend}"
+
+
+def _export_dir(model_name: str) -> Path:
+    """Local directory holding exported ONNX files for a model"""
+    return Config.ONNX_MODELS_DIR / model_name.replace('/', '__')
+
+
+def check_parity(model, reference, texts: List[str] = None) -> float:
+    """
+    Compare a model's embeddings against a reference model
+
+    Args:
+        model: Model under test
+        reference: Reference (torch) model
+        texts: Sample texts (default: built-in sentences)
+
+    Returns:
+        Lowest cosine similarity across the samples
+    """
+    texts = texts or PARITY_SENTENCES
+    ours = model.encode(texts, show_progress_bar=False, normalize_embeddings=True)
+    theirs = reference.encode(texts, show_progress_bar=False, normalize_embeddings=True)
+    cosines = np.sum(np.asarray(ours) * np.asarray(theirs), axis=1)
+    return float(cosines.min())
+
+
+def _parity_key(model_name: str, backend: str) -> str:
+    """Identify an exported model, so a re-export is checked again"""
+    if backend != 'onnx-int8':
+        return f"{model_name}:{backend}"
+    
+    quantized_file = _export_dir(model_name) / "onnx" / "model_qint8.onnx"
+    exported_at = int(quantized_file.stat().st_mtime) if quantized_file.exists() else 0
+    return f"{model_name}:{backend}:{Config.EMBEDDING_ONNX_QUANTIZATION}:{exported_at}"
+
+
+def stored_parity(model_name: str, backend: str, model) -> float:
+    """
+    Parity of a backend against torch, checked once per exported model
+    
+    The result is stored in ONNX_MODELS_DIR, so later startups skip loading
+    the torch reference model.
+    
+    Args:
+        model_name: Name of sentence transformer model
+        backend: Backend the model was loaded with
+        model: Loaded model under test
+        
+    Returns:
+        Lowest cosine similarity against torch across the sample sentences
+    """
+    path = Config.ONNX_MODELS_DIR / "parity.json"
+    results = json.loads(path.read_text()) if path.exists() else {}
+    key = _parity_key(model_name, backend)
+    
+    if key not in results:
+        results[key] = check_parity(model, load_model(model_name, 'torch'))
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(results, indent=2))
+    
+    return results[key]
@@ -0,0 +1,183 @@
+"""
+Persistent content-addressed embedding cache
+"""
+
+from typing import List, Optional, Dict, Any
+from pathlib import Path
+import hashlib
+import sqlite3
+import threading
+import time
+import numpy as np
+from discord_rag_bot.utils.config import Config
+
+
+class EmbeddingCache:
+    """On-disk cache of float32 embeddings keyed by (model and backend, text hash)"""
+
+    # Bytes stored per row besides the vector itself (SHA-256 key)
+    KEY_BYTES = 32
+
+    def __init__(self, cache_dir: Path = None, max_size_mb: int = None):
+        """
+        Initialize embedding cache
+
+        Args:
+            cache_dir: Directory holding the cache database (default from config)
+            max_size_mb: Size budget before LRU eviction (default from config)
+        """
+        self.cache_dir = cache_dir or Config.EMBEDDING_CACHE_DIR
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        max_size_mb = max_size_mb if max_size_mb is not None else Config.EMBEDDING_CACHE_MAX_MB
+        self.max_bytes = max_size_mb * 1024 * 1024
+
+        self.db_path = self.cache_dir / "embeddings.sqlite3"
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS embeddings ("
+            "key BLOB PRIMARY KEY, vector BLOB NOT NULL, last_used REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON embeddings(last_used)")
+        self._conn.commit()
+
+        self._size_bytes = self._conn.execute(
+            "SELECT COALESCE(SUM(LENGTH(vector)), 0) + COUNT(*) * ? FROM embeddings",
+            (self.KEY_BYTES,)
+        ).fetchone()[0]
+
+        # Counters
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(model_name: str, text: str) -> bytes:
+        """Build the content-addressed key for a (model, text) pair"""
+        digest = hashlib.sha256()
+        digest.update(model_name.encode('utf-8'))
+        digest.update(b"\0")
+        digest.update(text.encode('utf-8'))
+        return digest.digest()
+
+    def get_many(self, model_name: str, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """
+        Look up embeddings for multiple texts
+
+        Args:
+            model_name: Cache namespace for the model and backend (see cache_namespace)
+            texts: Input texts
+
+        Returns:
+            List aligned with texts, holding a float32 vector or None on a miss
+        """
+        keys = [self.make_key(model_name, text) for text in texts]
+        found: Dict[bytes, np.ndarray] = {}
+
+        with self._lock:
+            unique_keys = list(dict.fromkeys(keys))
+            # Stay well below SQLite's bound-parameter limit
+            for start in range(0, len(unique_keys), 500):
+                batch = unique_keys[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    batch
+                ).fetchall()
+                for key, blob in rows:
+                    found[key] = np.frombuffer(blob, dtype=np.float32)
+
+            if found:
+                now = time.time()
+                self._conn.executemany(
+                    "UPDATE embeddings SET last_used = ? WHERE key = ?",
+                    [(now, key) for key in found]
+                )
+                self._conn.commit()
+
+        results = [found.get(key) for key in keys]
+        hits = sum(1 for vector in results if vector is not None)
+        self.hits += hits
+        self.misses += len(results) - hits
+        return results
+
+    def put_many(self, model_name: str, texts: List[str], vectors: np.ndarray):
+        """
+        Store embeddings for multiple texts
+
+        Args:
+            model_name: Cache namespace for the model and backend (see cache_namespace)
+            texts: Input texts
+            vectors: Embeddings aligned with texts
+        """
+        if not texts:
+            return
+
+        vectors = np.asarray(vectors, dtype=np.float32)
+        now = time.time()
+        rows = [
+            (self.make_key(model_name, text), vector.tobytes(), now)
+            for text, vector in zip(texts, vectors)
+        ]
+        row_bytes = vectors.shape[1] * 4 + self.KEY_BYTES
+
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO embeddings (key, vector, last_used) VALUES (?, ?, ?)",
+                rows
+            )
+            self._conn.commit()
+            self._size_bytes += (self._conn.total_changes - before) * row_bytes
+
+            if self._size_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        """Drop least recently used entries until under 90% of the budget"""
+        target = int(self.max_bytes * 0.9)
+
+        while self._size_bytes > target:
+            rows = self._conn.execute(
+                "SELECT key, LENGTH(vector) FROM embeddings ORDER BY last_used LIMIT 1000"
+            ).fetchall()
+            if not rows:
+                self._size_bytes = 0
+                break
+
+            doomed = []
+            for key, length in rows:
+                doomed.append((key,))
+                self._size_bytes -= length + self.KEY_BYTES
+                if self._size_bytes <= target:
+                    break
+
+            self._conn.executemany("DELETE FROM embeddings WHERE key = ?", doomed)
+            self.evictions += len(doomed)
+
+        self._conn.commit()
+
+    def clear(self):
+        """Remove all cached embeddings"""
+        with self._lock:
+            self._conn.execute("DELETE FROM embeddings")
+            self._conn.commit()
+            self._size_bytes = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': entries,
+            'size_mb': round(self._size_bytes / 1024 / 1024, 2),
+            'max_size_mb': round(self.max_bytes / 1024 / 1024, 2)
+        }
@@ -1,24 +1,61 @@
-from typing import List
-from sentence_transformers import SentenceTransformer
+from typing import List, Iterator, Tuple
+import numpy as np
+from tqdm import tqdm
+from discord_rag_bot.embeddings.backends import load_model, stored_parity, cache_namespace
+from discord_rag_bot.embeddings.embedding_cache import EmbeddingCache
 from discord_rag_bot.utils.config import Config
 
 
 class EmbeddingService:
     """Generate embeddings for text chunks"""
     
-    def __init__(self, model_name: str = None):
+    def __init__(
+        self,
+        model_name: str = None,
+        cache: EmbeddingCache = None,
+        backend: str = None,
+        batch_size: int = None
+    ):
         """
         Initialize embedding service
         
         Args:
             model_name: Name of sentence transformer model
+            cache: Optional embedding cache (default from config)
+            backend: 'torch', 'onnx' or 'onnx-int8' (default from config)
+            batch_size: Texts per model call (default from config)
         """
         self.model_name = model_name or Config.EMBEDDING_MODEL
-        print(f"📊 Loading embedding model: {self.model_name}")
-        self.model = SentenceTransformer(self.model_name)
+        self.backend = backend or Config.EMBEDDING_BACKEND
+        self.batch_size = batch_size or Config.EMBEDDING_BATCH_SIZE
+        print(f"📊 Loading embedding model: {self.model_name} ({self.backend})")
+        self.model = load_model(self.model_name, self.backend)
+        
+        if self.backend != 'torch' and Config.EMBEDDING_PARITY_CHECK:
+            self._verify_parity()
+        
         print(f"✅ Embedding model loaded (dimension: {self.model.get_sentence_embedding_dimension()})")
+        
+        if cache is None and Config.EMBEDDING_CACHE_ENABLED:
+            cache = EmbeddingCache()
+        self.cache = cache
+    
+    def _verify_parity(self):
+        """Fall back to torch if the selected backend drifts from torch output"""
+        min_cosine = stored_parity(self.model_name, self.backend, self.model)
+        
+        if min_cosine >= Config.EMBEDDING_PARITY_MIN_COSINE:
+            print(f"✅ {self.backend} parity check passed (min cosine vs torch: {min_cosine:.4f})")
+            return
+        
+        print(
+            f"⚠️ {self.backend} parity check failed (min cosine vs torch: {min_cosine:.4f} "
+            f"< {Config.EMBEDDING_PARITY_MIN_COSINE}), falling back to torch"
+        )
+        self.backend = 'torch'
+        self.model = load_model(self.model_name, 'torch')
     
-    def embed_text(self, text: str) -> List[float]:
+    def embed_text(self, text: str) -> np.ndarray:
         """
         Generate embedding for a single text
         
@@ -26,26 +63,150 @@ class EmbeddingService:
             text: Input text
             
         Returns:
-            Embedding vector
+            Embedding vector (float32)
         """
-        embedding = self.model.encode(text, show_progress_bar=False)
-        return embedding.tolist()
+        embedding = self.model.encode(text, show_progress_bar=False, convert_to_numpy=True)
+        return np.ascontiguousarray(embedding, dtype=np.float32)
     
-    def embed_batch(self, texts: List[str], show_progress: bool = True) -> List[List[float]]:
+    def embed_batch(
+        self,
+        texts: List[str],
+        show_progress: bool = True,
+        use_cache: bool = True
+    ) -> np.ndarray:
         """
         Generate embeddings for multiple texts
         
+        Texts already in the cache are not sent to the model.
+        
         Args:
             texts: List of input texts
             show_progress: Whether to show progress bar
+            use_cache: Whether to read and populate the embedding cache
             
         Returns:
-            List of embedding vectors
+            Contiguous float32 matrix of shape (len(texts), dimension)
+        """
+        if self.cache is None or not use_cache:
+            return self._encode(texts, show_progress)
+        
+        vectors = self.cache.get_many(self.cache_namespace, texts)
+        
+        # Encode each distinct missing text once
+        missing = list(dict.fromkeys(text for text, vector in zip(texts, vectors) if vector is None))
+        if missing:
+            encoded = self._encode(missing, show_progress)
+            self.cache.put_many(self.cache_namespace, missing, encoded)
+            
+            by_text = dict(zip(missing, encoded))
+            vectors = [by_text[text] if vector is None else vector for text, vector in zip(texts, vectors)]
+        
+        return stack_vectors(vectors, self.dimension)
+    
+    def embed_batch_stream(
+        self,
+        texts: List[str],
+        window_size: int = None,
+        use_cache: bool = True
+    ) -> Iterator[Tuple[int, np.ndarray]]:
+        """
+        Generate embeddings one window at a time, in input order
+        
+        Only one window of embeddings is alive at a time, so memory stays
+        flat no matter how many texts are passed.
+        
+        Args:
+            texts: List of input texts
+            window_size: Texts per yielded window (default from config)
+            use_cache: Whether to read and populate the embedding cache
+            
+        Yields:
+            (offset of the window in texts, float32 matrix for the window)
         """
-        embeddings = self.model.encode(texts, show_progress_bar=show_progress)
-        return embeddings.tolist()
+        window_size = window_size or Config.EMBEDDING_STREAM_WINDOW
+        
+        for start in range(0, len(texts), window_size):
+            window = texts[start:start + window_size]
+            yield start, self.embed_batch(window, show_progress=False, use_cache=use_cache)
+    
+    def _encode(self, texts: List[str], show_progress: bool) -> np.ndarray:
+        """Encode in length-sorted batches and return a float32 matrix in input order"""
+        return encode_sorted(self.model, texts, self.batch_size, show_progress)
+    
+    @property
+    def cache_namespace(self) -> str:
+        """Embedding cache namespace for the loaded model and backend"""
+        return cache_namespace(self.model_name, self.backend)
     
     @property
     def dimension(self) -> int:
         """Get embedding dimension"""
-        return self.model.get_sentence_embedding_dimension()
\ No newline at end of file
+        return self.model.get_sentence_embedding_dimension()
+
+
+def token_lengths(model, texts: List[str]) -> List[int]:
+    """Token count per text (character count if the model has no tokenizer)"""
+    tokenizer = getattr(model, 'tokenizer', None)
+    if tokenizer is None:
+        return [len(text) for text in texts]
+    
+    encoded = tokenizer(
+        texts,
+        add_special_tokens=False,
+        truncation=True,
+        max_length=model.max_seq_length
+    )
+    return [len(ids) for ids in encoded['input_ids']]
+
+
+def encode_sorted(model, texts: List[str], batch_size: int, show_progress: bool = False) -> np.ndarray:
+    """
+    Encode in length-sorted batches
+    
+    Similar-length texts share a batch, so little compute is spent on padding.
+    Used in-process by EmbeddingService and inside ingestion worker processes.
+    
+    Args:
+        model: Sentence transformer
+        texts: Input texts
+        batch_size: Texts per model call
+        show_progress: Whether to show progress bar
+        
+    Returns:
+        Contiguous float32 matrix of shape (len(texts), dimension), in input order
+    """
+    embeddings = np.empty((len(texts), model.get_sentence_embedding_dimension()), dtype=np.float32)
+    if not texts:
+        return embeddings
+    
+    order = np.argsort(token_lengths(model, texts), kind='stable')
+    
+    starts = range(0, len(texts), batch_size)
+    for start in tqdm(starts, desc="Batches", disable=not show_progress):
+        indices = order[start:start + batch_size]
+        batch = [texts[i] for i in indices]
+        embeddings[indices] = model.encode(
+            batch,
+            batch_size=len(batch),
+            show_progress_bar=False,
+            convert_to_numpy=True
+        )
+    
+    return embeddings
+
+
+def stack_vectors(vectors: List[np.ndarray], dimension: int) -> np.ndarray:
+    """
+    Copy row vectors into one preallocated float32 matrix
+    
+    Args:
+        vectors: Row vectors
+        dimension: Embedding dimension
+        
+    Returns:
+        Contiguous float32 matrix of shape (len(vectors), dimension)
+    """
+    matrix = np.empty((len(vectors), dimension), dtype=np.float32)
+    for i, vector in enumerate(vectors):
+        matrix[i] = vector
+    return matrix
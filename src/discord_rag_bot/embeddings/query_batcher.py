@@ -0,0 +1,120 @@
+"""
+Async micro-batching of query embeddings
+"""
+
+from typing import List, Dict, Any, Optional, Tuple
+from collections import Counter
+import asyncio
+import numpy as np
+from discord_rag_bot.embeddings.embedding_service import EmbeddingService
+from discord_rag_bot.utils.config import Config
+
+
+class QueryEmbeddingBatcher:
+    """Collect concurrent query texts and encode them in a single model call"""
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        max_batch_size: int = None,
+        max_wait_ms: float = None
+    ):
+        """
+        Initialize batcher
+
+        Args:
+            embedding_service: Service used to encode each batch
+            max_batch_size: Maximum texts per batch (default from config)
+            max_wait_ms: Maximum time to wait for a batch to fill (default from config)
+        """
+        self.embedding_service = embedding_service
+        self.max_batch_size = max_batch_size or Config.QUERY_BATCH_MAX_SIZE
+        self.max_wait = (max_wait_ms if max_wait_ms is not None else Config.QUERY_BATCH_MAX_WAIT_MS) / 1000
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Metrics
+        self.batches = 0
+        self.items = 0
+        self.largest_batch = 0
+        self.batch_sizes = Counter()
+
+    async def embed(self, text: str) -> np.ndarray:
+        """
+        Embed a single query, sharing the model call with concurrent queries
+
+        Args:
+            text: Query text
+
+        Returns:
+            Embedding vector (float32)
+        """
+        self._ensure_worker()
+        future = self._loop.create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    def _ensure_worker(self):
+        """Start the dispatch task on the running event loop"""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._dispatch())
+
+    async def _dispatch(self):
+        """Form batches from the queue and resolve each caller's future"""
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + self.max_wait
+
+            while len(batch) < self.max_batch_size:
+                timeout = deadline - self._loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            await self._encode(batch)
+
+    async def _encode(self, batch: List[Tuple[str, asyncio.Future]]):
+        """Encode one batch off the event loop"""
+        self.batches += 1
+        self.items += len(batch)
+        self.largest_batch = max(self.largest_batch, len(batch))
+        self.batch_sizes[len(batch)] += 1
+
+        texts = [text for text, _ in batch]
+        try:
+            vectors = await asyncio.to_thread(
+                self.embedding_service.embed_batch,
+                texts,
+                show_progress=False,
+                use_cache=False
+            )
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future), vector in zip(batch, vectors):
+            if not future.done():
+                future.set_result(vector)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth and batch-size metrics"""
+        return {
+            'queue_depth': self._queue.qsize() if self._queue else 0,
+            'batches': self.batches,
+            'items': self.items,
+            'avg_batch_size': self.items / self.batches if self.batches else 0.0,
+            'largest_batch': self.largest_batch,
+            'batch_size_histogram': dict(sorted(self.batch_sizes.items())),
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait * 1000
+        }
@@ -0,0 +1,157 @@
+"""
+Out-of-process embedding workers
+"""
+
+from typing import List, Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import asyncio
+import multiprocessing
+import numpy as np
+from discord_rag_bot.embeddings.backends import cache_namespace
+from discord_rag_bot.embeddings.embedding_cache import EmbeddingCache
+from discord_rag_bot.embeddings.embedding_service import stack_vectors, encode_sorted
+from discord_rag_bot.utils.config import Config
+
+
+# Model loaded once in each worker process by _init_worker
+_worker_model = None
+
+
+def _init_worker(model_name: str, backend: str):
+    """Load the embedding model inside a worker process"""
+    global _worker_model
+    from discord_rag_bot.embeddings.backends import load_model
+    _worker_model = load_model(model_name, backend)
+
+
+def _encode(texts: List[str], batch_size: int) -> np.ndarray:
+    """Encode a batch inside a worker process, in length-sorted model batches"""
+    # A contiguous float32 array pickles as a single buffer
+    return encode_sorted(_worker_model, texts, batch_size)
+
+
+class EmbeddingWorkerPool:
+    """
+    Encode chunks in worker processes so the event loop never blocks on the model
+
+    This is the multi-process ingestion path: batches are spread across
+    num_workers processes, each encoding its batch in length-sorted model
+    batches of EMBEDDING_BATCH_SIZE.
+    """
+
+    def __init__(
+        self,
+        model_name: str = None,
+        backend: str = None,
+        num_workers: int = None,
+        batch_size: int = None,
+        cache: EmbeddingCache = None
+    ):
+        """
+        Initialize worker pool
+
+        Args:
+            model_name: Name of sentence transformer model
+            backend: Inference backend loaded by each worker (default from config)
+            num_workers: Number of worker processes (default from config)
+            batch_size: Texts sent to a worker per task (default from config)
+            cache: Optional embedding cache consulted before dispatching
+        """
+        self.model_name = model_name or Config.EMBEDDING_MODEL
+        self.backend = backend or Config.EMBEDDING_BACKEND
+        self.num_workers = num_workers or Config.EMBEDDING_WORKERS
+        self.batch_size = batch_size or Config.EMBEDDING_WORKER_BATCH_SIZE
+        self.cache = cache
+        self.cache_namespace = cache_namespace(self.model_name, self.backend)
+
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self.restarts = 0
+        self.batches = 0
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the process pool on first use"""
+        if self._executor is None:
+            print(f"🧵 Starting {self.num_workers} embedding worker(s)...")
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.num_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.model_name, self.backend)
+            )
+        return self._executor
+
+    def _restart(self, broken: ProcessPoolExecutor):
+        """Replace a pool whose worker died"""
+        # Concurrent batches share the same broken pool; only replace it once
+        if self._executor is not broken:
+            return
+        print("⚠️ Embedding worker crashed, restarting pool...")
+        broken.shutdown(wait=False, cancel_futures=True)
+        self._executor = None
+        self.restarts += 1
+
+    async def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        """Run one batch on a worker, retrying once on a fresh pool after a crash"""
+        for attempt in range(2):
+            executor = self._get_executor()
+            try:
+                embeddings = await asyncio.wrap_future(executor.submit(_encode, texts, Config.EMBEDDING_BATCH_SIZE))
+                self.batches += 1
+                return embeddings
+            except BrokenProcessPool:
+                self._restart(executor)
+                if attempt:
+                    raise
+
+    async def embed_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate embeddings for multiple texts in worker processes
+
+        Args:
+            texts: List of input texts
+
+        Returns:
+            Contiguous float32 matrix of shape (len(texts), dimension)
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+
+        if self.cache is not None:
+            vectors = await asyncio.to_thread(self.cache.get_many, self.cache_namespace, texts)
+        else:
+            vectors = [None] * len(texts)
+
+        # Sorted by length so each worker gets similar-length texts and pads little
+        missing = sorted(dict.fromkeys(text for text, vector in zip(texts, vectors) if vector is None), key=len)
+        if missing:
+            batches = [
+                missing[start:start + self.batch_size]
+                for start in range(0, len(missing), self.batch_size)
+            ]
+            print(f"🧵 Encoding {len(missing)} chunks in {len(batches)} batch(es) on {self.num_workers} worker(s)...")
+            results = await asyncio.gather(*(self._encode_batch(batch) for batch in batches))
+            encoded = np.concatenate(results)
+
+            if self.cache is not None:
+                await asyncio.to_thread(self.cache.put_many, self.cache_namespace, missing, encoded)
+
+            by_text = dict(zip(missing, encoded))
+            vectors = [by_text[text] if vector is None else vector for text, vector in zip(texts, vectors)]
+
+        return stack_vectors(vectors, len(vectors[0]))
+
+    def shutdown(self):
+        """Stop all worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get worker pool statistics"""
+        return {
+            'num_workers': self.num_workers,
+            'running': self._executor is not None,
+            'batches': self.batches,
+            'restarts': self.restarts
+        }
@@ -1,5 +1,6 @@
 """Answer generation modules"""
 
 from .generator import AnswerGenerator
+from .response_cache import ResponseCache, normalize_question
 
-__all__ = ['AnswerGenerator']
\ No newline at end of file
+__all__ = ['AnswerGenerator', 'ResponseCache', 'normalize_question']
\ No newline at end of file
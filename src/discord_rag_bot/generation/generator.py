@@ -1,19 +1,22 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Sequence
 import ollama
+from discord_rag_bot.generation.response_cache import ResponseCache
 from discord_rag_bot.utils.config import Config
 
 
 class AnswerGenerator:
     """Generate answers using Ollama LLM"""
     
-    def __init__(self, model_name: str = None):
+    def __init__(self, model_name: str = None, response_cache: ResponseCache = None):
         """
         Initialize generator
         
         Args:
             model_name: Ollama model name
+            response_cache: Cache consulted before calling the LLM
         """
         self.model_name = model_name or Config.OLLAMA_MODEL
+        self.response_cache = response_cache
         print(f"🤖 Using LLM: {self.model_name}")
     
     def generate(
@@ -21,7 +24,8 @@ class AnswerGenerator:
         query: str,
         context_chunks: List[Dict[str, Any]],
         temperature: float = 0.7,
-        max_tokens: int = 300
+        max_tokens: int = 300,
+        cache_scope: Sequence[str] = None
     ) -> str:
         """
         Generate answer based on query and context
@@ -31,10 +35,24 @@ class AnswerGenerator:
             context_chunks: Retrieved chunks with metadata
             temperature: LLM temperature (0-1)
             max_tokens: Maximum tokens to generate
+            cache_scope: KB IDs and content versions of the chunks; enables the response cache
             
         Returns:
             Generated answer
         """
+        cache_key = None
+        if self.response_cache is not None and cache_scope is not None:
+            cache_key = self.response_cache.make_key(
+                cache_scope,
+                query,
+                [chunk.get('id', chunk['content']) for chunk in context_chunks],
+                self.model_name,
+                temperature
+            )
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         # Build context from chunks
         context_parts = []
         for i, chunk in enumerate(context_chunks, 1):
@@ -57,7 +75,10 @@ class AnswerGenerator:
                     "num_predict": max_tokens
                 }
             )
-            return response['response'].strip()
+            answer = response['response'].strip()
+            if cache_key is not None:
+                self.response_cache.put(cache_key, answer)
+            return answer
         
         except Exception as e:
             return f"❌ Error generating answer: {str(e)}\nMake sure Ollama is running (ollama serve)"
@@ -0,0 +1,149 @@
+"""
+Exact-match cache of generated answers
+"""
+
+from typing import List, Optional, Dict, Any, Sequence
+from collections import OrderedDict
+from pathlib import Path
+import hashlib
+import re
+import sqlite3
+import threading
+import time
+from discord_rag_bot.utils.config import Config
+
+
+WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_question(question: str) -> str:
+    """Question text with case and runs of whitespace ignored"""
+    return WHITESPACE.sub(" ", question).strip().casefold()
+
+
+class ResponseCache:
+    """
+    In-memory LRU of answers with an optional SQLite tier
+
+    An answer is reused only when everything that shaped the prompt and the
+    sampling matches: the KB and its content version, the normalized question,
+    the retrieved chunk IDs, the model and the temperature.
+    """
+
+    def __init__(self, max_entries: int = None, cache_dir: Path = None, disk_max_entries: int = None):
+        """
+        Initialize response cache
+
+        Args:
+            max_entries: Answers kept in memory (default from config)
+            cache_dir: Directory for the on-disk tier, None to stay in memory
+            disk_max_entries: Answers kept on disk before LRU eviction (default from config)
+        """
+        self.max_entries = max_entries or Config.RESPONSE_CACHE_MAX_ENTRIES
+        self.disk_max_entries = disk_max_entries or Config.RESPONSE_CACHE_DISK_MAX_ENTRIES
+        self._memory: "OrderedDict[bytes, str]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self._conn = None
+        if cache_dir is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(cache_dir / "responses.sqlite3"), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key BLOB PRIMARY KEY, answer TEXT NOT NULL, last_used REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_last_used ON responses(last_used)")
+            self._conn.commit()
+
+        # Counters
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(
+        scope: Sequence[str],
+        question: str,
+        chunk_ids: List[str],
+        model_name: str,
+        temperature: float
+    ) -> bytes:
+        """
+        Build the key for one generation
+
+        Args:
+            scope: KB IDs and content versions the chunks came from
+            question: User question (normalized here)
+            chunk_ids: Retrieved chunk IDs, in prompt order
+            model_name: LLM name
+            temperature: Sampling temperature
+        """
+        digest = hashlib.sha256()
+        for part in (*scope, normalize_question(question), *chunk_ids, model_name, repr(float(temperature))):
+            digest.update(str(part).encode('utf-8'))
+            digest.update(b"\0")
+        return digest.digest()
+
+    def get(self, key: bytes) -> Optional[str]:
+        """Cached answer for a key, or None"""
+        with self._lock:
+            answer = self._memory.get(key)
+            if answer is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return answer
+
+            if self._conn is not None:
+                row = self._conn.execute("SELECT answer FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    self._conn.execute("UPDATE responses SET last_used = ? WHERE key = ?", (time.time(), key))
+                    self._conn.commit()
+                    self._remember(key, row[0])
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return row[0]
+
+            self.misses += 1
+            return None
+
+    def put(self, key: bytes, answer: str):
+        """Store an answer in memory and, when enabled, on disk"""
+        with self._lock:
+            self._remember(key, answer)
+
+            if self._conn is not None:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO responses (key, answer, last_used) VALUES (?, ?, ?)",
+                    (key, answer, time.time())
+                )
+                self._conn.execute(
+                    "DELETE FROM responses WHERE key IN ("
+                    "SELECT key FROM responses ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+                    (self.disk_max_entries,)
+                )
+                self._conn.commit()
+
+    def _remember(self, key: bytes, answer: str):
+        """Insert into the memory tier (caller holds the lock)"""
+        self._memory[key] = answer
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        with self._lock:
+            disk_entries = (
+                self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+                if self._conn is not None else 0
+            )
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'memory_entries': len(self._memory),
+                'disk_entries': disk_entries
+            }
@@ -63,12 +63,19 @@ class TextChunker:
         metadata = metadata or {}
         
         result = []
+        search_from = 0
         for i, chunk in enumerate(chunks):
+            # Character offset of the chunk in the source text (-1 if not found)
+            offset = text.find(chunk, search_from)
+            if offset >= 0:
+                search_from = offset + 1
+            
             chunk_data = {
                 'content': chunk,
                 'metadata': {
                     **metadata,
                     'chunk_index': i,
+                    'chunk_offset': offset,
                     'total_chunks': len(chunks)
                 }
             }
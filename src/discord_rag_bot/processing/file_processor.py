@@ -4,6 +4,7 @@ from discord_rag_bot.processing.converters import DocumentConverter
 from discord_rag_bot.processing.chunkers import TextChunker
 from discord_rag_bot.core.knowledge_base import KnowledgeBase
 import asyncio
+import hashlib
 
 
 class FileProcessingResult:
@@ -15,6 +16,7 @@ class FileProcessingResult:
         self.chunks = 0
         self.error = None
         self.file_size = 0
+        self.file_hash = None
         self.processing_time = 0.0
     
     def to_dict(self) -> Dict[str, Any]:
@@ -25,6 +27,7 @@ class FileProcessingResult:
             'chunks': self.chunks,
             'error': self.error,
             'file_size': self.file_size,
+            'file_hash': self.file_hash,
             'processing_time_seconds': round(self.processing_time, 2)
         }
 
@@ -69,6 +72,9 @@ class FileProcessor:
             if progress_callback:
                 await progress_callback(f"📄 Converting {file_path.name}...", 0)
             
+            # Content hash makes chunk IDs stable across re-uploads
+            result.file_hash = await asyncio.to_thread(self._hash_file, file_path)
+            
             # Convert to text
             text = await asyncio.to_thread(DocumentConverter.convert, file_path)
             
@@ -84,7 +90,8 @@ class FileProcessor:
             file_metadata.update({
                 'filename': file_path.name,
                 'file_type': file_path.suffix,
-                'file_size': result.file_size
+                'file_size': result.file_size,
+                'file_hash': result.file_hash
             })
             
             chunks = self.chunker.chunk_with_metadata(text, file_metadata)
@@ -109,6 +116,29 @@ class FileProcessor:
             
             return result, []
     
+    @staticmethod
+    def _hash_file(file_path: Path) -> str:
+        """SHA-256 of the file contents"""
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(1024 * 1024), b''):
+                digest.update(block)
+        return digest.hexdigest()
+    
+    def estimate_chunks(self, file_paths: List[Path]) -> int:
+        """
+        Rough chunk count for a set of files, from their size on disk
+        
+        Args:
+            file_paths: Files to be ingested
+            
+        Returns:
+            Estimated number of chunks
+        """
+        total_bytes = sum(path.stat().st_size for path in file_paths)
+        stride = max(1, self.chunker.chunk_size - self.chunker.chunk_overlap)
+        return total_bytes // stride
+    
     async def process_files(
         self,
         file_paths: List[Path],
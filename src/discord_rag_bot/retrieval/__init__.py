@@ -1,5 +1,6 @@
 """Retrieval modules"""
 
 from .retriever import Retriever
+from .reranker import Reranker
 
-__all__ = ['Retriever']
\ No newline at end of file
+__all__ = ['Retriever', 'Reranker']
\ No newline at end of file
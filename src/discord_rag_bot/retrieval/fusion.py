@@ -0,0 +1,59 @@
+"""
+Rank fusion for combining retrievers
+"""
+
+from typing import List, Tuple, Dict, Any
+import heapq
+from discord_rag_bot.utils.config import Config
+
+
+def reciprocal_rank_fusion(rankings: List[List[str]], k: int = None) -> List[Tuple[str, float]]:
+    """
+    Fuse ranked ID lists by reciprocal rank
+    
+    Each list contributes 1 / (k + rank) to every ID it contains, so items ranked
+    well by several retrievers rise without needing comparable raw scores.
+    
+    Args:
+        rankings: ID lists, best first
+        k: Damping constant (default from config)
+        
+    Returns:
+        (ID, fused score) pairs, best first
+    """
+    k = k or Config.RRF_K
+    scores = {}
+    for ranking in rankings:
+        for rank, id_ in enumerate(ranking, 1):
+            scores[id_] = scores.get(id_, 0.0) + 1.0 / (k + rank)
+    return sorted(scores.items(), key=lambda item: item[1], reverse=True)
+
+
+def merge_ranked_lists(
+    rankings: List[List[Dict[str, Any]]],
+    limit: int,
+    k: int = None
+) -> List[Dict[str, Any]]:
+    """
+    Merge separately ranked result lists into one top-k by reciprocal rank
+    
+    Unlike reciprocal_rank_fusion the lists hold distinct results (one per KB),
+    so each result keeps the 1 / (k + rank) of its own list. Only positions are
+    compared, which keeps each list's own ordering (hybrid fusion, MMR) intact
+    even when raw distances aren't comparable between lists.
+    
+    Args:
+        rankings: Result lists, best first
+        limit: Number of results to keep
+        k: Damping constant (default from config)
+        
+    Returns:
+        Merged results, best first; ties keep the order of the lists
+    """
+    k = k or Config.RRF_K
+    scored = [
+        (1.0 / (k + rank), item)
+        for ranking in rankings
+        for rank, item in enumerate(ranking, 1)
+    ]
+    return [item for _, item in heapq.nlargest(limit, scored, key=lambda pair: pair[0])]
@@ -0,0 +1,53 @@
+"""
+Maximal marginal relevance selection over candidate vectors
+"""
+
+from typing import Optional
+import numpy as np
+
+
+def mmr_select(
+    query_embedding: np.ndarray,
+    candidate_embeddings: np.ndarray,
+    k: int,
+    lambda_mult: float,
+    relevance: Optional[np.ndarray] = None
+) -> np.ndarray:
+    """
+    Pick k candidates that are relevant but not redundant with each other
+    
+    All pairwise cosine similarities come from one matrix product; each of the
+    k greedy steps is then a vectorized update of every candidate's highest
+    similarity to the picks so far.
+    
+    Args:
+        query_embedding: Query vector, shape (D,)
+        candidate_embeddings: Candidate vectors, shape (n, D)
+        k: Number of candidates to select
+        lambda_mult: 1.0 ranks purely by relevance, 0.0 purely by diversity
+        relevance: Relevance per candidate, higher is better (default: cosine to query)
+        
+    Returns:
+        Indices of selected candidates, in selection order
+    """
+    vectors = np.asarray(candidate_embeddings, dtype=np.float32)
+    vectors = vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+    
+    if relevance is None:
+        query = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+        relevance = vectors @ (query / max(np.linalg.norm(query), 1e-12))
+    
+    similarity = vectors @ vectors.T
+    k = min(k, len(vectors))
+    
+    selected = np.empty(k, dtype=np.int64)
+    redundancy = np.zeros(len(vectors), dtype=np.float32)
+    available = np.ones(len(vectors), dtype=bool)
+    for step in range(k):
+        scores = np.where(available, lambda_mult * relevance - (1 - lambda_mult) * redundancy, -np.inf)
+        pick = int(np.argmax(scores))
+        selected[step] = pick
+        available[pick] = False
+        redundancy = np.maximum(redundancy, similarity[pick]) if step else similarity[pick].copy()
+    
+    return selected
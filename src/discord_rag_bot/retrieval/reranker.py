@@ -0,0 +1,129 @@
+"""
+Cross-encoder reranking of retrieved candidates
+"""
+
+from typing import List, Dict, Any
+from collections import OrderedDict, deque
+import hashlib
+import threading
+import time
+import numpy as np
+from discord_rag_bot.utils.config import Config
+
+
+class Reranker:
+    """Score (query, chunk) pairs with a cross-encoder, caching scores"""
+    
+    def __init__(self, model_name: str = None, cache_size: int = None, batch_size: int = None):
+        """
+        Initialize reranker
+        
+        Args:
+            model_name: Cross-encoder model (default from config)
+            cache_size: Maximum cached pair scores (default from config)
+            batch_size: Pairs per forward pass (default from config)
+        """
+        from sentence_transformers import CrossEncoder
+        
+        self.model_name = model_name or Config.RERANK_MODEL
+        self.batch_size = batch_size or Config.RERANK_BATCH_SIZE
+        self.cache_size = cache_size or Config.RERANK_CACHE_SIZE
+        
+        print(f"📥 Loading reranker: {self.model_name}")
+        self.model = CrossEncoder(self.model_name)
+        
+        self._scores: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._per_kb: Dict[str, Dict[str, Any]] = {}
+    
+    def _key(self, query: str, content: str) -> str:
+        digest = hashlib.sha256()
+        for part in (self.model_name, query, content):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+    
+    def rerank(
+        self,
+        query: str,
+        chunks: List[Dict[str, Any]],
+        top_k: int,
+        collection_name: str = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Reorder candidates by cross-encoder score
+        
+        Args:
+            query: User question
+            chunks: Candidate chunks with 'content'
+            top_k: Number of chunks to keep
+            collection_name: KB the candidates came from, for latency metrics
+        
+        Returns:
+            Best top_k chunks, each with 'rerank_score'
+        """
+        if not chunks:
+            return []
+        
+        start = time.perf_counter()
+        keys = [self._key(query, chunk['content']) for chunk in chunks]
+        
+        with self._lock:
+            scores = [self._scores.get(key) for key in keys]
+            for key, score in zip(keys, scores):
+                if score is not None:
+                    self._scores.move_to_end(key)
+        
+        # Score every uncached pair in one batched call
+        missing = [i for i, score in enumerate(scores) if score is None]
+        if missing:
+            predicted = self.model.predict(
+                [(query, chunks[i]['content']) for i in missing],
+                batch_size=self.batch_size,
+                show_progress_bar=False
+            )
+            with self._lock:
+                for i, score in zip(missing, predicted):
+                    scores[i] = float(score)
+                    self._scores[keys[i]] = scores[i]
+                while len(self._scores) > self.cache_size:
+                    self._scores.popitem(last=False)
+        
+        order = np.argsort(-np.asarray(scores))[:top_k]
+        reranked = [{**chunks[i], 'rerank_score': scores[i]} for i in order]
+        
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        changed = [chunk['content'] for chunk in chunks[:top_k]] != [chunk['content'] for chunk in reranked]
+        with self._lock:
+            self.hits += len(chunks) - len(missing)
+            self.misses += len(missing)
+            kb = self._per_kb.setdefault(collection_name, {'latency_ms': deque(maxlen=500), 'queries': 0, 'changed': 0})
+            kb['latency_ms'].append(elapsed_ms)
+            kb['queries'] += 1
+            kb['changed'] += changed
+        
+        return reranked
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache hit rate, and per KB the rerank latency and how often
+        reranking changed the top-k (low rates suggest it isn't paying off)
+        """
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                'model': self.model_name,
+                'cached_pairs': len(self._scores),
+                'hit_rate': self.hits / total if total else 0.0,
+                'per_kb': {
+                    collection_name: {
+                        'queries': kb['queries'],
+                        'latency_ms_p50': round(float(np.percentile(kb['latency_ms'], 50)), 2),
+                        'latency_ms_p95': round(float(np.percentile(kb['latency_ms'], 95)), 2),
+                        'changed_rate': kb['changed'] / kb['queries']
+                    }
+                    for collection_name, kb in self._per_kb.items()
+                }
+            }
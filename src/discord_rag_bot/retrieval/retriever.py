@@ -1,37 +1,56 @@
 from typing import List, Dict, Any
-import chromadb
+import numpy as np
 from discord_rag_bot.embeddings import EmbeddingService
+from discord_rag_bot.storage.backends import VectorBackend, get_backend
+from discord_rag_bot.storage.projection import projection_store
+from discord_rag_bot.storage.residency import residency_manager
+from discord_rag_bot.storage.lexical_index import lexical_index_store
+from discord_rag_bot.retrieval.fusion import reciprocal_rank_fusion
+from discord_rag_bot.retrieval.reranker import Reranker
+from discord_rag_bot.retrieval.mmr import mmr_select
 from discord_rag_bot.utils.config import Config
 
 
+# Rough prompt-size estimate for logging adaptive top-k savings
+CHARS_PER_TOKEN = 4
+
+
 class Retriever:
     """Retrieve relevant chunks using vector search"""
     
-    def __init__(self, embedding_service: EmbeddingService, collection_name: str):
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        collection_name: str,
+        backend: VectorBackend = None,
+        reranker: Reranker = None
+    ):
         """
         Initialize retriever
         
         Args:
             embedding_service: Service for generating query embeddings
-            collection_name: ChromaDB collection name
+            collection_name: Vector store collection name
+            backend: Vector backend (default from VECTOR_BACKEND)
+            reranker: Optional cross-encoder applied to over-fetched candidates
+            
+        Raises:
+            ValueError: If collection doesn't exist
         """
         self.embedding_service = embedding_service
         self.collection_name = collection_name
+        self.backend = backend or get_backend()
+        self.reranker = reranker
         
-        # Initialize ChromaDB client
-        self.client = chromadb.PersistentClient(path=str(Config.CHROMADB_DIR))
-        
-        # Get or create collection
-        self.collection = self.client.get_or_create_collection(
-            name=collection_name,
-            metadata={"description": f"Knowledge base: {collection_name}"}
-        )
+        if not self.backend.has_collection(collection_name):
+            raise ValueError(f"Collection '{collection_name}' not found")
     
     def retrieve(
         self,
         query: str,
         top_k: int = None,
-        filter_metadata: Dict[str, Any] = None
+        filter_metadata: Dict[str, Any] = None,
+        query_embedding: np.ndarray = None
     ) -> List[Dict[str, Any]]:
         """
         Retrieve relevant chunks for a query
@@ -40,44 +59,198 @@ class Retriever:
             query: User question
             top_k: Number of results to return
             filter_metadata: Optional metadata filters
+            query_embedding: Precomputed query embedding (computed if omitted)
             
         Returns:
             List of retrieved chunks with metadata and scores
         """
         top_k = top_k or Config.TOP_K_RETRIEVAL
         
+        # Adaptive mode ranks up to the upper bound, then cuts where relevance falls off
+        fixed_k = top_k
+        adaptive = Config.ADAPTIVE_TOP_K
+        if adaptive:
+            top_k = Config.ADAPTIVE_TOP_K_MAX
+        
+        # Over-fetch candidates for reranking and diversification to choose from
+        final_k = top_k
+        if self.reranker is not None:
+            top_k = max(top_k, Config.RERANK_CANDIDATES)
+        diversify = Config.MMR_ENABLED
+        if diversify:
+            top_k = max(top_k, Config.MMR_POOL_SIZE)
+        
         # Generate query embedding
-        query_embedding = self.embedding_service.embed_text(query)
+        if query_embedding is None:
+            query_embedding = self.embedding_service.embed_text(query)
+        query_embedding = np.asarray(query_embedding, dtype=np.float32).reshape(1, -1)
         
-        # Build query parameters
-        query_params = {
-            "query_embeddings": [query_embedding],
-            "n_results": top_k
-        }
+        # Project into the collection's reduced space if it was stored with PCA
+        projection = projection_store.get(self.collection_name)
+        if projection is not None:
+            query_embedding = projection.transform(query_embedding)
         
-        if filter_metadata:
-            query_params["where"] = filter_metadata
+        # KBs ingested with a keyword index also get BM25 candidates
+        lexical_index = lexical_index_store.get(self.collection_name) if Config.HYBRID_SEARCH else None
+        n_results = max(top_k, Config.HYBRID_CANDIDATES) if lexical_index is not None else top_k
         
-        # Search
-        results = self.collection.query(**query_params)
+        # Search, reloading the collection if it was unloaded to save memory
+        with residency_manager.track(self.backend, self.collection_name):
+            hits = self.backend.query(
+                self.collection_name,
+                query_embedding[0],
+                n_results=n_results,
+                where=filter_metadata,
+                include_embeddings=diversify
+            )
+            
+            if lexical_index is not None:
+                hits = self._fuse(query, query_embedding[0], hits, lexical_index, top_k, filter_metadata)
         
         # Format results
         retrieved = []
-        for i in range(len(results['documents'][0])):
+        for hit in hits:
             chunk = {
-                'content': results['documents'][0][i],
-                'metadata': results['metadatas'][0][i],
-                'distance': results['distances'][0][i],
-                'score': 1 / (1 + results['distances'][0][i])  # Convert distance to similarity
+                'id': hit['id'],
+                'content': hit['content'],
+                'metadata': hit['metadata'],
+                'distance': hit['distance'],
+                'score': 1 / (1 + hit['distance'])  # Convert distance to similarity
             }
+            if 'rrf_score' in hit:
+                chunk['rrf_score'] = hit['rrf_score']
+            if diversify:
+                chunk['embedding'] = hit['embedding']
             retrieved.append(chunk)
         
+        if self.reranker is not None:
+            # Keep the whole pool ordered when MMR makes the final cut
+            keep = len(retrieved) if diversify else final_k
+            retrieved = self.reranker.rerank(query, retrieved, keep, self.collection_name)
+        
+        if diversify:
+            retrieved = self._diversify(query_embedding[0], retrieved, final_k)
+        
+        if adaptive:
+            retrieved = self._cut(retrieved, fixed_k)
+        
         return retrieved
     
+    def _cut(self, ranked: List[Dict[str, Any]], fixed_k: int) -> List[Dict[str, Any]]:
+        """
+        Keep leading chunks until relevance falls off
+        
+        Stops at the first rank whose distance exceeds ADAPTIVE_MAX_DISTANCE (when
+        set) or whose relevance drops from the previous rank by more than
+        ADAPTIVE_SCORE_GAP of the top relevance, keeping between ADAPTIVE_TOP_K_MIN
+        and ADAPTIVE_TOP_K_MAX chunks. Relevance is the sigmoid of the
+        cross-encoder score when reranked, otherwise 1 / (1 + distance).
+        
+        Args:
+            ranked: Chunks, best first
+            fixed_k: Count a fixed top-k would have sent, for the savings log
+        
+        Returns:
+            Leading chunks to send to generation
+        """
+        if not ranked:
+            return ranked
+        
+        if 'rerank_score' in ranked[0]:
+            relevance = 1 / (1 + np.exp(-np.array([chunk['rerank_score'] for chunk in ranked])))
+        else:
+            relevance = np.array([chunk['score'] for chunk in ranked])
+        
+        keep = min(len(ranked), Config.ADAPTIVE_TOP_K_MAX)
+        for i in range(max(1, Config.ADAPTIVE_TOP_K_MIN), keep):
+            too_far = Config.ADAPTIVE_MAX_DISTANCE > 0 and ranked[i]['distance'] > Config.ADAPTIVE_MAX_DISTANCE
+            if too_far or relevance[i - 1] - relevance[i] > Config.ADAPTIVE_SCORE_GAP * relevance[0]:
+                keep = i
+                break
+        
+        kept = ranked[:keep]
+        fixed_chars = sum(len(chunk['content']) for chunk in ranked[:fixed_k])
+        kept_chars = sum(len(chunk['content']) for chunk in kept)
+        print(
+            f"✂️ {self.collection_name}: {len(kept)} chunks to generation "
+            f"(fixed top-{fixed_k}), ~{(fixed_chars - kept_chars) // CHARS_PER_TOKEN} prompt tokens saved"
+        )
+        return kept
+    
+    def _diversify(
+        self,
+        query_embedding: np.ndarray,
+        candidates: List[Dict[str, Any]],
+        top_k: int
+    ) -> List[Dict[str, Any]]:
+        """
+        Choose top_k candidates by maximal marginal relevance
+        
+        Relevance is the cross-encoder score when candidates were reranked,
+        otherwise cosine similarity to the query. Overlapping neighbour chunks
+        score as redundant with each other, so fewer of them reach the prompt.
+        
+        Returns:
+            Selected chunks without their vectors
+        """
+        if not candidates:
+            return []
+        embeddings = np.stack([chunk.pop('embedding') for chunk in candidates])
+        
+        relevance = None
+        if 'rerank_score' in candidates[0]:
+            scores = np.array([chunk['rerank_score'] for chunk in candidates], dtype=np.float32)
+            relevance = (scores - scores.min()) / max(float(scores.max() - scores.min()), 1e-12)
+        
+        picks = mmr_select(query_embedding, embeddings, top_k, Config.MMR_LAMBDA, relevance)
+        return [candidates[i] for i in picks]
+    
+    def _fuse(
+        self,
+        query: str,
+        query_embedding: np.ndarray,
+        vector_hits: List[Dict[str, Any]],
+        lexical_index,
+        top_k: int,
+        filter_metadata: Dict[str, Any] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Combine vector hits with BM25 hits by reciprocal rank fusion
+        
+        Keyword-only hits are fetched with their stored vectors so every result
+        still carries a true distance.
+        
+        Returns:
+            Fused top-k hits, each with 'rrf_score'
+        """
+        lexical_hits = lexical_index.search(query, Config.HYBRID_CANDIDATES)
+        fused = reciprocal_rank_fusion([
+            [hit['id'] for hit in vector_hits],
+            [id_ for id_, _ in lexical_hits]
+        ])
+        
+        by_id = {hit['id']: hit for hit in vector_hits}
+        missing = [id_ for id_, _ in fused[:top_k] if id_ not in by_id]
+        for chunk in self.backend.get_chunks(self.collection_name, missing, filter_metadata, include_embeddings=True):
+            diff = chunk['embedding'] - query_embedding
+            chunk['distance'] = float(diff @ diff)
+            by_id[chunk['id']] = chunk
+        
+        # Keyword hits excluded by the metadata filter are skipped
+        hits = []
+        for id_, score in fused:
+            if id_ in by_id:
+                hits.append({**by_id[id_], 'rrf_score': score})
+                if len(hits) == top_k:
+                    break
+        return hits
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get collection statistics"""
+        projection = projection_store.get(self.collection_name)
         return {
             'collection_name': self.collection_name,
-            'total_chunks': self.collection.count(),
-            'embedding_dimension': self.embedding_service.dimension
+            'total_chunks': self.backend.count(self.collection_name),
+            'embedding_dimension': self.embedding_service.dimension,
+            'stored_dimension': projection.dimensions if projection else self.embedding_service.dimension
         }
\ No newline at end of file
@@ -1,5 +1,11 @@
 """Storage modules"""
 
 from .vector_store import VectorStore
+from .projection import PCAProjection, ProjectionStore
+from .backends import VectorBackend, get_backend
+from .residency import ResidencyManager, residency_manager
 
-__all__ = ['VectorStore']
\ No newline at end of file
+__all__ = [
+    'VectorStore', 'PCAProjection', 'ProjectionStore', 'VectorBackend', 'get_backend',
+    'ResidencyManager', 'residency_manager'
+]
\ No newline at end of file
@@ -0,0 +1,37 @@
+"""Vector index backends"""
+
+import threading
+from .base import VectorBackend
+from discord_rag_bot.utils.config import Config
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend() -> VectorBackend:
+    """
+    Get the shared backend selected by VECTOR_BACKEND, with large KBs sharded
+    
+    Raises:
+        ValueError: If the configured backend is unknown
+    """
+    global _backend
+    with _backend_lock:
+        if _backend is None:
+            if Config.VECTOR_BACKEND == "chroma":
+                from .chroma_backend import ChromaBackend
+                _backend = ChromaBackend()
+                if Config.VECTOR_QUANTIZATION != "none":
+                    print("⚠️ VECTOR_QUANTIZATION needs VECTOR_BACKEND=numpy; storing full vectors")
+            elif Config.VECTOR_BACKEND == "numpy":
+                from .numpy_backend import NumpyBackend
+                _backend = NumpyBackend()
+            else:
+                raise ValueError(f"Unknown VECTOR_BACKEND '{Config.VECTOR_BACKEND}' (expected chroma or numpy)")
+            
+            from .sharded_backend import ShardedBackend
+            _backend = ShardedBackend(_backend)
+        return _backend
+
+
+__all__ = ['VectorBackend', 'get_backend']
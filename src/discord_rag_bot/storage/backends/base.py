@@ -0,0 +1,138 @@
+"""
+Vector index backend interface
+"""
+
+from typing import List, Dict, Any, Set
+from abc import ABC, abstractmethod
+import numpy as np
+
+
+class VectorBackend(ABC):
+    """Storage and nearest-neighbour search for knowledge base collections"""
+    
+    # Short name used in config and logs
+    name = "base"
+    
+    @property
+    @abstractmethod
+    def location(self) -> str:
+        """Where the backend keeps its data"""
+    
+    @abstractmethod
+    def create_collection(
+        self,
+        collection_name: str,
+        metadata: Dict[str, Any],
+        expected_chunks: int = None
+    ):
+        """
+        Create an empty collection, replacing any existing one
+        
+        Args:
+            collection_name: Name for the collection
+            metadata: Collection metadata (non-empty)
+            expected_chunks: Estimated final size, for backends that size their index
+        """
+    
+    @abstractmethod
+    def delete_collection(self, collection_name: str):
+        """Delete a collection if it exists"""
+    
+    @abstractmethod
+    def list_collections(self) -> List[str]:
+        """List all collection names"""
+    
+    @abstractmethod
+    def has_collection(self, collection_name: str) -> bool:
+        """Whether a collection exists"""
+    
+    @abstractmethod
+    def get_metadata(self, collection_name: str) -> Dict[str, Any]:
+        """Collection metadata"""
+    
+    @abstractmethod
+    def count(self, collection_name: str) -> int:
+        """Number of chunks in a collection"""
+    
+    @abstractmethod
+    def existing_ids(self, collection_name: str, ids: List[str]) -> Set[str]:
+        """Subset of ids already stored in a collection"""
+    
+    @abstractmethod
+    def upsert(
+        self,
+        collection_name: str,
+        ids: List[str],
+        embeddings: np.ndarray,
+        documents: List[str],
+        metadatas: List[Dict[str, Any]]
+    ):
+        """
+        Insert or replace chunks
+        
+        Args:
+            collection_name: Name of collection
+            ids: Chunk IDs
+            embeddings: Float32 matrix aligned with ids
+            documents: Chunk texts
+            metadatas: Chunk metadata
+        """
+    
+    @abstractmethod
+    def query(
+        self,
+        collection_name: str,
+        query_embedding: np.ndarray,
+        n_results: int,
+        where: Dict[str, Any] = None,
+        include_embeddings: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Find the nearest chunks by squared L2 distance
+        
+        Args:
+            collection_name: Name of collection
+            query_embedding: Float32 query vector
+            n_results: Number of results
+            where: Optional metadata filter
+            include_embeddings: Whether to return each hit's stored vector
+            
+        Returns:
+            Hits ordered by distance, each with 'id', 'content', 'metadata',
+            'distance' and optionally 'embedding'
+            
+        Raises:
+            ValueError: If collection doesn't exist
+        """
+    
+    @abstractmethod
+    def get_chunks(
+        self,
+        collection_name: str,
+        ids: List[str],
+        where: Dict[str, Any] = None,
+        include_embeddings: bool = False
+    ) -> List[Dict[str, Any]]:
+        """
+        Fetch stored chunks by ID
+        
+        Args:
+            collection_name: Name of collection
+            ids: Chunk IDs
+            where: Optional metadata filter
+            include_embeddings: Whether to return each chunk's stored vector
+            
+        Returns:
+            Found chunks, each with 'id', 'content', 'metadata' and optionally 'embedding'
+        """
+    
+    def memory_stats(self, collection_name: str) -> Dict[str, Any]:
+        """Vector memory footprint of a collection (empty if not reported)"""
+        return {}
+    
+    @abstractmethod
+    def resident_bytes(self, collection_name: str) -> int:
+        """Approximate memory a collection occupies once loaded for search"""
+    
+    def unload(self, collection_name: str):
+        """Release in-memory state for a collection (reloaded on next use)"""
@@ -0,0 +1,211 @@
+"""
+ChromaDB vector backend
+"""
+
+from typing import List, Dict, Any, Set
+import numpy as np
+from discord_rag_bot.storage.backends.base import VectorBackend
+from discord_rag_bot.storage.chroma_client import get_client, collection_cache
+from discord_rag_bot.utils.config import Config
+
+
+def hnsw_configuration(expected_chunks: int = None) -> Dict[str, Any]:
+    """
+    HNSW index parameters sized for a collection
+    
+    Larger KBs get more graph links and wider construction/search beams to keep
+    recall up; small ones stay cheap to build and query. Non-zero HNSW_* config
+    values override the size-based choice. The space is always squared L2: the
+    numpy backend, shard merging, Retriever scores and distance thresholds all
+    assume it.
+    
+    Args:
+        expected_chunks: Estimated final chunk count (None = small)
+        
+    Returns:
+        Chroma collection configuration
+    """
+    expected_chunks = expected_chunks or 0
+    if expected_chunks < 10_000:
+        max_neighbors, ef_construction, ef_search = 16, 100, 64
+    elif expected_chunks < 100_000:
+        max_neighbors, ef_construction, ef_search = 32, 200, 128
+    else:
+        max_neighbors, ef_construction, ef_search = 48, 400, 256
+    
+    return {
+        "hnsw": {
+            "space": "l2",
+            "max_neighbors": Config.HNSW_M or max_neighbors,
+            "ef_construction": Config.HNSW_EF_CONSTRUCTION or ef_construction,
+            "ef_search": Config.HNSW_EF_SEARCH or ef_search
+        }
+    }
+
+
+class ChromaBackend(VectorBackend):
+    """Collections stored in ChromaDB (SQLite + HNSW)"""
+    
+    name = "chroma"
+    
+    def __init__(self):
+        """Initialize backend with the shared client"""
+        self.client = get_client()
+    
+    @property
+    def location(self) -> str:
+        return str(Config.CHROMADB_DIR)
+    
+    def create_collection(
+        self,
+        collection_name: str,
+        metadata: Dict[str, Any],
+        expected_chunks: int = None
+    ):
+        self.delete_collection(collection_name)
+        configuration = hnsw_configuration(expected_chunks)
+        collection = self.client.create_collection(
+            name=collection_name,
+            metadata=metadata,
+            configuration=configuration
+        )
+        collection_cache.put(collection)
+        
+        hnsw = configuration["hnsw"]
+        print(
+            f"🕸️ HNSW for {collection_name} (~{expected_chunks or 0} chunks): space={hnsw['space']} "
+            f"M={hnsw['max_neighbors']} ef_construction={hnsw['ef_construction']} ef_search={hnsw['ef_search']}"
+        )
+    
+    def delete_collection(self, collection_name: str):
+        collection_cache.invalidate(collection_name)
+        try:
+            self.client.delete_collection(collection_name)
+        except Exception:
+            pass
+    
+    def list_collections(self) -> List[str]:
+        return [col.name for col in self.client.list_collections()]
+    
+    def has_collection(self, collection_name: str) -> bool:
+        try:
+            collection_cache.get(collection_name)
+            return True
+        except ValueError:
+            return False
+    
+    def get_metadata(self, collection_name: str) -> Dict[str, Any]:
+        return collection_cache.get(collection_name).metadata or {}
+    
+    def count(self, collection_name: str) -> int:
+        return collection_cache.get(collection_name).count()
+    
+    def existing_ids(self, collection_name: str, ids: List[str]) -> Set[str]:
+        if not ids:
+            return set()
+        collection = collection_cache.get(collection_name)
+        return set(collection.get(ids=list(set(ids)), include=[])['ids'])
+    
+    def upsert(
+        self,
+        collection_name: str,
+        ids: List[str],
+        embeddings: np.ndarray,
+        documents: List[str],
+        metadatas: List[Dict[str, Any]]
+    ):
+        collection_cache.get(collection_name).upsert(
+            ids=ids,
+            embeddings=embeddings,
+            documents=documents,
+            metadatas=metadatas
+        )
+    
+    def query(
+        self,
+        collection_name: str,
+        query_embedding: np.ndarray,
+        n_results: int,
+        where: Dict[str, Any] = None,
+        include_embeddings: bool = False
+    ) -> List[Dict[str, Any]]:
+        include = ['documents', 'metadatas', 'distances']
+        if include_embeddings:
+            include.append('embeddings')
+        
+        query_params = {
+            "query_embeddings": np.asarray(query_embedding, dtype=np.float32).reshape(1, -1),
+            "n_results": n_results,
+            "include": include
+        }
+        if where:
+            query_params["where"] = where
+        
+        results = collection_cache.get(collection_name).query(**query_params)
+        
+        hits = []
+        for i in range(len(results['ids'][0])):
+            hit = {
+                'id': results['ids'][0][i],
+                'content': results['documents'][0][i],
+                'metadata': results['metadatas'][0][i],
+                'distance': results['distances'][0][i]
+            }
+            if include_embeddings:
+                hit['embedding'] = np.asarray(results['embeddings'][0][i], dtype=np.float32)
+            hits.append(hit)
+        
+        return hits
+    
+    def get_chunks(
+        self,
+        collection_name: str,
+        ids: List[str],
+        where: Dict[str, Any] = None,
+        include_embeddings: bool = False
+    ) -> List[Dict[str, Any]]:
+        if not ids:
+            return []
+        
+        include = ['documents', 'metadatas']
+        if include_embeddings:
+            include.append('embeddings')
+        
+        get_params = {"ids": list(ids), "include": include}
+        if where:
+            get_params["where"] = where
+        
+        results = collection_cache.get(collection_name).get(**get_params)
+        
+        chunks = []
+        for i, id_ in enumerate(results['ids']):
+            chunk = {
+                'id': id_,
+                'content': results['documents'][i],
+                'metadata': results['metadatas'][i]
+            }
+            if include_embeddings:
+                chunk['embedding'] = np.asarray(results['embeddings'][i], dtype=np.float32)
+            chunks.append(chunk)
+        
+        return chunks
+    
+    def resident_bytes(self, collection_name: str) -> int:
+        collection = collection_cache.get(collection_name)
+        sample = collection.get(limit=1, include=['embeddings'])['embeddings']
+        if sample is None or len(sample) == 0:
+            return 0
+        
+        try:
+            max_neighbors = collection.configuration['hnsw']['max_neighbors']
+        except (KeyError, TypeError):
+            max_neighbors = 16
+        
+        # float32 vector plus level-0 graph links (2·M int32) and bookkeeping per element
+        per_element = len(sample[0]) * 4 + max_neighbors * 2 * 4 + 64
+        return collection.count() * per_element
+    
+    def unload(self, collection_name: str):
+        # Drops our handle; the index itself is released by Chroma's LRU segment
+        # cache, which get_client() enables when a residency budget is set
+        collection_cache.invalidate(collection_name)
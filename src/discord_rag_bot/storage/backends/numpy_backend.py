@@ -0,0 +1,640 @@
+"""
+Memory-mapped NumPy vector backend with exact search
+"""
+
+from typing import List, Dict, Any, Set, Optional
+from pathlib import Path
+import itertools
+import json
+import os
+import shutil
+import threading
+import numpy as np
+from discord_rag_bot.storage.backends.base import VectorBackend
+from discord_rag_bot.storage.quantization import Quantizer, ProductQuantizer, fit_quantizer, load_quantizer
+from discord_rag_bot.utils.config import Config
+
+
+class GrowableArray:
+    """Rows in an over-allocated buffer, so appends are amortized O(rows appended)"""
+    
+    def __init__(self, rows: np.ndarray):
+        self._buffer = rows
+        self._size = len(rows)
+    
+    @property
+    def array(self) -> np.ndarray:
+        """View of the filled rows (unaffected by later appends)"""
+        return self._buffer[:self._size]
+    
+    def append(self, rows: np.ndarray):
+        needed = self._size + len(rows)
+        if needed > len(self._buffer):
+            buffer = np.empty((max(needed, 2 * len(self._buffer)),) + self._buffer.shape[1:], dtype=self._buffer.dtype)
+            buffer[:self._size] = self._buffer[:self._size]
+            self._buffer = buffer
+        self._buffer[self._size:needed] = rows
+        self._size = needed
+    
+    def replace(self, rows: List[int], values: np.ndarray):
+        self._buffer[rows] = values
+
+
+class NumpyCollection:
+    """
+    One loaded KB: memory-mapped vectors, in-memory norms, codes, IDs and
+    metadata; document text stays on disk and is read per hit
+    """
+    
+    def __init__(
+        self,
+        path: Path,
+        metadata: Dict[str, Any],
+        dimension: Optional[int],
+        ids: List[str],
+        metadatas: List[Dict[str, Any]],
+        vectors: Optional[np.ndarray],
+        norms: GrowableArray,
+        spans: GrowableArray,
+        quantizer: Optional[Quantizer] = None,
+        codes: Optional[GrowableArray] = None
+    ):
+        self.path = path
+        self.metadata = metadata
+        self.dimension = dimension
+        self.ids = ids
+        self.metadatas = metadatas
+        self.vectors = vectors
+        self._norms = norms
+        self._spans = spans
+        self.quantizer = quantizer
+        self._codes = codes
+        self.row_of = {id_: row for row, id_ in enumerate(ids)}
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    @property
+    def norms(self) -> Optional[np.ndarray]:
+        return self._norms.array if self.vectors is not None else None
+    
+    @property
+    def codes(self) -> Optional[np.ndarray]:
+        return self._codes.array if self._codes is not None else None
+    
+    @property
+    def spans(self) -> np.ndarray:
+        return self._spans.array
+    
+    def append_rows(
+        self,
+        ids: List[str],
+        metadatas: List[Dict[str, Any]],
+        norms: np.ndarray,
+        spans: np.ndarray,
+        codes: Optional[np.ndarray]
+    ):
+        """Add rows already written to disk and remap the grown vector file"""
+        for id_, metadata in zip(ids, metadatas):
+            self.row_of[id_] = len(self.ids)
+            self.ids.append(id_)
+            self.metadatas.append(metadata)
+        self._norms.append(norms)
+        self._spans.append(spans)
+        if codes is not None:
+            self._codes.append(codes)
+        self.vectors = np.memmap(
+            self.path / NumpyBackend.VECTORS_FILE, dtype=np.float32, mode='r', shape=(len(self), self.dimension)
+        )
+    
+    def replace_rows(
+        self,
+        rows: List[int],
+        metadatas: List[Dict[str, Any]],
+        norms: np.ndarray,
+        spans: np.ndarray,
+        codes: Optional[np.ndarray]
+    ):
+        """Update rows overwritten in place on disk"""
+        for row, metadata in zip(rows, metadatas):
+            self.metadatas[row] = metadata
+        self._norms.replace(rows, norms)
+        self._spans.replace(rows, spans)
+        if codes is not None:
+            self._codes.replace(rows, codes)
+    
+    def set_codes(self, quantizer: Quantizer, codes: np.ndarray):
+        """Switch to quantized search"""
+        self.quantizer = quantizer
+        self._codes = GrowableArray(codes)
+    
+    def documents(self, rows: List[int]) -> List[str]:
+        """Read the text of the given rows from the document log"""
+        spans = self.spans
+        with open(self.path / NumpyBackend.DOCUMENTS_FILE, 'rb') as f:
+            texts = []
+            for row in rows:
+                offset, length = spans[row]
+                f.seek(int(offset))
+                texts.append(f.read(int(length)).decode('utf-8'))
+            return texts
+    
+    @property
+    def full_bytes(self) -> int:
+        """Bytes of full-precision vector data"""
+        if self.vectors is None:
+            return 0
+        return self.vectors.nbytes + self.norms.nbytes
+    
+    @property
+    def search_bytes(self) -> int:
+        """Bytes scanned per query: codes when quantized, otherwise the full vectors"""
+        if self.codes is not None:
+            return self.codes.nbytes
+        return self.full_bytes
+
+
+class NumpyBackend(VectorBackend):
+    """
+    Each collection is a float32 matrix searched with one matrix product
+    
+    Storage is append-only, so a write batch costs I/O proportional to the
+    batch rather than to the collection:
+    
+    - vectors.f32, norms.f32, codes.bin, spans.i64: raw row arrays, new rows
+      appended and replaced rows overwritten in place
+    - documents.bin: UTF-8 text log, read only for returned hits
+    - records.jsonl: one line per written row (row, id, metadata); a later
+      line for the same row replaces its metadata
+    - meta.json: collection metadata and dimension
+    
+    Records are appended last, so rows of an interrupted write are ignored
+    on the next open and overwritten by the next write.
+    """
+    
+    name = "numpy"
+    
+    META_FILE = "meta.json"
+    RECORDS_FILE = "records.jsonl"
+    DOCUMENTS_FILE = "documents.bin"
+    SPANS_FILE = "spans.i64"
+    VECTORS_FILE = "vectors.f32"
+    NORMS_FILE = "norms.f32"
+    QUANTIZER_FILE = "quantizer.npz"
+    CODES_FILE = "codes.bin"
+    
+    def __init__(self, directory: Path = None):
+        """
+        Initialize backend
+        
+        Args:
+            directory: Root directory for collections (default from config)
+        """
+        self.directory = directory or Config.NUMPY_INDEX_DIR
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._loaded: Dict[str, NumpyCollection] = {}
+        self._lock = threading.RLock()
+    
+    @property
+    def location(self) -> str:
+        return str(self.directory)
+    
+    def _path(self, collection_name: str) -> Path:
+        return self.directory / collection_name
+    
+    def _load(self, collection_name: str) -> NumpyCollection:
+        """Open a collection, memory-mapping its vectors"""
+        with self._lock:
+            collection = self._loaded.get(collection_name)
+            if collection is not None:
+                return collection
+            
+            path = self._path(collection_name)
+            if not (path / self.META_FILE).exists():
+                raise ValueError(f"Collection '{collection_name}' not found")
+            
+            with open(path / self.META_FILE, 'r') as f:
+                meta = json.load(f)
+            dimension = meta.get('dimension')
+            
+            ids, metadatas = self._read_records(path / self.RECORDS_FILE)
+            count = len(ids)
+            
+            vectors = None
+            norms = np.empty(0, dtype=np.float32)
+            spans = np.empty((0, 2), dtype=np.int64)
+            if count:
+                vectors = np.memmap(path / self.VECTORS_FILE, dtype=np.float32, mode='r', shape=(count, dimension))
+                norms = np.fromfile(path / self.NORMS_FILE, dtype=np.float32, count=count)
+                spans = np.fromfile(path / self.SPANS_FILE, dtype=np.int64, count=2 * count).reshape(count, 2)
+            
+            # Codes stay in memory; full vectors are only paged in for rescoring
+            quantizer = codes = None
+            if (path / self.QUANTIZER_FILE).exists():
+                quantizer = load_quantizer(path / self.QUANTIZER_FILE)
+                layout = quantizer.encode(np.zeros((1, dimension), dtype=np.float32))
+                codes = np.fromfile(path / self.CODES_FILE, dtype=layout.dtype, count=count * layout.shape[1])
+                codes = GrowableArray(codes.reshape(count, layout.shape[1]))
+            
+            collection = NumpyCollection(
+                path=path,
+                metadata=meta['metadata'],
+                dimension=dimension,
+                ids=ids,
+                metadatas=metadatas,
+                vectors=vectors,
+                norms=GrowableArray(norms),
+                spans=GrowableArray(spans),
+                quantizer=quantizer,
+                codes=codes
+            )
+            self._loaded[collection_name] = collection
+            return collection
+    
+    @staticmethod
+    def _read_records(path: Path):
+        """
+        Replay the record log into (ids, metadatas)
+        
+        A torn last line from an interrupted write is cut off the log.
+        """
+        ids, metadatas = [], []
+        if not path.exists():
+            return ids, metadatas
+        
+        good_bytes = 0
+        with open(path, 'rb') as f:
+            for line in f:
+                if not line.endswith(b'\n'):
+                    break
+                record = json.loads(line)
+                if record['row'] == len(ids):
+                    ids.append(record['id'])
+                    metadatas.append(record['metadata'])
+                else:
+                    metadatas[record['row']] = record['metadata']
+                good_bytes += len(line)
+        
+        if good_bytes < path.stat().st_size:
+            os.truncate(path, good_bytes)
+        return ids, metadatas
+    
+    @staticmethod
+    def _write_rows(path: Path, rows: np.ndarray, start: int):
+        """Write rows at a row offset of a raw array file, growing it as needed"""
+        row_bytes = rows[0].nbytes
+        with open(path, 'r+b' if path.exists() else 'wb') as f:
+            f.seek(start * row_bytes)
+            f.write(np.ascontiguousarray(rows).tobytes())
+    
+    def _write_block(
+        self,
+        path: Path,
+        start: int,
+        vectors: np.ndarray,
+        norms: np.ndarray,
+        spans: np.ndarray,
+        codes: Optional[np.ndarray]
+    ):
+        """Write consecutive rows of every array file, starting at row start"""
+        if not len(vectors):
+            return
+        self._write_rows(path / self.VECTORS_FILE, vectors, start)
+        self._write_rows(path / self.NORMS_FILE, norms, start)
+        self._write_rows(path / self.SPANS_FILE, spans, start)
+        if codes is not None:
+            self._write_rows(path / self.CODES_FILE, codes, start)
+    
+    def _write_meta(self, collection_name: str, metadata: Dict[str, Any], dimension: Optional[int]):
+        path = self._path(collection_name)
+        path.mkdir(parents=True, exist_ok=True)
+        tmp = path / f"{self.META_FILE}.tmp"
+        with open(tmp, 'w') as f:
+            json.dump({'metadata': metadata, 'dimension': dimension}, f)
+        os.replace(tmp, path / self.META_FILE)
+    
+    def create_collection(
+        self,
+        collection_name: str,
+        metadata: Dict[str, Any],
+        expected_chunks: int = None
+    ):
+        with self._lock:
+            self.delete_collection(collection_name)
+            self._write_meta(collection_name, metadata, None)
+    
+    def delete_collection(self, collection_name: str):
+        with self._lock:
+            self._loaded.pop(collection_name, None)
+            shutil.rmtree(self._path(collection_name), ignore_errors=True)
+    
+    def list_collections(self) -> List[str]:
+        return sorted(
+            path.name for path in self.directory.iterdir()
+            if (path / self.META_FILE).exists()
+        )
+    
+    def has_collection(self, collection_name: str) -> bool:
+        return (self._path(collection_name) / self.META_FILE).exists()
+    
+    def get_metadata(self, collection_name: str) -> Dict[str, Any]:
+        return self._load(collection_name).metadata
+    
+    def count(self, collection_name: str) -> int:
+        return len(self._load(collection_name))
+    
+    def existing_ids(self, collection_name: str, ids: List[str]) -> Set[str]:
+        row_of = self._load(collection_name).row_of
+        return {id_ for id_ in ids if id_ in row_of}
+    
+    def upsert(
+        self,
+        collection_name: str,
+        ids: List[str],
+        embeddings: np.ndarray,
+        documents: List[str],
+        metadatas: List[Dict[str, Any]]
+    ):
+        embeddings = np.asarray(embeddings, dtype=np.float32)
+        if not ids:
+            return
+        
+        with self._lock:
+            collection = self._load(collection_name)
+            path = collection.path
+            count = len(collection)
+            
+            if collection.dimension is None:
+                collection.dimension = embeddings.shape[1]
+                self._write_meta(collection_name, collection.metadata, collection.dimension)
+            
+            # The last write of an ID within the batch wins
+            latest = {id_: i for i, id_ in enumerate(ids)}
+            new = [i for id_, i in latest.items() if id_ not in collection.row_of]
+            replaced = [i for id_, i in latest.items() if id_ in collection.row_of]
+            replaced_rows = [collection.row_of[ids[i]] for i in replaced]
+            
+            # Document text is appended to the log; spans point into it
+            texts = [documents[i].encode('utf-8') for i in new + replaced]
+            log_end = (path / self.DOCUMENTS_FILE).stat().st_size if (path / self.DOCUMENTS_FILE).exists() else 0
+            lengths = np.array([len(text) for text in texts], dtype=np.int64)
+            spans = np.stack([log_end + np.cumsum(lengths) - lengths, lengths], axis=1)
+            with open(path / self.DOCUMENTS_FILE, 'ab') as f:
+                f.write(b''.join(texts))
+            
+            norms = np.einsum('ij,ij->i', embeddings, embeddings)
+            codes = collection.quantizer.encode(embeddings) if collection.quantizer is not None else None
+            
+            # New rows go to the end of each file, replaced rows are overwritten in place
+            new_codes = codes[new] if codes is not None else None
+            self._write_block(path, count, embeddings[new], norms[new], spans[:len(new)], new_codes)
+            for j, (i, row) in enumerate(zip(replaced, replaced_rows), len(new)):
+                row_codes = codes[[i]] if codes is not None else None
+                self._write_block(path, row, embeddings[[i]], norms[[i]], spans[j:j + 1], row_codes)
+            
+            # Records last: they commit the rows written above
+            with open(path / self.RECORDS_FILE, 'a') as f:
+                for row, i in enumerate(new, count):
+                    f.write(json.dumps({'row': row, 'id': ids[i], 'metadata': metadatas[i]}) + "\n")
+                for row, i in zip(replaced_rows, replaced):
+                    f.write(json.dumps({'row': row, 'id': ids[i], 'metadata': metadatas[i]}) + "\n")
+            
+            # Mirror the write in memory
+            collection.append_rows(
+                [ids[i] for i in new],
+                [metadatas[i] for i in new],
+                norms[new],
+                spans[:len(new)],
+                new_codes
+            )
+            if replaced:
+                collection.replace_rows(
+                    replaced_rows,
+                    [metadatas[i] for i in replaced],
+                    norms[replaced],
+                    spans[len(new):],
+                    codes[replaced] if codes is not None else None
+                )
+            
+            if collection.quantizer is None:
+                self._quantize(collection_name, collection)
+    
+    def _quantize(self, collection_name: str, collection: NumpyCollection):
+        """
+        Fit a quantizer and encode every row once the collection is large enough
+        
+        The quantizer is fitted once the collection reaches QUANTIZATION_MIN_CHUNKS
+        (when VECTOR_QUANTIZATION is set); later writes encode only their own rows.
+        """
+        min_chunks = max(Config.QUANTIZATION_MIN_CHUNKS, ProductQuantizer.CENTROIDS)
+        if Config.VECTOR_QUANTIZATION == "none" or len(collection) < min_chunks:
+            return
+        
+        quantizer = fit_quantizer(Config.VECTOR_QUANTIZATION, collection.vectors, Config.PQ_SUBVECTORS)
+        codes = quantizer.encode(collection.vectors)
+        
+        path = collection.path
+        tmp = path / f"{self.CODES_FILE}.tmp"
+        with open(tmp, 'wb') as f:
+            f.write(codes.tobytes())
+        os.replace(tmp, path / self.CODES_FILE)
+        
+        # The quantizer file marks the codes as valid
+        tmp = path / f"{self.QUANTIZER_FILE}.tmp"
+        with open(tmp, 'wb') as f:
+            quantizer.save(f)
+        os.replace(tmp, path / self.QUANTIZER_FILE)
+        
+        collection.set_codes(quantizer, codes)
+        
+        recall = self.evaluate_recall(collection_name, k=10, samples=50)
+        print(
+            f"🗜️ Quantized {collection_name} ({quantizer.kind}): "
+            f"{collection.vectors.nbytes / 1e6:.1f} MB → {codes.nbytes / 1e6:.1f} MB searched in memory, "
+            f"recall@10 {recall:.3f}"
+        )
+    
+    def query(
+        self,
+        collection_name: str,
+        query_embedding: np.ndarray,
+        n_results: int,
+        where: Dict[str, Any] = None,
+        include_embeddings: bool = False
+    ) -> List[Dict[str, Any]]:
+        collection = self._load(collection_name)
+        
+        # Consistent view of the rows, so a concurrent write can't skew shapes
+        with self._lock:
+            count = len(collection)
+            vectors, norms = collection.vectors, collection.norms
+            quantizer, codes = collection.quantizer, collection.codes
+        if vectors is None or n_results <= 0:
+            return []
+        
+        query = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+        
+        if quantizer is not None:
+            distances = quantizer.distances(codes, query)
+        else:
+            # Squared L2 distance, matching Chroma's default space
+            distances = norms - 2 * (vectors @ query) + query @ query
+        
+        if where:
+            mask = np.fromiter(
+                (self._matches(metadata, where) for metadata in itertools.islice(collection.metadatas, count)),
+                dtype=bool,
+                count=count
+            )
+            distances = np.where(mask, distances, np.inf)
+            candidates = int(mask.sum())
+        else:
+            candidates = count
+        
+        k = min(n_results, candidates)
+        if k == 0:
+            return []
+        
+        if quantizer is not None:
+            top, top_distances = self._rescore(vectors, distances, query, k, candidates)
+        else:
+            top = np.argpartition(distances, k - 1)[:k]
+            top = top[np.argsort(distances[top])]
+            top_distances = distances[top]
+        
+        hits = []
+        for row, distance, content in zip(top, top_distances, collection.documents(top)):
+            hit = {
+                'id': collection.ids[row],
+                'content': content,
+                'metadata': collection.metadatas[row],
+                'distance': float(distance)
+            }
+            if include_embeddings:
+                hit['embedding'] = np.array(vectors[row])
+            hits.append(hit)
+        
+        return hits
+    
+    @staticmethod
+    def _rescore(
+        vectors: np.ndarray,
+        approximate: np.ndarray,
+        query: np.ndarray,
+        k: int,
+        candidates: int
+    ):
+        """
+        Re-rank a shortlist from the codes against full-precision vectors on disk
+        
+        Returns:
+            (top rows, their exact distances), nearest first
+        """
+        shortlist_size = min(k * Config.QUANTIZATION_RESCORE_FACTOR, candidates)
+        shortlist = np.argpartition(approximate, shortlist_size - 1)[:shortlist_size]
+        shortlist.sort()  # Read mapped rows in file order
+        
+        diff = vectors[shortlist] - query
+        exact = np.einsum('ij,ij->i', diff, diff)
+        
+        order = np.argsort(exact)[:k]
+        return shortlist[order], exact[order]
+    
+    @staticmethod
+    def _matches(metadata: Dict[str, Any], where: Dict[str, Any]) -> bool:
+        """
+        Evaluate an equality filter ({key: value} or {key: {'$eq': value}})
+        
+        Raises:
+            ValueError: For operators other than $eq
+        """
+        for key, condition in where.items():
+            if isinstance(condition, dict):
+                if set(condition) != {'$eq'}:
+                    raise ValueError(f"Unsupported filter for numpy backend: {condition}")
+                condition = condition['$eq']
+            if metadata.get(key) != condition:
+                return False
+        return True
+    
+    def get_chunks(
+        self,
+        collection_name: str,
+        ids: List[str],
+        where: Dict[str, Any] = None,
+        include_embeddings: bool = False
+    ) -> List[Dict[str, Any]]:
+        collection = self._load(collection_name)
+        
+        rows = [collection.row_of.get(id_) for id_ in ids]
+        rows = [
+            row for row in rows
+            if row is not None and not (where and not self._matches(collection.metadatas[row], where))
+        ]
+        
+        chunks = []
+        for row, content in zip(rows, collection.documents(rows)):
+            chunk = {
+                'id': collection.ids[row],
+                'content': content,
+                'metadata': collection.metadatas[row]
+            }
+            if include_embeddings:
+                chunk['embedding'] = np.array(collection.vectors[row])
+            chunks.append(chunk)
+        
+        return chunks
+    
+    def memory_stats(self, collection_name: str) -> Dict[str, Any]:
+        collection = self._load(collection_name)
+        full_bytes = collection.full_bytes
+        search_bytes = collection.search_bytes
+        return {
+            'quantization': collection.quantizer.kind if collection.quantizer else "none",
+            'full_mb': round(full_bytes / 1e6, 2),
+            'search_mb': round(search_bytes / 1e6, 2),
+            'compression': round(full_bytes / search_bytes, 1) if search_bytes else 1.0
+        }
+    
+    def resident_bytes(self, collection_name: str) -> int:
+        # Document text stays on disk and is read per hit
+        collection = self._load(collection_name)
+        norms_bytes = collection.norms.nbytes if collection.norms is not None else 0
+        return collection.search_bytes + norms_bytes + collection.spans.nbytes
+    
+    def evaluate_recall(self, collection_name: str, k: int = 10, samples: int = 100) -> float:
+        """
+        Measure recall@k of quantized search against exact search
+        
+        Stored vectors, lightly perturbed, serve as queries.
+        
+        Args:
+            collection_name: Name of collection
+            k: Neighbours compared per query
+            samples: Number of queries
+        
+        Returns:
+            Mean fraction of the exact top-k that quantized search returns
+        """
+        collection = self._load(collection_name)
+        if collection.quantizer is None or collection.vectors is None:
+            return 1.0
+        
+        rng = np.random.default_rng(0)
+        rows = rng.choice(len(collection), min(samples, len(collection)), replace=False)
+        queries = np.array(collection.vectors[np.sort(rows)])
+        queries += rng.normal(0, queries.std() * 0.1, queries.shape).astype(np.float32)
+        
+        k = min(k, len(collection))
+        total = 0.0
+        for query in queries:
+            exact = collection.norms - 2 * (collection.vectors @ query)
+            truth = set(np.argpartition(exact, k - 1)[:k].tolist())
+            found = {collection.row_of[hit['id']] for hit in self.query(collection_name, query, k)}
+            total += len(truth & found) / k
+        
+        return total / len(queries)
+    
+    def unload(self, collection_name: str):
+        with self._lock:
+            self._loaded.pop(collection_name, None)
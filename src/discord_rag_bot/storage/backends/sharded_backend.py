@@ -0,0 +1,247 @@
+"""
+Split large KBs across shard collections behind one logical collection
+"""
+
+from typing import List, Dict, Any, Set, Optional
+from concurrent.futures import ThreadPoolExecutor
+import heapq
+import itertools
+import threading
+import zlib
+import numpy as np
+from discord_rag_bot.storage.backends.base import VectorBackend
+from discord_rag_bot.utils.config import Config
+
+
+SHARD_SEPARATOR = "__shard"
+
+
+def shard_name(collection_name: str, shard: int) -> str:
+    """Name of one shard of a logical collection"""
+    return f"{collection_name}{SHARD_SEPARATOR}{shard}"
+
+
+class ShardedBackend(VectorBackend):
+    """
+    Present sharded and unsharded collections of an inner backend uniformly
+    
+    Collections created with at least SHARD_MIN_CHUNKS expected chunks are split
+    into SHARD_COUNT shards; each chunk ID is routed to a fixed shard by hash.
+    Writes and queries fan out to the shards concurrently.
+    """
+    
+    def __init__(self, inner: VectorBackend, shard_count: int = None, min_chunks: int = None):
+        """
+        Initialize backend
+        
+        Args:
+            inner: Backend that stores the shard collections
+            shard_count: Shards per large KB (default from config)
+            min_chunks: Expected size at which a KB is sharded (default from config)
+        """
+        self.inner = inner
+        self.name = inner.name
+        self.shard_count = shard_count or Config.SHARD_COUNT
+        self.min_chunks = min_chunks or Config.SHARD_MIN_CHUNKS
+        self._executor = ThreadPoolExecutor(max_workers=max(1, self.shard_count), thread_name_prefix="shard")
+        self._shards: Dict[str, List[str]] = {}
+        self._lock = threading.Lock()
+    
+    @property
+    def location(self) -> str:
+        return self.inner.location
+    
+    def _resolve(self, collection_name: str) -> Optional[List[str]]:
+        """Physical collections behind a logical one, or None if it doesn't exist"""
+        with self._lock:
+            shards = self._shards.get(collection_name)
+        if shards is not None:
+            return shards
+        
+        if self.inner.has_collection(collection_name):
+            shards = [collection_name]
+        elif self.inner.has_collection(shard_name(collection_name, 0)):
+            count = self.inner.get_metadata(shard_name(collection_name, 0))['shard_count']
+            shards = [shard_name(collection_name, i) for i in range(count)]
+        else:
+            return None
+        
+        with self._lock:
+            self._shards[collection_name] = shards
+        return shards
+    
+    def _shards_of(self, collection_name: str) -> List[str]:
+        """
+        Physical collections behind a logical one
+        
+        Raises:
+            ValueError: If collection doesn't exist
+        """
+        shards = self._resolve(collection_name)
+        if shards is None:
+            raise ValueError(f"Collection '{collection_name}' not found")
+        return shards
+    
+    def _fan_out(self, function, items: list) -> list:
+        """Run function(item) for each shard item, concurrently when there are several"""
+        if len(items) == 1:
+            return [function(items[0])]
+        return list(self._executor.map(function, items))
+    
+    @staticmethod
+    def _route(ids: List[str], shard_count: int) -> Dict[int, List[int]]:
+        """Group positions in ids by the shard their ID hashes to"""
+        groups: Dict[int, List[int]] = {}
+        for i, id_ in enumerate(ids):
+            groups.setdefault(zlib.crc32(id_.encode('utf-8')) % shard_count, []).append(i)
+        return groups
+    
+    def create_collection(
+        self,
+        collection_name: str,
+        metadata: Dict[str, Any],
+        expected_chunks: int = None
+    ):
+        self.delete_collection(collection_name)
+        
+        if self.shard_count <= 1 or (expected_chunks or 0) < self.min_chunks:
+            self.inner.create_collection(collection_name, metadata, expected_chunks)
+            shards = [collection_name]
+        else:
+            shards = [shard_name(collection_name, i) for i in range(self.shard_count)]
+            shard_metadata = {**metadata, 'shard_of': collection_name, 'shard_count': self.shard_count}
+            for shard in shards:
+                self.inner.create_collection(shard, shard_metadata, expected_chunks // self.shard_count)
+            print(f"🧩 Sharded {collection_name} across {self.shard_count} collections (~{expected_chunks} chunks)")
+        
+        with self._lock:
+            self._shards[collection_name] = shards
+    
+    def delete_collection(self, collection_name: str):
+        shards = self._resolve(collection_name) or [collection_name]
+        for shard in shards:
+            self.inner.delete_collection(shard)
+        with self._lock:
+            self._shards.pop(collection_name, None)
+    
+    def list_collections(self) -> List[str]:
+        names = []
+        for name in self.inner.list_collections():
+            logical = name.split(SHARD_SEPARATOR)[0] if SHARD_SEPARATOR in name else name
+            if logical not in names:
+                names.append(logical)
+        return names
+    
+    def has_collection(self, collection_name: str) -> bool:
+        return self._resolve(collection_name) is not None
+    
+    def get_metadata(self, collection_name: str) -> Dict[str, Any]:
+        metadata = dict(self.inner.get_metadata(self._shards_of(collection_name)[0]))
+        metadata.pop('shard_of', None)
+        return metadata
+    
+    def count(self, collection_name: str) -> int:
+        return sum(self._fan_out(self.inner.count, self._shards_of(collection_name)))
+    
+    def existing_ids(self, collection_name: str, ids: List[str]) -> Set[str]:
+        shards = self._shards_of(collection_name)
+        if len(shards) == 1:
+            return self.inner.existing_ids(shards[0], ids)
+        
+        groups = self._route(ids, len(shards))
+        found = self._fan_out(
+            lambda index: self.inner.existing_ids(shards[index], [ids[i] for i in groups[index]]),
+            list(groups)
+        )
+        return set().union(*found)
+    
+    def upsert(
+        self,
+        collection_name: str,
+        ids: List[str],
+        embeddings: np.ndarray,
+        documents: List[str],
+        metadatas: List[Dict[str, Any]]
+    ):
+        shards = self._shards_of(collection_name)
+        if len(shards) == 1:
+            self.inner.upsert(shards[0], ids, embeddings, documents, metadatas)
+            return
+        
+        groups = self._route(ids, len(shards))
+        
+        def write(shard_index: int):
+            rows = groups[shard_index]
+            self.inner.upsert(
+                shards[shard_index],
+                [ids[i] for i in rows],
+                embeddings[rows],
+                [documents[i] for i in rows],
+                [metadatas[i] for i in rows]
+            )
+        
+        self._fan_out(write, list(groups))
+    
+    def query(
+        self,
+        collection_name: str,
+        query_embedding: np.ndarray,
+        n_results: int,
+        where: Dict[str, Any] = None,
+        include_embeddings: bool = False
+    ) -> List[Dict[str, Any]]:
+        shards = self._shards_of(collection_name)
+        per_shard = self._fan_out(
+            lambda shard: self.inner.query(shard, query_embedding, n_results, where, include_embeddings),
+            shards
+        )
+        if len(per_shard) == 1:
+            return per_shard[0]
+        
+        # Each shard's hits are nearest-first, so a heap merge yields the global top-k
+        return list(itertools.islice(
+            heapq.merge(*per_shard, key=lambda hit: hit['distance']),
+            n_results
+        ))
+    
+    def get_chunks(
+        self,
+        collection_name: str,
+        ids: List[str],
+        where: Dict[str, Any] = None,
+        include_embeddings: bool = False
+    ) -> List[Dict[str, Any]]:
+        shards = self._shards_of(collection_name)
+        if len(shards) == 1:
+            return self.inner.get_chunks(shards[0], ids, where, include_embeddings)
+        
+        groups = self._route(ids, len(shards))
+        per_shard = self._fan_out(
+            lambda index: self.inner.get_chunks(
+                shards[index], [ids[i] for i in groups[index]], where, include_embeddings
+            ),
+            list(groups)
+        )
+        return [chunk for chunks in per_shard for chunk in chunks]
+    
+    def memory_stats(self, collection_name: str) -> Dict[str, Any]:
+        shards = self._shards_of(collection_name)
+        per_shard = [self.inner.memory_stats(shard) for shard in shards]
+        if len(per_shard) == 1 or not per_shard[0]:
+            return per_shard[0]
+        
+        stats = dict(per_shard[0])
+        for key in ('full_mb', 'search_mb'):
+            if key in stats:
+                stats[key] = round(sum(shard[key] for shard in per_shard), 2)
+        if stats.get('search_mb'):
+            stats['compression'] = round(stats['full_mb'] / stats['search_mb'], 1)
+        stats['shards'] = len(shards)
+        return stats
+    
+    def resident_bytes(self, collection_name: str) -> int:
+        return sum(self.inner.resident_bytes(shard) for shard in self._shards_of(collection_name))
+    
+    def unload(self, collection_name: str):
+        for shard in self._resolve(collection_name) or []:
+            self.inner.unload(shard)
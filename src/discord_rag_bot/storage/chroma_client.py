@@ -0,0 +1,102 @@
+"""
+Process-wide ChromaDB client and collection-handle cache
+"""
+
+from typing import Dict, Any
+from collections import OrderedDict
+import threading
+import chromadb
+from discord_rag_bot.utils.config import Config
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> chromadb.ClientAPI:
+    """Get the shared persistent client, opening it on first use"""
+    global _client
+    with _client_lock:
+        if _client is None:
+            settings = chromadb.Settings()
+            if Config.RESIDENT_MEMORY_BUDGET_MB > 0:
+                # Let Chroma drop cold segments too, not just our handles
+                settings = chromadb.Settings(
+                    chroma_segment_cache_policy="LRU",
+                    chroma_memory_limit_bytes=Config.RESIDENT_MEMORY_BUDGET_MB * 1024 * 1024
+                )
+            _client = chromadb.PersistentClient(path=str(Config.CHROMADB_DIR), settings=settings)
+        return _client
+
+
+class CollectionCache:
+    """Bounded LRU cache of collection handles"""
+
+    def __init__(self, max_size: int = None):
+        """
+        Initialize cache
+
+        Args:
+            max_size: Maximum handles kept (default from config)
+        """
+        self.max_size = max_size or Config.CHROMA_COLLECTION_CACHE_SIZE
+        self._handles: "OrderedDict[str, chromadb.Collection]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, collection_name: str) -> chromadb.Collection:
+        """
+        Get a collection handle
+
+        Args:
+            collection_name: Name of collection
+
+        Returns:
+            ChromaDB collection
+
+        Raises:
+            ValueError: If collection doesn't exist
+        """
+        with self._lock:
+            collection = self._handles.get(collection_name)
+            if collection is not None:
+                self._handles.move_to_end(collection_name)
+                self.hits += 1
+                return collection
+
+        try:
+            collection = get_client().get_collection(collection_name)
+        except Exception as e:
+            raise ValueError(f"Collection '{collection_name}' not found: {e}")
+
+        self.put(collection)
+        with self._lock:
+            self.misses += 1
+        return collection
+
+    def put(self, collection: chromadb.Collection):
+        """Cache a handle, evicting the least recently used one if full"""
+        with self._lock:
+            self._handles[collection.name] = collection
+            self._handles.move_to_end(collection.name)
+            while len(self._handles) > self.max_size:
+                self._handles.popitem(last=False)
+
+    def invalidate(self, collection_name: str):
+        """Drop a cached handle (after delete or re-create)"""
+        with self._lock:
+            self._handles.pop(collection_name, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics"""
+        return {
+            'cached': len(self._handles),
+            'max_size': self.max_size,
+            'hits': self.hits,
+            'misses': self.misses
+        }
+
+
+# Shared by VectorStore and Retriever
+collection_cache = CollectionCache()
@@ -0,0 +1,343 @@
+"""
+Per-collection BM25 inverted index for exact-term matches
+"""
+
+from typing import List, Dict, Tuple, Optional
+from collections import Counter
+from pathlib import Path
+import re
+import threading
+import numpy as np
+from discord_rag_bot.utils.config import Config
+
+
+# Identifiers, error codes and dotted names stay whole; their parts are indexed too.
+# Unicode word characters, so accented and non-Latin text is indexed as well.
+TOKEN_PATTERN = re.compile(r"\w+(?:[.\-:]\w+)*")
+PART_PATTERN = re.compile(r"[^\W_]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Case-folded terms for indexing and querying
+    
+    'np.argpartition' yields 'np.argpartition', 'np' and 'argpartition', so a
+    pasted identifier matches exactly while its parts still match on their own.
+    """
+    tokens = []
+    for token in TOKEN_PATTERN.findall(text.casefold()):
+        tokens.append(token)
+        parts = PART_PATTERN.findall(token)
+        if len(parts) > 1 or (parts and parts[0] != token):
+            tokens.extend(parts)
+    return tokens
+
+
+def pack_strings(strings: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Concatenate strings into one UTF-8 buffer
+    
+    Returns:
+        (uint8 buffer, int64 offsets of length len(strings) + 1)
+    """
+    encoded = [string.encode('utf-8') for string in strings]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    np.cumsum([len(item) for item in encoded], out=offsets[1:])
+    return np.frombuffer(b''.join(encoded), dtype=np.uint8), offsets
+
+
+def unpack_strings(buffer: np.ndarray, offsets: np.ndarray) -> List[str]:
+    """Split a buffer built by pack_strings back into strings"""
+    data = buffer.tobytes()
+    bounds = offsets.tolist()
+    return [data[start:end].decode('utf-8') for start, end in zip(bounds, bounds[1:])]
+
+
+class BM25Index:
+    """
+    Inverted index in CSR form: one postings slice per term
+    
+    Terms and chunk IDs are stored as UTF-8 buffers plus offsets, so one long
+    token doesn't widen every vocabulary entry.
+    """
+    
+    K1 = 1.2
+    B = 0.75
+    
+    def __init__(
+        self,
+        id_buffer: np.ndarray,
+        id_offsets: np.ndarray,
+        doc_lengths: np.ndarray,
+        term_buffer: np.ndarray,
+        term_offsets: np.ndarray,
+        offsets: np.ndarray,
+        postings: np.ndarray,
+        frequencies: np.ndarray
+    ):
+        """
+        Initialize index
+        
+        Args:
+            id_buffer: UTF-8 chunk IDs, one per document (see pack_strings)
+            id_offsets: Start of each chunk ID in id_buffer
+            doc_lengths: Token count per document
+            term_buffer: UTF-8 vocabulary, sorted, aligned with offsets
+            term_offsets: Start of each term in term_buffer
+            offsets: Start of each term's postings (length vocabulary size + 1)
+            postings: Document numbers, grouped by term
+            frequencies: Term frequency per posting
+        """
+        self.id_buffer = id_buffer
+        self.id_offsets = id_offsets
+        self.doc_lengths = doc_lengths
+        self.term_buffer = term_buffer
+        self.term_offsets = term_offsets
+        self.offsets = offsets
+        self.postings = postings
+        self.frequencies = frequencies
+        self.terms = unpack_strings(term_buffer, term_offsets)
+        self.term_row = {term: row for row, term in enumerate(self.terms)}
+        
+        # Per-document length normalisation, fixed once the index is built
+        average = doc_lengths.mean() if len(doc_lengths) else 1.0
+        self.length_norm = (self.K1 * (1 - self.B + self.B * doc_lengths / max(average, 1e-9))).astype(np.float32)
+    
+    def __len__(self) -> int:
+        return len(self.doc_lengths)
+    
+    def chunk_id(self, doc: int) -> str:
+        """Chunk ID of a document number"""
+        start, end = self.id_offsets[doc], self.id_offsets[doc + 1]
+        return self.id_buffer[start:end].tobytes().decode('utf-8')
+    
+    def search(self, query: str, n_results: int) -> List[Tuple[str, float]]:
+        """
+        Score documents against a query with BM25
+        
+        Args:
+            query: Query text
+            n_results: Maximum results
+        
+        Returns:
+            (chunk ID, score) pairs, best first; documents sharing no term are omitted
+        """
+        rows = [self.term_row[term] for term in set(tokenize(query)) if term in self.term_row]
+        if not rows or n_results <= 0:
+            return []
+        
+        rows = np.array(rows)
+        starts, ends = self.offsets[rows], self.offsets[rows + 1]
+        docs = np.concatenate([self.postings[start:end] for start, end in zip(starts, ends)])
+        tfs = np.concatenate([self.frequencies[start:end] for start, end in zip(starts, ends)]).astype(np.float32)
+        
+        df = (ends - starts).astype(np.float32)
+        idf = np.log1p((len(self) - df + 0.5) / (df + 0.5))
+        weights = np.repeat(idf, ends - starts) * tfs * (self.K1 + 1) / (tfs + self.length_norm[docs])
+        scores = np.bincount(docs, weights=weights, minlength=len(self))
+        
+        matched = int(np.count_nonzero(scores))
+        k = min(n_results, matched)
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self.chunk_id(doc), float(scores[doc])) for doc in top]
+    
+    def merge(self, other: 'BM25Index') -> 'BM25Index':
+        """
+        Append another index's documents after this one's
+        
+        Postings stay grouped by term and sorted by document, without
+        unpacking either index into Python lists.
+        """
+        terms = sorted(set(self.terms) | set(other.terms))
+        row_of = {term: row for row, term in enumerate(terms)}
+        own_rows = np.array([row_of[term] for term in self.terms], dtype=np.int64)
+        other_rows = np.array([row_of[term] for term in other.terms], dtype=np.int64)
+        own_lengths = np.diff(self.offsets)
+        other_lengths = np.diff(other.offsets)
+        
+        # Each merged term's postings: this index's slice, then the other's
+        own_part = np.zeros(len(terms), dtype=np.int64)
+        own_part[own_rows] = own_lengths
+        lengths = own_part.copy()
+        lengths[other_rows] += other_lengths
+        offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        
+        postings = np.empty(int(offsets[-1]), dtype=np.int32)
+        frequencies = np.empty(int(offsets[-1]), dtype=np.uint16)
+        
+        own_dest = np.arange(len(self.postings)) + np.repeat(offsets[own_rows] - self.offsets[:-1], own_lengths)
+        postings[own_dest] = self.postings
+        frequencies[own_dest] = self.frequencies
+        
+        other_dest = np.arange(len(other.postings)) + np.repeat(
+            offsets[other_rows] + own_part[other_rows] - other.offsets[:-1], other_lengths
+        )
+        postings[other_dest] = other.postings + len(self)
+        frequencies[other_dest] = other.frequencies
+        
+        term_buffer, term_offsets = pack_strings(terms)
+        return BM25Index(
+            id_buffer=np.concatenate([self.id_buffer, other.id_buffer]),
+            id_offsets=np.concatenate([self.id_offsets, other.id_offsets[1:] + self.id_offsets[-1]]),
+            doc_lengths=np.concatenate([self.doc_lengths, other.doc_lengths]),
+            term_buffer=term_buffer,
+            term_offsets=term_offsets,
+            offsets=offsets,
+            postings=postings,
+            frequencies=frequencies
+        )
+    
+    def save(self, path: Path):
+        """Save to a compressed .npz file"""
+        np.savez_compressed(
+            path,
+            id_buffer=self.id_buffer,
+            id_offsets=self.id_offsets,
+            doc_lengths=self.doc_lengths,
+            term_buffer=self.term_buffer,
+            term_offsets=self.term_offsets,
+            offsets=self.offsets,
+            postings=self.postings,
+            frequencies=self.frequencies
+        )
+    
+    @classmethod
+    def load(cls, path: Path) -> 'BM25Index':
+        """Load an index saved with save()"""
+        with np.load(path) as data:
+            return cls(**{key: data[key] for key in data.files})
+
+
+class IndexBuilder:
+    """Accumulate one segment of documents for a BM25 index during ingestion"""
+    
+    def __init__(self):
+        """Initialize builder"""
+        self.ids: List[str] = []
+        self.doc_lengths: List[int] = []
+        self.postings: Dict[str, Tuple[List[int], List[int]]] = {}
+    
+    def __len__(self) -> int:
+        return len(self.ids)
+    
+    def add(self, ids: List[str], texts: List[str]):
+        """Index a batch of chunks"""
+        for id_, text in zip(ids, texts):
+            doc = len(self.ids)
+            tokens = tokenize(text)
+            self.ids.append(id_)
+            self.doc_lengths.append(len(tokens))
+            for term, tf in Counter(tokens).items():
+                docs, tfs = self.postings.setdefault(term, ([], []))
+                docs.append(doc)
+                tfs.append(min(tf, np.iinfo(np.uint16).max))
+    
+    def build(self) -> BM25Index:
+        """Pack postings into a BM25Index"""
+        terms = sorted(self.postings)
+        lengths = [len(self.postings[term][0]) for term in terms]
+        offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        
+        postings = np.fromiter(
+            (doc for term in terms for doc in self.postings[term][0]), dtype=np.int32, count=int(offsets[-1])
+        )
+        frequencies = np.fromiter(
+            (tf for term in terms for tf in self.postings[term][1]), dtype=np.uint16, count=int(offsets[-1])
+        )
+        
+        id_buffer, id_offsets = pack_strings(self.ids)
+        term_buffer, term_offsets = pack_strings(terms)
+        return BM25Index(
+            id_buffer=id_buffer,
+            id_offsets=id_offsets,
+            doc_lengths=np.array(self.doc_lengths, dtype=np.int32),
+            term_buffer=term_buffer,
+            term_offsets=term_offsets,
+            offsets=offsets,
+            postings=postings,
+            frequencies=frequencies
+        )
+
+
+class LexicalIndexStore:
+    """Persist BM25 indexes per collection and keep loaded ones in memory"""
+    
+    def __init__(self, directory: Path = None, segment_chunks: int = None):
+        """
+        Initialize index store
+        
+        Args:
+            directory: Directory for .npz files (default from config)
+            segment_chunks: Chunks held as Python postings before packing (default from config)
+        """
+        self.directory = directory or Config.LEXICAL_INDEX_DIR
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_chunks = segment_chunks or Config.LEXICAL_SEGMENT_CHUNKS
+        self._loaded: Dict[str, Optional[BM25Index]] = {}
+        self._builders: Dict[str, IndexBuilder] = {}
+        self._pending: Dict[str, Optional[BM25Index]] = {}
+        self._lock = threading.Lock()
+    
+    def _path(self, collection_name: str) -> Path:
+        return self.directory / f"{collection_name}.npz"
+    
+    def get(self, collection_name: str) -> Optional[BM25Index]:
+        """Get a collection's index, or None if it has none"""
+        with self._lock:
+            if collection_name not in self._loaded:
+                path = self._path(collection_name)
+                self._loaded[collection_name] = BM25Index.load(path) if path.exists() else None
+            return self._loaded[collection_name]
+    
+    def add(self, collection_name: str, ids: List[str], texts: List[str]):
+        """
+        Queue newly stored chunks for indexing (written by flush)
+        
+        Every segment_chunks chunks the queued postings are packed and merged
+        into the compact index, so ingestion memory stays bounded.
+        """
+        index = self.get(collection_name)
+        with self._lock:
+            if collection_name not in self._builders:
+                self._builders[collection_name] = IndexBuilder()
+                self._pending[collection_name] = index
+            builder = self._builders[collection_name]
+            builder.add(ids, texts)
+            if len(builder) >= self.segment_chunks:
+                self._pack(collection_name)
+    
+    def _pack(self, collection_name: str):
+        """Merge a collection's queued segment into its pending index (caller holds the lock)"""
+        segment = self._builders[collection_name].build()
+        pending = self._pending[collection_name]
+        self._pending[collection_name] = segment if pending is None else pending.merge(segment)
+        self._builders[collection_name] = IndexBuilder()
+    
+    def flush(self, collection_name: str):
+        """Build and persist a collection's index from the queued chunks"""
+        with self._lock:
+            if collection_name not in self._builders:
+                return
+            if len(self._builders[collection_name]):
+                self._pack(collection_name)
+            self._builders.pop(collection_name)
+            index = self._pending.pop(collection_name)
+            if index is None:
+                return
+            index.save(self._path(collection_name))
+            self._loaded[collection_name] = index
+    
+    def delete(self, collection_name: str):
+        """Forget a collection's index"""
+        with self._lock:
+            self._path(collection_name).unlink(missing_ok=True)
+            self._loaded.pop(collection_name, None)
+            self._builders.pop(collection_name, None)
+            self._pending.pop(collection_name, None)
+
+
+# Shared by VectorStore (ingestion) and Retriever (queries)
+lexical_index_store = LexicalIndexStore()
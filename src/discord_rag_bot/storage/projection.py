@@ -0,0 +1,112 @@
+"""
+Per-collection PCA projections for reduced-dimension storage
+"""
+
+from typing import Dict, Optional
+from pathlib import Path
+import threading
+import numpy as np
+from discord_rag_bot.utils.config import Config
+
+
+class PCAProjection:
+    """Linear projection onto the top principal components of a set of vectors"""
+
+    def __init__(self, mean: np.ndarray, components: np.ndarray):
+        """
+        Initialize projection
+
+        Args:
+            mean: Mean vector subtracted before projecting, shape (D,)
+            components: Principal axes, shape (d, D)
+        """
+        self.mean = np.ascontiguousarray(mean, dtype=np.float32)
+        self.components = np.ascontiguousarray(components, dtype=np.float32)
+
+    @classmethod
+    def fit(cls, vectors: np.ndarray, dimensions: int) -> 'PCAProjection':
+        """
+        Fit a projection with PCA
+
+        Args:
+            vectors: Training vectors, shape (n, D) with n >= dimensions
+            dimensions: Target dimensionality
+
+        Returns:
+            Fitted projection
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        mean = vectors.mean(axis=0)
+        _, _, vt = np.linalg.svd(vectors - mean, full_matrices=False)
+        return cls(mean, vt[:dimensions])
+
+    def transform(self, vectors: np.ndarray) -> np.ndarray:
+        """
+        Project vectors into the reduced space
+
+        Args:
+            vectors: Vectors of shape (n, D)
+
+        Returns:
+            Contiguous float32 matrix of shape (n, d)
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        return np.ascontiguousarray((vectors - self.mean) @ self.components.T)
+
+    @property
+    def dimensions(self) -> int:
+        """Reduced dimensionality"""
+        return self.components.shape[0]
+
+    def save(self, path: Path):
+        """Save mean and components to an .npz file"""
+        np.savez(path, mean=self.mean, components=self.components)
+
+    @classmethod
+    def load(cls, path: Path) -> 'PCAProjection':
+        """Load a projection saved with save()"""
+        with np.load(path) as data:
+            return cls(data['mean'], data['components'])
+
+
+class ProjectionStore:
+    """Persist projections per collection and keep loaded ones in memory"""
+
+    def __init__(self, directory: Path = None):
+        """
+        Initialize projection store
+
+        Args:
+            directory: Directory for .npz files (default from config)
+        """
+        self.directory = directory or Config.PROJECTIONS_DIR
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._loaded: Dict[str, Optional[PCAProjection]] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, collection_name: str) -> Path:
+        return self.directory / f"{collection_name}.npz"
+
+    def get(self, collection_name: str) -> Optional[PCAProjection]:
+        """Get a collection's projection, or None if it stores full vectors"""
+        with self._lock:
+            if collection_name not in self._loaded:
+                path = self._path(collection_name)
+                self._loaded[collection_name] = PCAProjection.load(path) if path.exists() else None
+            return self._loaded[collection_name]
+
+    def save(self, collection_name: str, projection: PCAProjection):
+        """Persist a collection's projection"""
+        with self._lock:
+            projection.save(self._path(collection_name))
+            self._loaded[collection_name] = projection
+
+    def delete(self, collection_name: str):
+        """Forget a collection's projection"""
+        with self._lock:
+            self._path(collection_name).unlink(missing_ok=True)
+            self._loaded.pop(collection_name, None)
+
+
+# Shared by VectorStore (ingestion) and Retriever (queries)
+projection_store = ProjectionStore()
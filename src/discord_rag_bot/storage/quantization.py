@@ -0,0 +1,204 @@
+"""
+Compressed vector codes for approximate search (int8 scalar and product quantization)
+"""
+
+from typing import Optional, Union
+from pathlib import Path
+import numpy as np
+
+
+# Rows decoded per step when scanning codes, bounding temporary memory
+SCAN_BLOCK_ROWS = 16384
+
+
+class ScalarQuantizer:
+    """Map each dimension's [min, max] range onto int8 with its own scale"""
+    
+    kind = "int8"
+    
+    def __init__(self, offset: np.ndarray, scale: np.ndarray):
+        """
+        Initialize quantizer
+        
+        Args:
+            offset: Per-dimension value that code -128 decodes to, shape (D,)
+            scale: Per-dimension step between adjacent codes, shape (D,)
+        """
+        self.offset = np.ascontiguousarray(offset, dtype=np.float32)
+        self.scale = np.ascontiguousarray(scale, dtype=np.float32)
+    
+    @classmethod
+    def fit(cls, vectors: np.ndarray) -> 'ScalarQuantizer':
+        """Fit per-dimension ranges to a sample of vectors"""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        low = vectors.min(axis=0)
+        high = vectors.max(axis=0)
+        scale = np.maximum(high - low, 1e-12) / 255
+        return cls(low, scale)
+    
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        """Encode vectors as int8 codes, clipping values outside the fitted range"""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        codes = np.empty(vectors.shape, dtype=np.int8)
+        for start in range(0, len(vectors), SCAN_BLOCK_ROWS):
+            block = np.rint((vectors[start:start + SCAN_BLOCK_ROWS] - self.offset) / self.scale) - 128
+            codes[start:start + len(block)] = np.clip(block, -128, 127)
+        return codes
+    
+    def decode(self, codes: np.ndarray) -> np.ndarray:
+        """Reconstruct approximate float32 vectors"""
+        return (codes.astype(np.float32) + 128) * self.scale + self.offset
+    
+    def distances(self, codes: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """Approximate squared L2 distance from query to every coded vector"""
+        query = np.asarray(query, dtype=np.float32)
+        out = np.empty(len(codes), dtype=np.float32)
+        for start in range(0, len(codes), SCAN_BLOCK_ROWS):
+            diff = self.decode(codes[start:start + SCAN_BLOCK_ROWS])
+            diff -= query
+            out[start:start + len(diff)] = np.einsum('ij,ij->i', diff, diff)
+        return out
+    
+    def save(self, path: Path):
+        """Save parameters to an .npz file"""
+        np.savez(path, kind=self.kind, offset=self.offset, scale=self.scale)
+
+
+class ProductQuantizer:
+    """Split vectors into sub-vectors and code each as its nearest of 256 centroids"""
+    
+    kind = "pq"
+    
+    CENTROIDS = 256
+    TRAIN_SAMPLE = 20000
+    TRAIN_ITERATIONS = 20
+    
+    def __init__(self, codebooks: np.ndarray):
+        """
+        Initialize quantizer
+        
+        Args:
+            codebooks: Centroids per subspace, shape (M, 256, D / M)
+        """
+        self.codebooks = np.ascontiguousarray(codebooks, dtype=np.float32)
+    
+    @property
+    def subvectors(self) -> int:
+        return self.codebooks.shape[0]
+    
+    @classmethod
+    def fit(cls, vectors: np.ndarray, subvectors: int, seed: int = 0) -> 'ProductQuantizer':
+        """
+        Train one k-means codebook per subspace
+        
+        Args:
+            vectors: Training vectors, shape (n, D) with n >= 256
+            subvectors: Requested number of subspaces; lowered to a divisor of D
+            seed: Random seed for sampling and initialization
+        
+        Returns:
+            Trained quantizer
+        """
+        vectors = np.asarray(vectors, dtype=np.float32)
+        dimension = vectors.shape[1]
+        subvectors = max(m for m in range(1, min(subvectors, dimension) + 1) if dimension % m == 0)
+        
+        rng = np.random.default_rng(seed)
+        if len(vectors) > cls.TRAIN_SAMPLE:
+            vectors = vectors[rng.choice(len(vectors), cls.TRAIN_SAMPLE, replace=False)]
+        
+        width = dimension // subvectors
+        codebooks = np.stack([
+            cls._kmeans(vectors[:, m * width:(m + 1) * width], rng)
+            for m in range(subvectors)
+        ])
+        return cls(codebooks)
+    
+    @classmethod
+    def _kmeans(cls, points: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+        """Lloyd's algorithm; empty clusters are reseeded from random points"""
+        points = np.ascontiguousarray(points)
+        centroids = points[rng.choice(len(points), cls.CENTROIDS, replace=False)].copy()
+        
+        for _ in range(cls.TRAIN_ITERATIONS):
+            assignment = cls._nearest(points, centroids)
+            counts = np.bincount(assignment, minlength=cls.CENTROIDS)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, points)
+            
+            empty = counts == 0
+            centroids[~empty] = sums[~empty] / counts[~empty, None]
+            centroids[empty] = points[rng.choice(len(points), int(empty.sum()), replace=False)]
+        
+        return centroids
+    
+    @staticmethod
+    def _nearest(points: np.ndarray, centroids: np.ndarray) -> np.ndarray:
+        """Index of the nearest centroid for each point"""
+        distances = (centroids * centroids).sum(axis=1) - 2 * (points @ centroids.T)
+        return distances.argmin(axis=1)
+    
+    def encode(self, vectors: np.ndarray) -> np.ndarray:
+        """Encode vectors as one uint8 centroid index per subspace"""
+        vectors = np.asarray(vectors, dtype=np.float32)
+        width = self.codebooks.shape[2]
+        codes = np.empty((len(vectors), self.subvectors), dtype=np.uint8)
+        for start in range(0, len(vectors), SCAN_BLOCK_ROWS):
+            block = vectors[start:start + SCAN_BLOCK_ROWS]
+            for m in range(self.subvectors):
+                codes[start:start + len(block), m] = self._nearest(
+                    block[:, m * width:(m + 1) * width], self.codebooks[m]
+                )
+        return codes
+    
+    def distances(self, codes: np.ndarray, query: np.ndarray) -> np.ndarray:
+        """Asymmetric distance: sum per-subspace lookups of query-to-centroid distances"""
+        query = np.asarray(query, dtype=np.float32).reshape(self.subvectors, 1, -1)
+        table = ((self.codebooks - query) ** 2).sum(axis=2)
+        
+        subspaces = np.arange(self.subvectors)
+        out = np.empty(len(codes), dtype=np.float32)
+        for start in range(0, len(codes), SCAN_BLOCK_ROWS):
+            block = codes[start:start + SCAN_BLOCK_ROWS]
+            out[start:start + len(block)] = table[subspaces, block].sum(axis=1)
+        return out
+    
+    def save(self, path: Path):
+        """Save codebooks to an .npz file"""
+        np.savez(path, kind=self.kind, codebooks=self.codebooks)
+
+
+Quantizer = Union[ScalarQuantizer, ProductQuantizer]
+
+
+def fit_quantizer(kind: str, vectors: np.ndarray, subvectors: int) -> Optional[Quantizer]:
+    """
+    Fit a quantizer by name
+    
+    Args:
+        kind: 'int8', 'pq' or 'none'
+        vectors: Training vectors
+        subvectors: Subspaces for product quantization
+    
+    Returns:
+        Fitted quantizer, or None for 'none'
+    
+    Raises:
+        ValueError: For unknown kinds
+    """
+    if kind == "none":
+        return None
+    if kind == ScalarQuantizer.kind:
+        return ScalarQuantizer.fit(vectors)
+    if kind == ProductQuantizer.kind:
+        return ProductQuantizer.fit(vectors, subvectors)
+    raise ValueError(f"Unknown quantization '{kind}' (expected none, int8 or pq)")
+
+
+def load_quantizer(path: Path) -> Quantizer:
+    """Load a quantizer saved with save()"""
+    with np.load(path) as data:
+        kind = str(data['kind'])
+        if kind == ScalarQuantizer.kind:
+            return ScalarQuantizer(data['offset'], data['scale'])
+        return ProductQuantizer(data['codebooks'])
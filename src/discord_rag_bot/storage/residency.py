@@ -0,0 +1,122 @@
+"""
+Memory-budgeted residency of loaded collections
+"""
+
+from typing import Dict, Any
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+import threading
+import time
+import numpy as np
+from discord_rag_bot.storage.backends.base import VectorBackend
+from discord_rag_bot.utils.config import Config
+
+
+class ResidencyManager:
+    """Track approximate memory per loaded KB and unload the least recently used"""
+    
+    def __init__(self, budget_mb: int = None):
+        """
+        Initialize manager
+        
+        Args:
+            budget_mb: Memory budget for loaded collections (default from config, 0 = unlimited)
+        """
+        budget_mb = Config.RESIDENT_MEMORY_BUDGET_MB if budget_mb is None else budget_mb
+        self.budget_bytes = budget_mb * 1024 * 1024
+        self._resident: "OrderedDict[str, tuple[VectorBackend, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.reloads = 0
+        self._reload_seconds = deque(maxlen=100)
+    
+    def register(self, backend: VectorBackend, collection_name: str):
+        """
+        Track a newly created collection as resident, without counting a reload
+        
+        Args:
+            backend: Backend holding the collection
+            collection_name: Name of collection
+        """
+        size = backend.resident_bytes(collection_name)
+        with self._lock:
+            self._resident[collection_name] = (backend, size)
+            self._resident.move_to_end(collection_name)
+        self._evict(keep=collection_name)
+    
+    @contextmanager
+    def track(self, backend: VectorBackend, collection_name: str, resizes: bool = False):
+        """
+        Wrap an operation that needs a collection loaded
+        
+        Marks the collection most recently used. If it was not resident, the
+        operation's duration is recorded as reload latency. The collection is
+        (re-)measured after cold operations and after writes, and colder
+        collections are unloaded until the budget is met.
+        
+        Args:
+            backend: Backend holding the collection
+            collection_name: Name of collection
+            resizes: The operation may change the collection's size (writes)
+        """
+        with self._lock:
+            cold = collection_name not in self._resident
+            if not cold:
+                self._resident.move_to_end(collection_name)
+        
+        start = time.perf_counter()
+        yield
+        
+        if cold or resizes:
+            seconds = time.perf_counter() - start
+            size = backend.resident_bytes(collection_name)
+            with self._lock:
+                self._resident[collection_name] = (backend, size)
+                self._resident.move_to_end(collection_name)
+                if cold:
+                    self.reloads += 1
+                    self._reload_seconds.append(seconds)
+            self._evict(keep=collection_name)
+    
+    def _evict(self, keep: str):
+        """Unload least recently used collections while over budget"""
+        if self.budget_bytes <= 0:
+            return
+        
+        while True:
+            with self._lock:
+                total = sum(size for _, size in self._resident.values())
+                if total <= self.budget_bytes or len(self._resident) <= 1:
+                    return
+                name = next(iter(self._resident))
+                if name == keep:
+                    return
+                backend, size = self._resident.pop(name)
+                self.evictions += 1
+            
+            backend.unload(name)
+            print(f"💤 Unloaded {name} ({size / 1e6:.1f} MB) to stay within residency budget")
+    
+    def forget(self, collection_name: str):
+        """Stop tracking a collection (after delete or re-create)"""
+        with self._lock:
+            self._resident.pop(collection_name, None)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get residency metrics"""
+        with self._lock:
+            resident_bytes = sum(size for _, size in self._resident.values())
+            reload_ms = [seconds * 1000 for seconds in self._reload_seconds]
+            return {
+                'resident': len(self._resident),
+                'resident_mb': round(resident_bytes / 1e6, 1),
+                'budget_mb': round(self.budget_bytes / 1e6, 1),
+                'evictions': self.evictions,
+                'reloads': self.reloads,
+                'reload_ms_p50': round(float(np.percentile(reload_ms, 50)), 1) if reload_ms else 0.0,
+                'reload_ms_p95': round(float(np.percentile(reload_ms, 95)), 1) if reload_ms else 0.0
+            }
+
+
+# Shared by VectorStore (writes) and Retriever (queries)
+residency_manager = ResidencyManager()
@@ -1,126 +1,236 @@
 """
-Vector store management with ChromaDB
+Vector store management over a pluggable vector backend
 """
 
 from typing import List, Dict, Any
-from pathlib import Path
-import chromadb
+import hashlib
+import numpy as np
 from discord_rag_bot.embeddings import EmbeddingService
+from discord_rag_bot.storage.backends import VectorBackend, get_backend
+from discord_rag_bot.storage.projection import PCAProjection, projection_store
+from discord_rag_bot.storage.residency import residency_manager
+from discord_rag_bot.storage.lexical_index import lexical_index_store
 from discord_rag_bot.utils.config import Config
 
 
+def chunk_id(chunk: Dict[str, Any]) -> str:
+    """
+    Derive a deterministic chunk ID from its source file, offset and text
+    
+    Args:
+        chunk: Chunk with 'content' and 'metadata'
+        
+    Returns:
+        Hex digest used as the vector store ID
+    """
+    metadata = chunk['metadata']
+    offset = metadata.get('chunk_offset', metadata.get('chunk_index', 0))
+    
+    digest = hashlib.sha256()
+    digest.update(f"{metadata.get('file_hash', '')}:{offset}:".encode('utf-8'))
+    digest.update(chunk['content'].encode('utf-8'))
+    return digest.hexdigest()[:32]
+
+
 class VectorStore:
-    """Manage vector storage with ChromaDB"""
+    """Manage knowledge base collections on the configured vector backend"""
     
-    def __init__(self):
-        """Initialize vector store"""
-        self.client = chromadb.PersistentClient(path=str(Config.CHROMADB_DIR))
-        print(f"💾 Vector store initialized at: {Config.CHROMADB_DIR}")
+    def __init__(self, backend: VectorBackend = None):
+        """
+        Initialize vector store
+        
+        Args:
+            backend: Vector backend (default from VECTOR_BACKEND)
+        """
+        self.backend = backend or get_backend()
+        print(f"💾 Vector store initialized at: {self.backend.location} ({self.backend.name})")
     
-    def create_collection(self, collection_name: str, metadata: Dict[str, Any] = None) -> chromadb.Collection:
+    def create_collection(
+        self,
+        collection_name: str,
+        metadata: Dict[str, Any] = None,
+        expected_chunks: int = None
+    ):
         """
-        Create a new collection
+        Create a new collection, replacing any existing one
         
         Args:
             collection_name: Name for the collection
             metadata: Optional metadata
-            
-        Returns:
-            ChromaDB collection
+            expected_chunks: Estimated final size, used to size the index
         """
-        # Delete if exists
-        try:
-            self.client.delete_collection(collection_name)
-        except:
-            pass
+        projection_store.delete(collection_name)
+        lexical_index_store.delete(collection_name)
+        residency_manager.forget(collection_name)
         
         # Ensure metadata is not empty (ChromaDB requirement)
         if not metadata:
             metadata = {"description": f"Knowledge base: {collection_name}"}
         
-        collection = self.client.create_collection(
-            name=collection_name,
-            metadata=metadata
-        )
-        
-        return collection
+        self.backend.create_collection(collection_name, metadata, expected_chunks)
+        residency_manager.register(self.backend, collection_name)
     
-    def get_collection(self, collection_name: str) -> chromadb.Collection:
+    def add_chunks(
+        self,
+        collection_name: str,
+        chunks: List[Dict[str, Any]],
+        embedding_service: EmbeddingService = None,
+        embeddings: np.ndarray = None
+    ) -> int:
         """
-        Get existing collection
+        Add chunks to a collection
+        
+        With precomputed embeddings the caller must call finish_ingestion()
+        after its last batch; otherwise this method does.
         
         Args:
             collection_name: Name of collection
+            chunks: List of chunks with 'content' and 'metadata'
+            embedding_service: Service to generate embeddings
+            embeddings: Precomputed float32 embeddings aligned with chunks
             
         Returns:
-            ChromaDB collection
+            Number of new chunks written (already stored content is skipped)
+        """
+        if not self.backend.has_collection(collection_name):
+            raise ValueError(f"Collection '{collection_name}' not found")
+        
+        if embeddings is not None:
+            return self._write(collection_name, chunks, embeddings)
+        
+        # Skip stored and repeated chunks before spending time embedding them
+        chunks = self.filter_new_chunks(collection_name, chunks)
+        texts = [chunk['content'] for chunk in chunks]
+        
+        # Embed and write one window at a time to keep memory flat
+        print(f"🔢 Generating embeddings for {len(texts)} chunks...")
+        written = 0
+        for offset, window in embedding_service.embed_batch_stream(texts):
+            written += self._write(collection_name, chunks[offset:offset + len(window)], window)
+        
+        if embedding_service.cache is not None:
+            stats = embedding_service.cache.get_stats()
+            print(f"🗃️ Embedding cache: {stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%} hit rate)")
+        
+        self.finish_ingestion(collection_name)
+        return written
+    
+    def finish_ingestion(self, collection_name: str):
+        """Persist per-collection indexes built up while chunks were written"""
+        lexical_index_store.flush(collection_name)
+    
+    def filter_new_chunks(self, collection_name: str, chunks: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Drop chunks that are already stored or repeated within the list
+        
+        Args:
+            collection_name: Name of collection
+            chunks: List of chunks with 'content' and 'metadata'
             
-        Raises:
-            ValueError: If collection doesn't exist
+        Returns:
+            Chunks that still need to be embedded and written
         """
-        try:
-            return self.client.get_collection(collection_name)
-        except Exception as e:
-            raise ValueError(f"Collection '{collection_name}' not found: {e}")
+        ids = [chunk_id(chunk) for chunk in chunks]
+        return [chunks[i] for i in self._new_indices(collection_name, ids)]
     
-    def add_chunks(
+    def _new_indices(self, collection_name: str, ids: List[str]) -> List[int]:
+        """Positions of IDs not yet in the collection, first occurrence only"""
+        if not ids:
+            return []
+        
+        seen = self.backend.existing_ids(collection_name, ids)
+        keep = []
+        for i, id_ in enumerate(ids):
+            if id_ not in seen:
+                seen.add(id_)
+                keep.append(i)
+        return keep
+    
+    def _write(
         self,
         collection_name: str,
         chunks: List[Dict[str, Any]],
-        embedding_service: EmbeddingService
+        embeddings: np.ndarray
     ) -> int:
+        """Upsert one batch of embedded chunks, skipping ones already stored"""
+        ids = [chunk_id(chunk) for chunk in chunks]
+        keep = self._new_indices(collection_name, ids)
+        if not keep:
+            return 0
+        
+        # Hand the backend the float32 matrix directly rather than nested lists
+        embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+        if len(keep) < len(ids):
+            embeddings = embeddings[keep]
+        embeddings = self._project(collection_name, embeddings, self.backend.count(collection_name))
+        
+        kept_ids = [ids[i] for i in keep]
+        documents = [chunks[i]['content'] for i in keep]
+        
+        # Upsert so concurrent writers of the same content cannot collide
+        with residency_manager.track(self.backend, collection_name, resizes=True):
+            self.backend.upsert(
+                collection_name,
+                ids=kept_ids,
+                embeddings=embeddings,
+                documents=documents,
+                metadatas=[chunks[i]['metadata'] for i in keep]
+            )
+        
+        # Keyword index for hybrid search, written by finish_ingestion()
+        lexical_index_store.add(collection_name, kept_ids, documents)
+        
+        return len(keep)
+    
+    def _project(self, collection_name: str, embeddings: np.ndarray, existing_count: int) -> np.ndarray:
         """
-        Add chunks to a collection
+        Reduce embeddings with the collection's PCA projection
+        
+        The projection is fitted on the first write to an empty collection when
+        PCA_DIMENSIONS is set; collections that started with full vectors keep them.
         
         Args:
             collection_name: Name of collection
-            chunks: List of chunks with 'content' and 'metadata'
-            embedding_service: Service to generate embeddings
+            embeddings: Full-dimension embeddings
+            existing_count: Chunks already in the collection
             
         Returns:
-            Number of chunks added
+            Embeddings to store
         """
-        collection = self.get_collection(collection_name)
-        
-        # Extract content
-        texts = [chunk['content'] for chunk in chunks]
-        metadatas = [chunk['metadata'] for chunk in chunks]
-        
-        # Generate embeddings
-        print(f"🔢 Generating embeddings for {len(texts)} chunks...")
-        embeddings = embedding_service.embed_batch(texts, show_progress=True)
+        projection = projection_store.get(collection_name)
+        if projection is not None:
+            return projection.transform(embeddings)
         
-        # Generate IDs (use existing count to avoid ID conflicts)
-        existing_count = collection.count()
-        ids = [f"chunk_{existing_count + i}" for i in range(len(texts))]
+        dimensions = Config.PCA_DIMENSIONS
+        min_chunks = max(dimensions, Config.PCA_MIN_CHUNKS)
+        if dimensions <= 0 or existing_count > 0 or len(embeddings) < min_chunks:
+            return embeddings
         
-        # Add to collection
-        collection.add(
-            embeddings=embeddings,
-            documents=texts,
-            metadatas=metadatas,
-            ids=ids
-        )
+        projection = PCAProjection.fit(embeddings, dimensions)
+        projection_store.save(collection_name, projection)
+        print(f"📉 Fitted PCA for {collection_name}: {embeddings.shape[1]} → {dimensions} dimensions")
         
-        return len(texts)
+        return projection.transform(embeddings)
     
     def list_collections(self) -> List[str]:
         """List all collection names"""
-        collections = self.client.list_collections()
-        return [col.name for col in collections]
+        return self.backend.list_collections()
     
     def delete_collection(self, collection_name: str):
         """Delete a collection"""
-        self.client.delete_collection(collection_name)
+        self.backend.delete_collection(collection_name)
+        projection_store.delete(collection_name)
+        lexical_index_store.delete(collection_name)
+        residency_manager.forget(collection_name)
     
     def get_collection_stats(self, collection_name: str) -> Dict[str, Any]:
         """Get statistics for a collection"""
         try:
-            collection = self.get_collection(collection_name)
             return {
                 'name': collection_name,
-                'count': collection.count(),
-                'metadata': collection.metadata
+                'count': self.backend.count(collection_name),
+                'metadata': self.backend.get_metadata(collection_name),
+                'memory': self.backend.memory_stats(collection_name)
             }
         except ValueError:
             return None
\ No newline at end of file
@@ -0,0 +1,72 @@
+"""
+Test BM25 tokenization and segmented index builds
+"""
+
+import random
+import tempfile
+from pathlib import Path
+from discord_rag_bot.storage.lexical_index import tokenize, IndexBuilder, LexicalIndexStore
+
+
+def test_tokenize_keeps_identifiers_and_parts():
+    assert tokenize("Call np.argpartition") == ["call", "np.argpartition", "np", "argpartition"]
+    assert tokenize("HTTP-404") == ["http-404", "http", "404"]
+    assert tokenize("snake_case") == ["snake_case", "snake", "case"]
+
+
+def test_tokenize_accented_and_non_latin():
+    assert tokenize("héllo Ünïcode") == ["héllo", "ünïcode"]
+    assert tokenize("Straße") == ["strasse"]
+    assert tokenize("Привет мир") == ["привет", "мир"]
+    assert tokenize("مرحبا بالعالم") == ["مرحبا", "بالعالم"]
+    assert tokenize("机器学习 入门") == ["机器学习", "入门"]
+
+
+def test_non_latin_terms_are_searchable():
+    builder = IndexBuilder()
+    builder.add(["ru", "fr", "zh"], ["Задание по нейросетям", "Le café est fermé", "机器学习 入门"])
+    index = builder.build()
+    
+    assert [id_ for id_, _ in index.search("нейросетям", 3)] == ["ru"]
+    assert [id_ for id_, _ in index.search("CAFÉ", 3)] == ["fr"]
+    assert [id_ for id_, _ in index.search("入门", 3)] == ["zh"]
+
+
+def test_segmented_build_matches_full_build():
+    rng = random.Random(0)
+    words = "alpha beta gamma delta np.argpartition héllo HTTP-404 привет x y z".split()
+    docs = [" ".join(rng.choice(words) for _ in range(rng.randint(1, 30))) for _ in range(3000)]
+    ids = [f"c{i}" for i in range(len(docs))]
+    
+    builder = IndexBuilder()
+    builder.add(ids, docs)
+    full = builder.build()
+    
+    # Two ingestions, each packed in several segments and merged onto the saved index
+    directory = Path(tempfile.mkdtemp())
+    first = LexicalIndexStore(directory, segment_chunks=700)
+    for start in range(0, 2000, 250):
+        first.add("kb", ids[start:start + 250], docs[start:start + 250])
+    first.flush("kb")
+    second = LexicalIndexStore(directory, segment_chunks=700)
+    for start in range(2000, len(docs), 333):
+        second.add("kb", ids[start:start + 333], docs[start:start + 333])
+    second.flush("kb")
+    
+    merged = LexicalIndexStore(directory).get("kb")
+    assert len(merged) == len(full)
+    for query in ["alpha np.argpartition", "HTTP-404 héllo", "привет", "z", "nothing"]:
+        expected = full.search(query, 10)
+        actual = merged.search(query, 10)
+        assert [round(score, 4) for _, score in actual] == [round(score, 4) for _, score in expected]
+
+
+if __name__ == "__main__":
+    print("\n🧪 TESTING LEXICAL INDEX\n")
+    test_tokenize_keeps_identifiers_and_parts()
+    test_tokenize_accented_and_non_latin()
+    print("   ✅ Tokenizer handles identifiers, accents and non-Latin scripts")
+    test_non_latin_terms_are_searchable()
+    print("   ✅ Non-Latin terms are searchable")
+    test_segmented_build_matches_full_build()
+    print("   ✅ Segmented builds match a full build\n")
@@ -0,0 +1,86 @@
+"""
+Test merging per-KB results in federated queries
+"""
+
+import asyncio
+from types import SimpleNamespace
+import numpy as np
+from discord_rag_bot.core import RAGEngine
+from discord_rag_bot.core.knowledge_base import ProcessingStatus
+from discord_rag_bot.retrieval.fusion import merge_ranked_lists
+from discord_rag_bot.utils.config import Config
+
+
+def chunk(id_: str, distance: float, **extra):
+    """Minimal retrieved chunk"""
+    return {'id': id_, 'content': id_, 'metadata': {}, 'distance': distance, 'score': 1 / (1 + distance), **extra}
+
+
+# KB "a" has close vector hits; KB "b" ranks a keyword-only exact-term hit first
+# even though its vector distance is far worse than anything in "a"
+PER_KB = {
+    'a': [chunk('a1', 0.10), chunk('a2', 0.12), chunk('a3', 0.15)],
+    'b': [chunk('b-bm25', 1.80, rrf_score=0.03), chunk('b2', 0.40)],
+}
+
+
+def make_engine(reranker=None):
+    """RAGEngine wired to canned per-KB results instead of real collections"""
+    engine = RAGEngine.__new__(RAGEngine)
+    engine.reranker = reranker
+    engine.kb_manager = SimpleNamespace(get_kb=lambda kb_id: SimpleNamespace(
+        kb_id=kb_id, name=kb_id.upper(), status=ProcessingStatus.SUCCESS, content_version="v1"
+    ))
+    
+    async def embed(query):
+        return np.zeros(4, dtype=np.float32)
+    
+    engine.query_batcher = SimpleNamespace(embed=embed)
+    engine._retrieve = lambda kb_id, query, top_k, query_embedding: [dict(c) for c in PER_KB[kb_id]]
+    engine.answer_generator = SimpleNamespace(generate=lambda query, chunks, cache_scope=None: "answer")
+    return engine
+
+
+def test_merge_keeps_each_list_order():
+    merged = merge_ranked_lists([[chunk('a1', 0.1), chunk('a2', 0.2)], [chunk('b1', 5.0), chunk('b2', 6.0)]], 4)
+    assert [c['id'] for c in merged] == ['a1', 'b1', 'a2', 'b2']
+
+
+def test_merge_respects_limit():
+    merged = merge_ranked_lists([PER_KB['a'], PER_KB['b']], 2)
+    assert [c['id'] for c in merged] == ['a1', 'b-bm25']
+
+
+def test_bm25_only_hit_survives_multi_kb_merge(monkeypatch):
+    monkeypatch.setattr(Config, 'ADAPTIVE_TOP_K', False)
+    result = asyncio.run(make_engine().query_knowledge_bases(['a', 'b'], "what is E1101?", top_k=3))
+    
+    ids = [c['id'] for c in result['chunks']]
+    # Merging by distance would have returned a1, a2, a3
+    assert ids == ['a1', 'b-bm25', 'a2']
+    assert result['chunks'][1]['kb_id'] == 'b'
+
+
+def test_multi_kb_merge_by_rerank_score(monkeypatch):
+    monkeypatch.setattr(Config, 'ADAPTIVE_TOP_K', False)
+    engine = make_engine(reranker=object())
+    scores = {'a1': 2.0, 'a2': -1.0, 'a3': -3.0, 'b-bm25': 5.0, 'b2': 0.5}
+    engine._retrieve = lambda kb_id, query, top_k, query_embedding: [
+        {**c, 'rerank_score': scores[c['id']]} for c in PER_KB[kb_id]
+    ]
+    
+    result = asyncio.run(engine.query_knowledge_bases(['a', 'b'], "what is E1101?", top_k=3))
+    assert [c['id'] for c in result['chunks']] == ['b-bm25', 'a1', 'b2']
+    assert {c['kb_id'] for c in result['chunks']} == {'a', 'b'}
+
+
+if __name__ == "__main__":
+    Config.ADAPTIVE_TOP_K = False
+    print("\n🧪 TESTING MULTI-KB MERGE\n")
+    test_merge_keeps_each_list_order()
+    test_merge_respects_limit()
+    print("   ✅ Ranked lists interleave by position")
+    test_bm25_only_hit_survives_multi_kb_merge(SimpleNamespace(setattr=setattr))
+    print("   ✅ Keyword-only hit kept across KBs")
+    test_multi_kb_merge_by_rerank_score(SimpleNamespace(setattr=setattr))
+    print("   ✅ Reranked results merged by cross-encoder score\n")
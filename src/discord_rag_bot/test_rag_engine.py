@@ -123,7 +123,7 @@ async def main():
     for question in test_questions:
         print(f"\n❓ Question: {question}")
         
-        result = engine.query_knowledge_base(kb.kb_id, question)
+        result = await engine.query_knowledge_base(kb.kb_id, question)
         
         print(f"📊 Retrieved {result['num_chunks_retrieved']} chunks")
         print(f"\n💬 Answer:")
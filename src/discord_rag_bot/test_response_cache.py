@@ -0,0 +1,112 @@
+"""
+Test the exact-match response cache
+"""
+
+import tempfile
+from pathlib import Path
+from discord_rag_bot.core.knowledge_base import KnowledgeBase
+from discord_rag_bot.generation import generator
+from discord_rag_bot.generation import AnswerGenerator, ResponseCache
+
+
+CHUNKS = [
+    {'id': "c1", 'content': "Assignments are due on Friday.", 'metadata': {'source': "syllabus.pdf"}},
+    {'id': "c2", 'content': "Late work loses 10% per day.", 'metadata': {'source': "syllabus.pdf"}},
+]
+
+
+def key(scope=("kb", "v1"), question="When is it due?", chunk_ids=("c1", "c2"), model="llama", temperature=0.7):
+    return ResponseCache.make_key(scope, question, list(chunk_ids), model, temperature)
+
+
+def test_key_ignores_case_and_whitespace_only():
+    assert key(question="  when IS it\n due? ") == key()
+    assert key(question="When was it due?") != key()
+
+
+def test_key_covers_everything_that_shapes_the_answer():
+    assert key(scope=("kb", "v2")) != key()
+    assert key(chunk_ids=("c2", "c1")) != key()
+    assert key(model="mistral") != key()
+    assert key(temperature=0.2) != key()
+
+
+def test_new_kb_content_misses():
+    kb = KnowledgeBase("kb", "Course", "1", "owner")
+    kb.add_file({'filename': "week1.pdf", 'file_hash': "aaa", 'chunks': 10})
+    cache = ResponseCache(max_entries=8)
+    cache.put(key(scope=(kb.kb_id, kb.content_version)), "Friday")
+    
+    kb.add_file({'filename': "week2.pdf", 'file_hash': "bbb", 'chunks': 5})
+    assert cache.get(key(scope=(kb.kb_id, kb.content_version))) is None
+
+
+def test_memory_tier_evicts_least_recently_used():
+    cache = ResponseCache(max_entries=2)
+    cache.put(b"a", "A")
+    cache.put(b"b", "B")
+    assert cache.get(b"a") == "A"
+    cache.put(b"c", "C")
+    
+    assert cache.get(b"b") is None
+    assert cache.get(b"a") == "A"
+    assert cache.get(b"c") == "C"
+
+
+def test_disk_tier_survives_restart_and_is_bounded():
+    directory = Path(tempfile.mkdtemp())
+    cache = ResponseCache(max_entries=8, cache_dir=directory, disk_max_entries=2)
+    cache.put(b"a", "A")
+    cache.put(b"b", "B")
+    cache.put(b"c", "C")
+    
+    reopened = ResponseCache(max_entries=8, cache_dir=directory, disk_max_entries=2)
+    assert reopened.get(b"a") is None
+    assert reopened.get(b"c") == "C"
+    assert reopened.get_stats()['disk_hits'] == 1
+    assert reopened.get_stats()['disk_entries'] == 2
+
+
+def test_generator_calls_llm_once_per_key(monkeypatch):
+    calls = []
+    
+    def fake_generate(model, prompt, options):
+        calls.append(prompt)
+        return {'response': f" answer {len(calls)} "}
+    
+    monkeypatch.setattr(generator.ollama, 'generate', fake_generate)
+    answers = AnswerGenerator(model_name="llama", response_cache=ResponseCache(max_entries=8))
+    
+    first = answers.generate("When is it due?", CHUNKS, cache_scope=("kb", "v1"))
+    again = answers.generate("when is it  due?", CHUNKS, cache_scope=("kb", "v1"))
+    updated = answers.generate("When is it due?", CHUNKS, cache_scope=("kb", "v2"))
+    uncached = answers.generate("When is it due?", CHUNKS)
+    
+    assert first == again == "answer 1"
+    assert updated == "answer 2"
+    assert uncached == "answer 3"
+    assert len(calls) == 3
+
+
+def test_errors_are_not_cached(monkeypatch):
+    def failing_generate(model, prompt, options):
+        raise ConnectionError("ollama not running")
+    
+    monkeypatch.setattr(generator.ollama, 'generate', failing_generate)
+    cache = ResponseCache(max_entries=8)
+    answers = AnswerGenerator(model_name="llama", response_cache=cache)
+    
+    assert answers.generate("When is it due?", CHUNKS, cache_scope=("kb", "v1")).startswith("❌")
+    assert cache.get_stats()['memory_entries'] == 0
+
+
+if __name__ == "__main__":
+    print("\n🧪 TESTING RESPONSE CACHE\n")
+    test_key_ignores_case_and_whitespace_only()
+    test_key_covers_everything_that_shapes_the_answer()
+    print("   ✅ Keys cover KB version, chunks, model and temperature")
+    test_new_kb_content_misses()
+    print("   ✅ New KB content misses the cache")
+    test_memory_tier_evicts_least_recently_used()
+    test_disk_tier_survives_restart_and_is_bounded()
+    print("   ✅ Memory and disk tiers evict least recently used answers\n")
@@ -0,0 +1,108 @@
+"""
+Test the per-KB semantic answer cache
+"""
+
+import numpy as np
+from discord_rag_bot.core import semantic_cache
+from discord_rag_bot.core.knowledge_base import KnowledgeBase
+from discord_rag_bot.core.semantic_cache import SemanticAnswerCache, key_terms
+
+
+QUESTION = np.array([1.0, 0.0, 0.0, 0.0], dtype=np.float32)
+PARAPHRASE = np.array([0.99, 0.1, 0.0, 0.0], dtype=np.float32)
+UNRELATED = np.array([0.0, 1.0, 0.0, 0.0], dtype=np.float32)
+
+
+def make_cache(**kwargs):
+    return SemanticAnswerCache(**{'threshold': 0.95, 'max_entries': 8, 'ttl_seconds': 3600, **kwargs})
+
+
+def test_similar_question_hits():
+    cache = make_cache()
+    cache.store("kb", "v1", "When is the assignment due?", QUESTION, {'answer': "Friday"})
+    
+    hit = cache.lookup("kb", "v1", "When's the assignment due", PARAPHRASE)
+    assert hit['answer'] == "Friday"
+    assert hit['cache_similarity'] > 0.95
+    assert cache.lookup("kb", "v1", "Who teaches the course?", UNRELATED) is None
+
+
+def test_content_version_change_invalidates():
+    kb = KnowledgeBase("kb", "Course", "1", "owner")
+    kb.add_file({'filename': "week1.pdf", 'file_hash': "aaa", 'chunks': 10})
+    before = kb.content_version
+    
+    cache = make_cache()
+    cache.store("kb", before, "When is the assignment due?", QUESTION, {'answer': "Friday"})
+    
+    kb.add_file({'filename': "week2.pdf", 'file_hash': "bbb", 'chunks': 5})
+    assert kb.content_version != before
+    assert cache.lookup("kb", kb.content_version, "When is the assignment due?", QUESTION) is None
+    
+    # The stale answer is gone, not just hidden behind the new version
+    assert cache.lookup("kb", before, "When is the assignment due?", QUESTION) is None
+    assert cache.get_stats()['entries'] == 0
+
+
+def test_versions_are_per_kb():
+    cache = make_cache()
+    cache.store("a", "v1", "When is the assignment due?", QUESTION, {'answer': "Friday"})
+    cache.store("b", "v1", "When is the assignment due?", QUESTION, {'answer': "Monday"})
+    
+    assert cache.lookup("b", "v2", "When is the assignment due?", QUESTION) is None
+    assert cache.lookup("a", "v1", "When is the assignment due?", QUESTION)['answer'] == "Friday"
+
+
+def test_invalidate_drops_kb():
+    cache = make_cache()
+    cache.store("kb", "v1", "When is the assignment due?", QUESTION, {'answer': "Friday"})
+    cache.invalidate("kb")
+    assert cache.lookup("kb", "v1", "When is the assignment due?", QUESTION) is None
+
+
+def test_different_numbers_never_share_an_answer():
+    assert key_terms("Assignment 2 deadline, room E1101?") == frozenset({"2", "e1101"})
+    
+    cache = make_cache()
+    cache.store("kb", "v1", "When is assignment 1 due?", QUESTION, {'answer': "Friday"})
+    assert cache.lookup("kb", "v1", "When is assignment 2 due?", QUESTION) is None
+    assert cache.lookup("kb", "v1", "when is ASSIGNMENT 1 due", PARAPHRASE)['answer'] == "Friday"
+
+
+def test_expired_answers_are_dropped(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(semantic_cache.time, 'time', lambda: now[0])
+    
+    cache = make_cache(ttl_seconds=60)
+    cache.store("kb", "v1", "When is the assignment due?", QUESTION, {'answer': "Friday"})
+    now[0] += 61
+    assert cache.lookup("kb", "v1", "When is the assignment due?", QUESTION) is None
+
+
+def test_full_kb_evicts_least_recently_used(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(semantic_cache.time, 'time', lambda: now[0])
+    
+    cache = make_cache(max_entries=2)
+    cache.store("kb", "v1", "first question", QUESTION, {'answer': "first"})
+    now[0] += 1
+    cache.store("kb", "v1", "second question", UNRELATED, {'answer': "second"})
+    now[0] += 1
+    assert cache.lookup("kb", "v1", "first question", QUESTION)['answer'] == "first"
+    
+    now[0] += 1
+    cache.store("kb", "v1", "third question", np.array([0, 0, 1, 0], dtype=np.float32), {'answer': "third"})
+    assert cache.lookup("kb", "v1", "second question", UNRELATED) is None
+    assert cache.lookup("kb", "v1", "first question", QUESTION)['answer'] == "first"
+
+
+if __name__ == "__main__":
+    print("\n🧪 TESTING SEMANTIC CACHE\n")
+    test_similar_question_hits()
+    print("   ✅ Paraphrased questions reuse answers")
+    test_content_version_change_invalidates()
+    test_versions_are_per_kb()
+    test_invalidate_drops_kb()
+    print("   ✅ New KB content invalidates cached answers")
+    test_different_numbers_never_share_an_answer()
+    print("   ✅ Questions with different numbers stay separate\n")
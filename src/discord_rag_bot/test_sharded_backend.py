@@ -0,0 +1,92 @@
+"""
+Test splitting large KBs across shard collections
+"""
+
+import tempfile
+from pathlib import Path
+import numpy as np
+from discord_rag_bot.storage.backends.numpy_backend import NumpyBackend
+from discord_rag_bot.storage.backends.sharded_backend import ShardedBackend, shard_name
+
+
+ROWS = 400
+VECTORS = np.random.default_rng(0).normal(size=(ROWS, 8)).astype(np.float32)
+IDS = [f"c{i}" for i in range(ROWS)]
+
+
+def make_backend(expected_chunks: int = ROWS):
+    """Sharded backend over NumPy collections, with one KB written in two batches"""
+    backend = ShardedBackend(NumpyBackend(Path(tempfile.mkdtemp())), shard_count=4, min_chunks=100)
+    backend.create_collection("kb", {"description": "test"}, expected_chunks=expected_chunks)
+    for start in (0, ROWS // 2):
+        rows = slice(start, start + ROWS // 2)
+        backend.upsert(
+            "kb",
+            ids=IDS[rows],
+            embeddings=VECTORS[rows],
+            documents=[f"chunk {i}" for i in range(start, start + ROWS // 2)],
+            metadatas=[{'index': i, 'even': i % 2 == 0} for i in range(start, start + ROWS // 2)]
+        )
+    return backend
+
+
+def test_large_kb_is_split_but_looks_like_one_collection():
+    backend = make_backend()
+    physical = backend.inner.list_collections()
+    assert sorted(physical) == sorted(shard_name("kb", i) for i in range(4))
+    assert all(backend.inner.count(shard) > 0 for shard in physical)
+    
+    assert backend.list_collections() == ["kb"]
+    assert backend.count("kb") == ROWS
+    assert 'shard_of' not in backend.get_metadata("kb")
+
+
+def test_small_kb_is_not_split():
+    backend = make_backend(expected_chunks=50)
+    assert backend.inner.list_collections() == ["kb"]
+    assert backend.count("kb") == ROWS
+
+
+def test_query_merges_shards_into_global_top_k():
+    backend = make_backend()
+    for row in (0, 17, 399):
+        distances = ((VECTORS - VECTORS[row]) ** 2).sum(axis=1)
+        expected = [f"c{i}" for i in np.argsort(distances)[:10]]
+        assert [hit['id'] for hit in backend.query("kb", VECTORS[row], 10)] == expected
+    
+    hits = backend.query("kb", VECTORS[3], 10, where={'even': True})
+    assert len(hits) == 10 and all(hit['metadata']['even'] for hit in hits)
+
+
+def test_ids_route_to_one_shard():
+    backend = make_backend()
+    assert backend.existing_ids("kb", ["c1", "c250", "missing"]) == {"c1", "c250"}
+    chunks = backend.get_chunks("kb", ["c1", "c250", "missing"])
+    assert sorted(chunk['content'] for chunk in chunks) == ["chunk 1", "chunk 250"]
+    
+    # Rewriting an ID replaces it in its shard rather than adding a copy elsewhere
+    backend.upsert("kb", ["c1"], VECTORS[[2]], ["rewritten"], [{}])
+    assert backend.count("kb") == ROWS
+    assert backend.get_chunks("kb", ["c1"])[0]['content'] == "rewritten"
+
+
+def test_shards_are_found_after_restart_and_deleted_together():
+    backend = make_backend()
+    reopened = ShardedBackend(NumpyBackend(Path(backend.location)), shard_count=4, min_chunks=100)
+    assert reopened.count("kb") == ROWS
+    
+    reopened.delete_collection("kb")
+    assert not reopened.has_collection("kb")
+    assert reopened.inner.list_collections() == []
+
+
+if __name__ == "__main__":
+    print("\n🧪 TESTING SHARDED BACKEND\n")
+    test_large_kb_is_split_but_looks_like_one_collection()
+    test_small_kb_is_not_split()
+    print("   ✅ Large KBs are sharded behind one logical name")
+    test_query_merges_shards_into_global_top_k()
+    print("   ✅ Shard results merge into the global top-k")
+    test_ids_route_to_one_shard()
+    test_shards_are_found_after_restart_and_deleted_together()
+    print("   ✅ IDs route consistently across restarts\n")
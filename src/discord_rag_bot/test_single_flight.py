@@ -0,0 +1,92 @@
+"""
+Test coalescing of concurrent identical questions
+"""
+
+import asyncio
+from discord_rag_bot.core import RAGEngine
+
+
+def make_engine():
+    """RAGEngine whose retrieval and generation is a counted, slow stand-in"""
+    engine = RAGEngine.__new__(RAGEngine)
+    engine._inflight = {}
+    engine.coalesced_queries = 0
+    engine.calls = []
+    
+    async def answer(kb_id, query, top_k=None):
+        engine.calls.append((kb_id, query, top_k))
+        await asyncio.sleep(0.05)
+        return {'kb_id': kb_id, 'query': query, 'answer': f"answer {len(engine.calls)}"}
+    
+    engine._query_knowledge_base = answer
+    return engine
+
+
+def test_identical_questions_share_one_answer():
+    engine = make_engine()
+    
+    async def ask():
+        return await asyncio.gather(
+            engine.query_knowledge_base("kb", "What is RAG?"),
+            engine.query_knowledge_base("kb", "  what is rag? "),
+            engine.query_knowledge_base("kb", "What is RAG?"),
+        )
+    
+    results = asyncio.run(ask())
+    assert len(engine.calls) == 1
+    assert engine.coalesced_queries == 2
+    assert {result['answer'] for result in results} == {"answer 1"}
+    
+    # Each caller still sees its own wording
+    assert [result['query'] for result in results] == ["What is RAG?", "  what is rag? ", "What is RAG?"]
+    assert engine._inflight == {}
+
+
+def test_different_kb_or_top_k_run_separately():
+    engine = make_engine()
+    
+    async def ask():
+        await asyncio.gather(
+            engine.query_knowledge_base("a", "What is RAG?"),
+            engine.query_knowledge_base("b", "What is RAG?"),
+            engine.query_knowledge_base("a", "What is RAG?", top_k=8),
+        )
+    
+    asyncio.run(ask())
+    assert len(engine.calls) == 3
+    assert engine.coalesced_queries == 0
+
+
+def test_finished_question_is_asked_again():
+    engine = make_engine()
+    
+    async def ask():
+        await engine.query_knowledge_base("kb", "What is RAG?")
+        return await engine.query_knowledge_base("kb", "What is RAG?")
+    
+    assert asyncio.run(ask())['answer'] == "answer 2"
+
+
+def test_cancelled_caller_does_not_cancel_the_others():
+    engine = make_engine()
+    
+    async def ask():
+        first = asyncio.create_task(engine.query_knowledge_base("kb", "What is RAG?"))
+        second = asyncio.create_task(engine.query_knowledge_base("kb", "What is RAG?"))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        return await second
+    
+    assert asyncio.run(ask())['answer'] == "answer 1"
+    assert len(engine.calls) == 1
+
+
+if __name__ == "__main__":
+    print("\n🧪 TESTING SINGLE-FLIGHT QUERIES\n")
+    test_identical_questions_share_one_answer()
+    print("   ✅ Concurrent identical questions share one answer")
+    test_different_kb_or_top_k_run_separately()
+    test_finished_question_is_asked_again()
+    print("   ✅ Only in-flight identical questions are coalesced")
+    test_cancelled_caller_does_not_cancel_the_others()
+    print("   ✅ A cancelled caller leaves the shared answer running\n")
@@ -1,5 +1,6 @@
 """Utility modules"""
 
 from .config import Config
+from .timing import StartupTimer
 
-__all__ = ['Config']
\ No newline at end of file
+__all__ = ['Config', 'StartupTimer']
\ No newline at end of file
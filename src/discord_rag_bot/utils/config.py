@@ -29,11 +29,101 @@ class Config:
     
     # Embedding Model
     EMBEDDING_MODEL = os.getenv("EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+    EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch")  # torch, onnx or onnx-int8
+    EMBEDDING_ONNX_QUANTIZATION = os.getenv("EMBEDDING_ONNX_QUANTIZATION", "avx2")
+    EMBEDDING_PARITY_CHECK = os.getenv("EMBEDDING_PARITY_CHECK", "true").lower() == "true"
+    EMBEDDING_PARITY_MIN_COSINE = float(os.getenv("EMBEDDING_PARITY_MIN_COSINE", "0.99"))
+    ONNX_MODELS_DIR = DATA_DIR / "onnx_models"
+    EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))
+    EMBEDDING_STREAM_WINDOW = int(os.getenv("EMBEDDING_STREAM_WINDOW", "1024"))
+    
+    # Embedding cache
+    EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+    EMBEDDING_CACHE_DIR = DATA_DIR / "embedding_cache"
+    EMBEDDING_CACHE_MAX_MB = int(os.getenv("EMBEDDING_CACHE_MAX_MB", "512"))
+    
+    # Query embedding micro-batching
+    QUERY_BATCH_MAX_SIZE = int(os.getenv("QUERY_BATCH_MAX_SIZE", "32"))
+    QUERY_BATCH_MAX_WAIT_MS = float(os.getenv("QUERY_BATCH_MAX_WAIT_MS", "5"))
+    
+    # Ingestion embedding workers (0 = encode in a thread of the bot process).
+    # Each worker loads its own copy of the model, so this is opt-in.
+    EMBEDDING_WORKERS = int(os.getenv("EMBEDDING_WORKERS", "0"))
+    EMBEDDING_WORKER_BATCH_SIZE = int(os.getenv("EMBEDDING_WORKER_BATCH_SIZE", "256"))
     
     # RAG Parameters
     CHUNK_SIZE = int(os.getenv("CHUNK_SIZE", "500"))
     CHUNK_OVERLAP = int(os.getenv("CHUNK_OVERLAP", "50"))
     TOP_K_RETRIEVAL = int(os.getenv("TOP_K_RETRIEVAL", "3"))
+    CHROMA_COLLECTION_CACHE_SIZE = int(os.getenv("CHROMA_COLLECTION_CACHE_SIZE", "64"))
+    CHROMA_WRITE_BATCH_SIZE = int(os.getenv("CHROMA_WRITE_BATCH_SIZE", "1024"))
+    INGESTION_QUEUE_SIZE = int(os.getenv("INGESTION_QUEUE_SIZE", "4"))
+    
+    # Optional per-KB PCA reduction of stored vectors (0 = store full vectors)
+    PCA_DIMENSIONS = int(os.getenv("PCA_DIMENSIONS", "0"))
+    PCA_MIN_CHUNKS = int(os.getenv("PCA_MIN_CHUNKS", "512"))
+    PROJECTIONS_DIR = DATA_DIR / "projections"
+    
+    # Vector index backend: chroma (HNSW) or numpy (memory-mapped exact search)
+    VECTOR_BACKEND = os.getenv("VECTOR_BACKEND", "chroma").lower()
+    NUMPY_INDEX_DIR = DATA_DIR / "numpy_index"
+    
+    # Hybrid retrieval: BM25 keyword hits fused with vector hits by reciprocal rank
+    HYBRID_SEARCH = os.getenv("HYBRID_SEARCH", "true").lower() == "true"
+    HYBRID_CANDIDATES = int(os.getenv("HYBRID_CANDIDATES", "20"))
+    RRF_K = int(os.getenv("RRF_K", "60"))
+    LEXICAL_INDEX_DIR = DATA_DIR / "lexical_index"
+    LEXICAL_SEGMENT_CHUNKS = int(os.getenv("LEXICAL_SEGMENT_CHUNKS", "20000"))
+    
+    # Optional cross-encoder reranking of over-fetched candidates
+    RERANK_ENABLED = os.getenv("RERANK_ENABLED", "false").lower() == "true"
+    RERANK_MODEL = os.getenv("RERANK_MODEL", "cross-encoder/ms-marco-MiniLM-L-6-v2")
+    RERANK_CANDIDATES = int(os.getenv("RERANK_CANDIDATES", "30"))
+    RERANK_BATCH_SIZE = int(os.getenv("RERANK_BATCH_SIZE", "32"))
+    RERANK_CACHE_SIZE = int(os.getenv("RERANK_CACHE_SIZE", "20000"))
+    
+    # Maximal marginal relevance: trade relevance (1.0) against diversity (0.0)
+    MMR_ENABLED = os.getenv("MMR_ENABLED", "true").lower() == "true"
+    MMR_LAMBDA = float(os.getenv("MMR_LAMBDA", "0.7"))
+    MMR_POOL_SIZE = int(os.getenv("MMR_POOL_SIZE", "20"))
+    
+    # Adaptive top-k: cut the ranked candidates where relevance falls off
+    ADAPTIVE_TOP_K = os.getenv("ADAPTIVE_TOP_K", "false").lower() == "true"
+    ADAPTIVE_TOP_K_MIN = int(os.getenv("ADAPTIVE_TOP_K_MIN", "1"))
+    ADAPTIVE_TOP_K_MAX = int(os.getenv("ADAPTIVE_TOP_K_MAX", "8"))
+    ADAPTIVE_SCORE_GAP = float(os.getenv("ADAPTIVE_SCORE_GAP", "0.2"))  # Drop between ranks, relative to the top
+    ADAPTIVE_MAX_DISTANCE = float(os.getenv("ADAPTIVE_MAX_DISTANCE", "0"))  # Squared L2; 0 disables
+    
+    # Semantic answer cache: reuse answers to near-identical questions per KB
+    SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "false").lower() == "true"
+    SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.95"))
+    SEMANTIC_CACHE_MAX_ENTRIES = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "256"))
+    SEMANTIC_CACHE_TTL_SECONDS = int(os.getenv("SEMANTIC_CACHE_TTL_SECONDS", "86400"))
+    
+    # Exact-match answer cache keyed by KB version, question, chunk IDs, model and temperature
+    RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+    RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "2048"))
+    RESPONSE_CACHE_DISK = os.getenv("RESPONSE_CACHE_DISK", "false").lower() == "true"
+    RESPONSE_CACHE_DIR = DATA_DIR / "response_cache"
+    RESPONSE_CACHE_DISK_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_DISK_MAX_ENTRIES", "50000"))
+    
+    # KBs expected to exceed SHARD_MIN_CHUNKS are split across SHARD_COUNT collections
+    SHARD_COUNT = int(os.getenv("SHARD_COUNT", "4"))
+    SHARD_MIN_CHUNKS = int(os.getenv("SHARD_MIN_CHUNKS", "200000"))
+    
+    # Memory budget for loaded KBs; least recently queried ones are unloaded (0 = unlimited)
+    RESIDENT_MEMORY_BUDGET_MB = int(os.getenv("RESIDENT_MEMORY_BUDGET_MB", "0"))
+    
+    # Chroma HNSW index parameters (0 = choose from the KB's expected size)
+    HNSW_M = int(os.getenv("HNSW_M", "0"))
+    HNSW_EF_CONSTRUCTION = int(os.getenv("HNSW_EF_CONSTRUCTION", "0"))
+    HNSW_EF_SEARCH = int(os.getenv("HNSW_EF_SEARCH", "0"))
+    
+    # Quantized search codes for the numpy backend: none, int8 or pq
+    VECTOR_QUANTIZATION = os.getenv("VECTOR_QUANTIZATION", "none").lower()
+    QUANTIZATION_MIN_CHUNKS = int(os.getenv("QUANTIZATION_MIN_CHUNKS", "1024"))
+    QUANTIZATION_RESCORE_FACTOR = int(os.getenv("QUANTIZATION_RESCORE_FACTOR", "10"))
+    PQ_SUBVECTORS = int(os.getenv("PQ_SUBVECTORS", "48"))
     
     # File limits
     MAX_FILE_SIZE_MB = int(os.getenv("MAX_FILE_SIZE_MB", "10"))
@@ -0,0 +1,38 @@
+"""
+Timing helpers for startup phases
+"""
+
+from typing import Dict
+from contextlib import contextmanager
+import time
+
+
+class StartupTimer:
+    """Record how long each startup phase takes"""
+    
+    def __init__(self):
+        """Initialize timer (wall clock starts now)"""
+        self.started = time.perf_counter()
+        self.phases: Dict[str, float] = {}
+    
+    @contextmanager
+    def phase(self, name: str):
+        """
+        Time a named phase
+        
+        Args:
+            name: Phase name shown in the report
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases[name] = self.phases.get(name, 0.0) + time.perf_counter() - start
+    
+    def report(self) -> str:
+        """Format the phase breakdown"""
+        lines = ["⏱️ Startup timing:"]
+        for name, seconds in self.phases.items():
+            lines.append(f"   • {name:<14} {seconds:6.2f}s")
+        lines.append(f"   • {'total (wall)':<14} {time.perf_counter() - self.started:6.2f}s")
+        return "\n".join(lines)